@@ -25,14 +25,19 @@ from __future__ import annotations
 
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Literal, TypedDict
 from urllib.parse import urlparse
 
 import click
 
+from review_env_probe import cached_github_auth
+
 
 PR_PATH_PARTS = 4
+DEFAULT_FETCH_JOBS = 4
 THREAD_STATUS = {True: "resolved", False: "open"}
 KNOWN_REPOS: dict[str, tuple[str, str | None]] = {
     "monolith": ("mono", None),
@@ -527,6 +532,11 @@ def ensure_unique_prs(pr_refs: list[PullRequestRef]) -> list[PullRequestRef]:
 
 
 def ensure_gh_authenticated() -> None:
+    # A recent preflight usually answered this already. Only a cached success
+    # is reused; anything else runs the one check itself rather than a full
+    # probe, which would fail outside a monolith and never be cached.
+    if cached_github_auth(Path.cwd()):
+        return
     run_command(["gh", "auth", "status"])
 
 
@@ -932,16 +942,28 @@ def fetch_pull_request_context(pr_ref: PullRequestRef) -> PullRequestReviewConte
     required=True,
     help="Repeat for each GitHub PR URL to fetch.",
 )
-def main(pr_urls: tuple[str, ...]) -> None:
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=DEFAULT_FETCH_JOBS,
+    show_default=True,
+    help="How many PRs to fetch from GitHub at once.",
+)
+def main(pr_urls: tuple[str, ...], jobs: int) -> None:
     """Fetch thread-aware PR review context for one PR or a linked PR set."""
 
     ensure_gh_authenticated()
     pr_refs = ensure_unique_prs([parse_pr_url(pr_url) for pr_url in pr_urls])
     pr_refs.sort(key=lambda pr_ref: ((pr_ref.alias or pr_ref.repo), pr_ref.pr_number))
 
+    # Each PR paginates independently, so a multi-repo batch fetches its PRs
+    # side by side; `map` keeps the output in the sorted batch order.
+    with ThreadPoolExecutor(max_workers=min(jobs, len(pr_refs))) as executor:
+        pull_requests = list(executor.map(fetch_pull_request_context, pr_refs))
+
     payload: FetchResult = {
         "source": "gh_graphql_review_threads",
-        "pull_requests": [fetch_pull_request_context(pr_ref) for pr_ref in pr_refs],
+        "pull_requests": pull_requests,
     }
     click.echo(json.dumps(payload, indent=2, sort_keys=True))
 
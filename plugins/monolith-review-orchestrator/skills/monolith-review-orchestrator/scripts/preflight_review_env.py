@@ -21,27 +21,43 @@ Mental model:
 
 from __future__ import annotations
 
+import json
 import shutil
-import subprocess
+import time
 from pathlib import Path
+from typing import TypedDict
 
 import click
 
-
-REQUIRED_TOOLS: tuple[str, ...] = ("git", "uv")
-MONOLITH_MARKERS: tuple[str, ...] = (
-    ".gitmodules",
-    ".submodule-branches",
-    "scripts/create_worktree.py",
-    "scripts/update_submodules.py",
-    "docs/github-first-branch-and-pr-conventions.md",
+from review_env_probe import (
+    PROBE_TTL_SECONDS,
+    REQUIRED_TOOLS,
+    EnvProbe,
+    begin_startup_profile,
+    elapsed_ms,
+    emit_startup_profile,
+    find_monolith_root,
+    probe_environment,
 )
 
 
-def run_command(
-    cmd: list[str], cwd: Path | None = None
-) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, check=False)
+DEFAULT_MIN_FREE_MB = 1024
+
+
+class CheckResult(TypedDict):
+    name: str
+    ok: bool
+    detail: str
+    duration_ms: float
+    cached: bool
+
+
+class PreflightReport(TypedDict):
+    ok: bool
+    monolith_root: str
+    sibling_parent: str
+    total_ms: float
+    checks: list[CheckResult]
 
 
 def resolve_root(candidate: Path) -> Path:
@@ -59,19 +75,129 @@ def discover_monolith_root(start: Path) -> Path:
     """
 
     current = resolve_root(start)
-    for candidate in (current, *current.parents):
-        if all((candidate / marker).exists() for marker in MONOLITH_MARKERS):
-            return candidate
-    return current
+    return find_monolith_root(current) or current
+
+
+def check_git_repository(root: Path) -> CheckResult:
+    started_at = time.perf_counter()
+    ok = (root / ".git").exists()
+    return {
+        "name": "git_repository",
+        "ok": ok,
+        "detail": str(root) if ok else f"{root} is not a git repository.",
+        "duration_ms": elapsed_ms(started_at),
+        "cached": False,
+    }
+
+
+def check_sibling_parent(sibling_dir: Path, min_free_mb: int) -> CheckResult:
+    """Check that deterministic review worktrees have somewhere to live."""
+
+    started_at = time.perf_counter()
+    if not sibling_dir.is_dir():
+        ok = False
+        detail = f"Sibling worktree parent is not usable: {sibling_dir}"
+    else:
+        free_mb = shutil.disk_usage(sibling_dir).free // (1024 * 1024)
+        ok = free_mb >= min_free_mb
+        detail = (
+            f"{sibling_dir} has {free_mb} MiB free"
+            if ok
+            else (
+                f"Sibling worktree parent {sibling_dir} has only {free_mb} MiB "
+                f"free; need at least {min_free_mb} MiB."
+            )
+        )
+    return {
+        "name": "sibling_parent",
+        "ok": ok,
+        "detail": detail,
+        "duration_ms": elapsed_ms(started_at),
+        "cached": False,
+    }
+
+
+def probe_checks(
+    probe: EnvProbe, cached: bool, require_github_auth: bool
+) -> list[CheckResult]:
+    """Turn one environment probe into per-check results.
+
+    A cached probe only ever holds passing answers, so those checks report
+    `cached: true` with zero cost instead of re-running.
+    """
+
+    def timing(step: str) -> float:
+        return 0.0 if cached else probe["timings_ms"].get(step, 0.0)
+
+    missing_markers = sorted(probe["missing_markers"])
+    missing_tools = [
+        tool_name
+        for tool_name in REQUIRED_TOOLS
+        if probe["tools"].get(tool_name) is None
+    ]
+    checks: list[CheckResult] = [
+        {
+            "name": "monolith_markers",
+            "ok": not missing_markers,
+            "detail": (
+                "Missing monolith markers: " + ", ".join(missing_markers)
+                if missing_markers
+                else "all markers present"
+            ),
+            "duration_ms": timing("markers"),
+            "cached": cached,
+        },
+        {
+            "name": "tools",
+            "ok": not missing_tools,
+            "detail": (
+                "Required tool not found on PATH: " + ", ".join(missing_tools)
+                if missing_tools
+                else ", ".join(REQUIRED_TOOLS)
+            ),
+            "duration_ms": timing("tools"),
+            "cached": cached,
+        },
+        {
+            "name": "worktree_list",
+            "ok": probe["worktrees"] is not None,
+            "detail": (
+                f"{len(probe['worktrees'])} registered worktrees"
+                if probe["worktrees"] is not None
+                else "`git worktree list --porcelain` failed."
+            ),
+            "duration_ms": timing("worktrees"),
+            "cached": cached,
+        },
+    ]
+    if require_github_auth:
+        if probe["tools"].get("gh") is None:
+            ok, detail = False, "GitHub auth required but `gh` is not installed."
+        elif probe["github_auth"] is not True:
+            ok, detail = False, "GitHub auth required but `gh auth status` failed."
+        else:
+            ok, detail = True, "GitHub auth available"
+        checks.append(
+            {
+                "name": "github_auth",
+                "ok": ok,
+                "detail": detail,
+                "duration_ms": timing("github_auth"),
+                "cached": cached,
+            }
+        )
+    return checks
 
 
 @click.command()
 @click.option(
     "--monolith-root",
     type=click.Path(path_type=Path, file_okay=False),
-    default=discover_monolith_root(Path.cwd()),
-    show_default=True,
-    help="Monolith root or one of its sibling review worktrees.",
+    default=None,
+    help=(
+        "Monolith root or one of its sibling review worktrees. Discovered from "
+        "the current directory when omitted."
+    ),
 )
 @click.option(
     "--require-github-auth/--no-require-github-auth",
@@ -79,44 +205,93 @@ def discover_monolith_root(start: Path) -> Path:
     show_default=True,
     help="Check for gh auth status when GitHub access is required.",
 )
-def main(monolith_root: Path, require_github_auth: bool) -> None:
+@click.option(
+    "--min-free-mb",
+    type=click.IntRange(min=0),
+    default=DEFAULT_MIN_FREE_MB,
+    show_default=True,
+    help="Minimum free disk space on the sibling worktree parent.",
+)
+@click.option(
+    "--max-check-age",
+    type=click.FloatRange(min=0),
+    default=PROBE_TTL_SECONDS,
+    show_default=True,
+    help=(
+        "Reuse probe checks that passed within this many seconds. "
+        "Use 0 to re-run every check."
+    ),
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    show_default=True,
+)
+@click.option(
+    "--profile-startup/--no-profile-startup",
+    default=False,
+    show_default=True,
+    help="Print startup and run timings as one JSON line on stderr.",
+)
+def main(
+    monolith_root: Path | None,
+    require_github_auth: bool,
+    min_free_mb: int,
+    max_check_age: float,
+    output_format: str,
+    profile_startup: bool,
+) -> None:
     """Verify that the local environment can run the monolith review harness."""
 
-    root = resolve_root(monolith_root)
-    errors: list[str] = []
-
-    if not (root / ".git").exists():
-        errors.append(f"{root} is not a git repository.")
+    profile = begin_startup_profile("preflight_review_env") if profile_startup else None
+    started_at = time.perf_counter()
+    # Discovery runs here rather than as the option default so `--help` and
+    # explicit roots never pay for the parent walk.
+    root = (
+        discover_monolith_root(Path.cwd())
+        if monolith_root is None
+        else resolve_root(monolith_root)
+    )
+    sibling_dir = root.parent
 
-    missing_markers = [
-        marker for marker in MONOLITH_MARKERS if not (root / marker).exists()
+    # The subprocess-backed checks (`git worktree list`, `gh auth status`) run
+    # concurrently inside the shared probe, and later helpers in the same
+    # setup phase reuse its cached answer. The remaining checks are single
+    # stat calls, cheaper inline than on a worker thread.
+    requested_at = time.time()
+    probe = probe_environment(
+        root,
+        include_github_auth=require_github_auth,
+        refresh=max_check_age == 0,
+        max_age_seconds=max_check_age,
+    )
+    checks = [
+        check_git_repository(root),
+        *probe_checks(probe, probe["probed_at"] < requested_at, require_github_auth),
+        check_sibling_parent(sibling_dir, min_free_mb),
     ]
-    if missing_markers:
-        errors.append("Missing monolith markers: " + ", ".join(sorted(missing_markers)))
-
-    for tool_name in REQUIRED_TOOLS:
-        if shutil.which(tool_name) is None:
-            errors.append(f"Required tool not found on PATH: {tool_name}")
+    report: PreflightReport = {
+        "ok": all(check["ok"] for check in checks),
+        "monolith_root": str(root),
+        "sibling_parent": str(sibling_dir),
+        "total_ms": elapsed_ms(started_at),
+        "checks": checks,
+    }
 
-    worktree_result = run_command(["git", "worktree", "list", "--porcelain"], cwd=root)
-    if worktree_result.returncode != 0:
-        errors.append("`git worktree list --porcelain` failed.")
-
-    sibling_dir = root.parent
-    if not sibling_dir.exists() or not sibling_dir.is_dir():
-        errors.append(f"Sibling worktree parent is not usable: {sibling_dir}")
-
-    if require_github_auth:
-        if shutil.which("gh") is None:
-            errors.append("GitHub auth required but `gh` is not installed.")
-        else:
-            auth_result = run_command(["gh", "auth", "status"], cwd=root)
-            if auth_result.returncode != 0:
-                errors.append("GitHub auth required but `gh auth status` failed.")
+    if profile is not None:
+        emit_startup_profile(profile)
+    if output_format == "json":
+        click.echo(json.dumps(report, indent=2, sort_keys=True))
+        if not report["ok"]:
+            raise SystemExit(1)
+        return
 
-    if errors:
-        for error in errors:
-            click.echo(f"ERROR: {error}", err=True)
+    if not report["ok"]:
+        for check in checks:
+            if not check["ok"]:
+                click.echo(f"ERROR: {check['detail']}", err=True)
         raise SystemExit(1)
 
     click.echo(f"OK: monolith root={root}")
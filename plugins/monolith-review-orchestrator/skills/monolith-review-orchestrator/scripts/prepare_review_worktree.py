@@ -15,6 +15,16 @@ Why this helper exists:
 Mental model:
     "Give me exactly one detached review worktree for this batch, or reuse the
     existing one if it is already registered and safe."
+
+With `--pool-dir`, a new batch leases a pre-warmed slot from
+`worktree_pool.py` instead of materializing a fresh worktree.
+
+With `--sparse`, a new worktree is created in cone-mode sparse checkout scoped
+to the batch submodules, configured always-include paths, and the directories
+the PR diffs actually touch. Git stores per-worktree sparse settings by turning
+on `extensions.worktreeConfig` in the shared monolith config, once. Pool slots
+are full checkouts shared between batches, so `--sparse` and `--pool-dir` are
+rejected together.
 """
 
 from __future__ import annotations
@@ -22,10 +32,47 @@ from __future__ import annotations
 import json
 import shutil
 import subprocess
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
 
 import click
 
+from review_env_probe import (
+    begin_startup_profile,
+    emit_startup_profile,
+    invalidate_probes,
+    probe_environment,
+)
+from review_registry import mark_worktree_prepared, update_registry_best_effort
+from worktree_pool import (
+    DEFAULT_SUBMODULE_JOBS,
+    absolute_link_path,
+    initialize_submodules,
+    is_pool_slot,
+    lease_pool_slot,
+    reset_slot,
+    resolve_start_commit,
+)
+
+
+SUPERPROJECT = "."
+# Preflight accepts a sibling review worktree as the monolith root, so sparse
+# worktrees must keep the directories that hold the monolith markers.
+DEFAULT_SPARSE_INCLUDES: tuple[str, ...] = ("docs", "scripts")
+FRESH_WORKTREE_ACTIONS: frozenset[str] = frozenset({"created", "recreated_dirty"})
+# `--ignore-submodules=dirty` keeps gitlink commit drift visible but stops git
+# from recursing into every initialized submodule's working tree. The untracked
+# cache is opt-in per invocation so repeat probes skip unchanged directories;
+# a configured `core.fsmonitor` is honored as-is.
+STATUS_PROBE_CMD: tuple[str, ...] = (
+    "git",
+    "-c",
+    "core.untrackedCache=true",
+    "status",
+    "--porcelain",
+    "--ignore-submodules=dirty",
+)
+
 
 def run_command(
     cmd: list[str], cwd: Path | None = None
@@ -33,30 +80,135 @@ def run_command(
     return subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, check=False)
 
 
-def list_worktrees(monolith_root: Path) -> set[Path]:
-    """Return the set of paths Git currently recognizes as worktrees."""
+def list_worktrees(monolith_root: Path, refresh: bool = False) -> set[Path]:
+    """Return the set of paths Git currently recognizes as worktrees.
 
-    result = run_command(["git", "worktree", "list", "--porcelain"], cwd=monolith_root)
-    if result.returncode != 0:
-        raise click.ClickException(result.stderr.strip() or "Failed to list worktrees.")
-    paths: set[Path] = set()
-    for line in result.stdout.splitlines():
-        if line.startswith("worktree "):
-            paths.add(Path(line.removeprefix("worktree ").strip()).resolve())
-    return paths
+    The answer comes from the shared environment probe, so a preflight run a
+    moment earlier usually saves the subprocess. A cached list can only be
+    stale in the "missing a new worktree" direction once helpers invalidate
+    after mutations, so callers refresh before treating absence as an error.
+    """
 
+    probe = probe_environment(monolith_root, refresh=refresh)
+    if probe["worktrees"] is None:
+        raise click.ClickException(
+            probe["worktree_error"] or "Failed to list worktrees."
+        )
+    return {Path(path) for path in probe["worktrees"]}
 
-def create_worktree(monolith_root: Path, target: Path, start_ref: str) -> None:
-    """Create one detached worktree at the target path."""
 
-    create_result = run_command(
-        ["git", "worktree", "add", "--detach", str(target), start_ref],
-        cwd=monolith_root,
-    )
+def create_worktree(
+    monolith_root: Path,
+    target: Path,
+    start_ref: str,
+    sparse_cone: list[str] | None = None,
+) -> None:
+    """Create one detached worktree at the target path.
+
+    With a sparse cone, the worktree is added without a checkout first so the
+    files outside the cone are never written to disk at all.
+    """
+
+    create_cmd = ["git", "worktree", "add", "--detach", str(target), start_ref]
+    if sparse_cone is not None:
+        create_cmd.insert(3, "--no-checkout")
+    create_result = run_command(create_cmd, cwd=monolith_root)
     if create_result.returncode != 0:
         raise click.ClickException(
             create_result.stderr.strip() or f"Failed to create {target}"
         )
+    invalidate_probes()
+    if sparse_cone is None:
+        return
+    apply_sparse_cone(target, sparse_cone, widen_only=False)
+    checkout_result = run_command(
+        ["git", "checkout", "--detach", "HEAD"], cwd=target
+    )
+    if checkout_result.returncode != 0:
+        raise click.ClickException(
+            checkout_result.stderr.strip()
+            or f"Failed to populate sparse worktree {target}"
+        )
+
+
+def split_repo_scoped(raw: str, submodule_paths: tuple[str, ...]) -> tuple[str, str]:
+    """Split `[submodule:]value` into the owning repo path and the value.
+
+    Git refs and cone directories cannot start with a batch submodule path
+    followed by `:`, so the prefix is unambiguous.
+    """
+
+    prefix, separator, value = raw.partition(":")
+    if not separator:
+        return SUPERPROJECT, raw
+    if prefix not in submodule_paths:
+        known = ", ".join(submodule_paths) or "none"
+        raise click.ClickException(
+            f"`{raw}` names submodule `{prefix}`, which is not in this batch. "
+            f"Batch submodules: {known}."
+        )
+    return prefix, value
+
+
+def changed_directories(repo_dir: Path, diff_range: str) -> list[str]:
+    """Return the parent directories of every path changed in `diff_range`."""
+
+    result = run_command(["git", "diff", "--name-only", diff_range], cwd=repo_dir)
+    if result.returncode != 0:
+        raise click.ClickException(
+            result.stderr.strip()
+            or f"Failed to diff `{diff_range}` in {repo_dir} for the sparse cone."
+        )
+    directories = {
+        str(PurePosixPath(line.strip()).parent)
+        for line in result.stdout.splitlines()
+        if line.strip()
+    }
+    # Root-level files are always part of a cone-mode checkout.
+    directories.discard(".")
+    return sorted(directories)
+
+
+def sparse_checkout_enabled(repo_dir: Path) -> bool:
+    result = run_command(
+        ["git", "config", "--get", "core.sparseCheckout"], cwd=repo_dir
+    )
+    return result.returncode == 0 and result.stdout.strip() == "true"
+
+
+def effective_sparse_cone(repo_dir: Path) -> list[str]:
+    """Return the cone git actually holds, including earlier widenings."""
+
+    result = run_command(["git", "sparse-checkout", "list"], cwd=repo_dir)
+    if result.returncode != 0:
+        raise click.ClickException(
+            result.stderr.strip() or f"Failed to read sparse checkout in {repo_dir}"
+        )
+    return sorted(line.strip() for line in result.stdout.splitlines() if line.strip())
+
+
+def apply_sparse_cone(repo_dir: Path, cone: list[str], widen_only: bool) -> bool:
+    """Set or widen the cone for one repo and return whether it is sparse.
+
+    `widen_only` protects reused checkouts: an existing sparse checkout only
+    ever grows, and a full checkout is never narrowed under someone's feet.
+    """
+
+    enabled = sparse_checkout_enabled(repo_dir)
+    if widen_only and not enabled:
+        return False
+    if enabled:
+        if not cone:
+            return True
+        cmd = ["git", "sparse-checkout", "add", *cone]
+    else:
+        cmd = ["git", "sparse-checkout", "set", "--cone", *cone]
+    result = run_command(cmd, cwd=repo_dir)
+    if result.returncode != 0:
+        raise click.ClickException(
+            result.stderr.strip() or f"Failed to update sparse checkout in {repo_dir}"
+        )
+    return True
 
 
 def remove_worktree(monolith_root: Path, target: Path) -> None:
@@ -78,22 +230,51 @@ def remove_worktree(monolith_root: Path, target: Path) -> None:
         raise click.ClickException(
             remove_result.stderr.strip() or f"Failed to remove dirty worktree {target}"
         )
+    invalidate_probes()
     if target.exists():
         shutil.rmtree(target)
 
 
-def worktree_is_dirty(worktree_path: Path) -> bool:
-    """Return whether the target worktree currently has local changes."""
+def repo_is_dirty(repo_dir: Path) -> bool:
+    """Return whether one repo (monolith worktree or submodule) has changes."""
 
-    result = run_command(["git", "status", "--short"], cwd=worktree_path)
+    result = run_command(list(STATUS_PROBE_CMD), cwd=repo_dir)
     if result.returncode != 0:
         raise click.ClickException(
-            result.stderr.strip()
-            or f"Failed to inspect worktree status for {worktree_path}"
+            result.stderr.strip() or f"Failed to inspect worktree status for {repo_dir}"
         )
     return bool(result.stdout.strip())
 
 
+def submodules_are_dirty(worktree_path: Path, submodule_paths: tuple[str, ...]) -> bool:
+    """Probe only the given, already-initialized submodules, concurrently."""
+
+    initialized = [
+        worktree_path / path
+        for path in submodule_paths
+        if (worktree_path / path / ".git").exists()
+    ]
+    if not initialized:
+        return False
+    with ThreadPoolExecutor(max_workers=len(initialized)) as executor:
+        return any(executor.map(repo_is_dirty, initialized))
+
+
+def worktree_is_dirty(
+    worktree_path: Path, submodule_paths: tuple[str, ...] = ()
+) -> bool:
+    """Return whether the worktree or one of its batch submodules has changes.
+
+    Submodules outside the batch are deliberately not scanned: review prep
+    never touches them, and recursing into all of them is what made a plain
+    `git status` cost seconds on the monolith.
+    """
+
+    if repo_is_dirty(worktree_path):
+        return True
+    return submodules_are_dirty(worktree_path, submodule_paths)
+
+
 @click.command()
 @click.option(
     "--monolith-root", type=click.Path(path_type=Path, file_okay=False), required=True
@@ -114,6 +295,65 @@ def worktree_is_dirty(worktree_path: Path) -> bool:
 @click.option(
     "--repair-dirty-reuse/--no-repair-dirty-reuse", default=False, show_default=True
 )
+@click.option(
+    "--pool-dir",
+    type=click.Path(path_type=Path, file_okay=False),
+    default=None,
+    help=(
+        "Optional worktree pool managed by worktree_pool.py. New batches lease "
+        "a pre-warmed slot instead of running `git worktree add`."
+    ),
+)
+@click.option(
+    "--submodule-jobs",
+    type=click.IntRange(min=1),
+    default=DEFAULT_SUBMODULE_JOBS,
+    show_default=True,
+    help="How many review-batch submodules to initialize concurrently.",
+)
+@click.option(
+    "--reference-monolith-objects/--no-reference-monolith-objects",
+    default=True,
+    show_default=True,
+    help=(
+        "Borrow objects from the monolith root's initialized submodules via "
+        "alternates instead of fetching them again."
+    ),
+)
+@click.option(
+    "--sparse/--no-sparse",
+    default=False,
+    show_default=True,
+    help=(
+        "Create new worktrees in cone-mode sparse checkout. Reused sparse "
+        "worktrees only ever widen. Sets `extensions.worktreeConfig` in the "
+        "monolith config. Not supported with --pool-dir."
+    ),
+)
+@click.option(
+    "--sparse-include",
+    "sparse_includes",
+    multiple=True,
+    help=(
+        "Directory to always keep in the cone, as `dir` or `submodule:dir`. "
+        "`docs` and `scripts` are always included in the monolith cone."
+    ),
+)
+@click.option(
+    "--sparse-diff",
+    "sparse_diffs",
+    multiple=True,
+    help=(
+        "PR diff range whose touched directories join the cone, as "
+        "`base...head` or `submodule:base...head`."
+    ),
+)
+@click.option(
+    "--profile-startup/--no-profile-startup",
+    default=False,
+    show_default=True,
+    help="Print startup and run timings as one JSON line on stderr.",
+)
 def main(
     monolith_root: Path,
     worktree_path: Path,
@@ -121,27 +361,89 @@ def main(
     submodule_paths: tuple[str, ...],
     allow_dirty_reuse: bool,
     repair_dirty_reuse: bool,
+    pool_dir: Path | None,
+    submodule_jobs: int,
+    reference_monolith_objects: bool,
+    sparse: bool,
+    sparse_includes: tuple[str, ...],
+    sparse_diffs: tuple[str, ...],
+    profile_startup: bool,
 ) -> None:
     """Create or reuse one deterministic monolith review worktree."""
 
+    if sparse and pool_dir is not None:
+        # Slots are full checkouts reused across batches; narrowing one would
+        # leak the cone into the next lease.
+        raise click.UsageError("--sparse cannot be combined with --pool-dir.")
+    profile = (
+        begin_startup_profile("prepare_review_worktree") if profile_startup else None
+    )
     root = monolith_root.expanduser().resolve()
-    target = worktree_path.expanduser().resolve()
-    registered_worktrees = list_worktrees(root)
+    requested = absolute_link_path(worktree_path)
     unique_submodule_paths = tuple(dict.fromkeys(submodule_paths))
 
+    # Cones are keyed by repo path: the monolith itself or one batch submodule.
+    sparse_cones: dict[str, set[str]] = {}
+    submodule_diffs: list[tuple[str, str]] = []
+    if sparse:
+        sparse_cones[SUPERPROJECT] = {
+            *DEFAULT_SPARSE_INCLUDES,
+            *unique_submodule_paths,
+        }
+        for raw in sparse_includes:
+            repo_path, directory = split_repo_scoped(raw, unique_submodule_paths)
+            sparse_cones.setdefault(repo_path, set()).add(directory.strip("/"))
+        for raw in sparse_diffs:
+            repo_path, diff_range = split_repo_scoped(raw, unique_submodule_paths)
+            if repo_path == SUPERPROJECT:
+                sparse_cones[SUPERPROJECT].update(changed_directories(root, diff_range))
+            else:
+                # Submodule refs only exist once the submodule is initialized in
+                # the target worktree, so these diffs run after init below.
+                submodule_diffs.append((repo_path, diff_range))
+    superproject_cone = (
+        sorted(sparse_cones[SUPERPROJECT]) if SUPERPROJECT in sparse_cones else None
+    )
+
+    pool_slot: Path | None = None
+    if pool_dir is not None and not requested.exists() and not requested.is_symlink():
+        pool_slot = lease_pool_slot(
+            pool_dir, requested, resolve_start_commit(root, start_ref)
+        )
+
+    # Pooled batch paths are symlinks to their slot. Git only knows the slot
+    # path, so every git-facing check below works on the resolved target.
+    target = requested.resolve()
+    registered_worktrees = list_worktrees(root)
+
     action: str
-    if target.exists():
+    if pool_slot is not None:
+        action = "leased"
+        # The reset should leave the slot clean; probe anyway so a submodule
+        # that could not move to its new gitlink is reported, not hidden.
+        dirty = worktree_is_dirty(target, unique_submodule_paths)
+    elif target.exists():
+        if target not in registered_worktrees:
+            registered_worktrees = list_worktrees(root, refresh=True)
         if target not in registered_worktrees:
             raise click.ClickException(
                 f"{target} exists but is not a registered git worktree."
             )
         # Reused worktrees are the risky case: we should reject dirtiness before
         # running any submodule command that could mutate local state.
-        dirty = worktree_is_dirty(target)
+        dirty = worktree_is_dirty(target, unique_submodule_paths)
         if dirty and not allow_dirty_reuse:
-            if repair_dirty_reuse:
+            if repair_dirty_reuse and pool_dir is not None and is_pool_slot(
+                pool_dir, target
+            ):
+                # Pool slots are reset in place; removing one would leave the
+                # batch symlink dangling and shrink the pool.
+                reset_slot(target, resolve_start_commit(root, start_ref))
+                action = "reset_dirty"
+                dirty = worktree_is_dirty(target, unique_submodule_paths)
+            elif repair_dirty_reuse:
                 remove_worktree(root, target)
-                create_worktree(root, target, start_ref)
+                create_worktree(root, target, start_ref, superproject_cone)
                 action = "recreated_dirty"
                 dirty = False
             else:
@@ -151,7 +453,7 @@ def main(
         else:
             action = "reused"
     else:
-        create_worktree(root, target, start_ref)
+        create_worktree(root, target, start_ref, superproject_cone)
         action = "created"
         dirty = False
 
@@ -159,35 +461,64 @@ def main(
         # The helper removed and recreated the worker-owned worktree above.
         # Refresh the registered worktree set only if future logic starts using
         # it again inside this command.
-        registered_worktrees = list_worktrees(root)
+        registered_worktrees = list_worktrees(root, refresh=True)
         if target not in registered_worktrees:
             raise click.ClickException(
                 f"{target} was recreated but is not registered as a git worktree."
             )
 
-    if unique_submodule_paths:
-        submodule_result = run_command(
-            ["git", "submodule", "update", "--init", "--", *unique_submodule_paths],
-            cwd=target,
-        )
-        if submodule_result.returncode != 0:
-            raise click.ClickException(
-                submodule_result.stderr.strip()
-                or "Failed to initialize review-batch submodules."
-            )
-
+    updated_submodule_paths = initialize_submodules(
+        target,
+        unique_submodule_paths,
+        root if reference_monolith_objects else None,
+        submodule_jobs,
+    )
     # Report final dirtiness after submodule init too. A clean create should
     # usually stay clean, but surfacing the real post-init state makes the
-    # helper easier to trust when something unusual happens.
-    dirty = worktree_is_dirty(target)
+    # helper easier to trust when something unusual happens. A clean first
+    # scan only needs the submodules init actually checked out looked at
+    # again; when it changed nothing, the first scan (or the known-clean fresh
+    # worktree) is still accurate. A dirty first scan may have been gitlink
+    # drift that init just fixed, so it is redone from scratch.
+    if updated_submodule_paths:
+        if dirty:
+            dirty = worktree_is_dirty(target, unique_submodule_paths)
+        else:
+            dirty = submodules_are_dirty(target, updated_submodule_paths)
+
+    sparse_repos: dict[str, list[str]] = {}
+    if sparse:
+        for repo_path, diff_range in submodule_diffs:
+            sparse_cones.setdefault(repo_path, set()).update(
+                changed_directories(target / repo_path, diff_range)
+            )
+        fresh = action in FRESH_WORKTREE_ACTIONS
+        for repo_path, cone in sorted(sparse_cones.items()):
+            repo_dir = target if repo_path == SUPERPROJECT else target / repo_path
+            # The superproject cone of a fresh worktree was applied before its
+            # first checkout in create_worktree. A freshly initialized
+            # submodule has nothing to protect yet, so it may be narrowed;
+            # anything reused only widens.
+            if (repo_path == SUPERPROJECT and fresh) or apply_sparse_cone(
+                repo_dir, sorted(cone), widen_only=not fresh
+            ):
+                # Report what git holds, so earlier widenings stay visible.
+                sparse_repos[repo_path] = effective_sparse_cone(repo_dir)
 
     payload = {
         "action": action,
-        "worktree_path": str(target),
+        "worktree_path": str(requested),
         "dirty": dirty,
         "start_ref": start_ref,
         "submodule_paths": list(unique_submodule_paths),
     }
+    if target != requested:
+        payload["pool_slot_path"] = str(target)
+    if sparse:
+        payload["sparse_cones"] = sparse_repos
+    update_registry_best_effort("prepare", mark_worktree_prepared, str(requested))
+    if profile is not None:
+        emit_startup_profile(profile)
     click.echo(json.dumps(payload, indent=2, sort_keys=True))
 
 
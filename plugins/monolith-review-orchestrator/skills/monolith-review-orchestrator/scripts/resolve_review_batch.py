@@ -11,6 +11,8 @@ Why this helper exists:
 - the model should not improvise worktree names, artifact paths, or batch keys
 - reassessment needs one stable local identity for "this review run"
 - v1 scope limits should be enforced by code, not left to prompt wording
+- a release spanning several repos should share one worktree and state file,
+  with a batch key that stays short enough for paths and branch-like names
 
 Mental model:
     input PR URLs
@@ -22,6 +24,7 @@ Mental model:
 
 from __future__ import annotations
 
+import hashlib
 import json
 import re
 from pathlib import Path
@@ -30,14 +33,16 @@ from urllib.parse import urlparse
 
 import click
 
-
-MONOLITH_ROOT_MARKERS: tuple[str, ...] = (
-    ".gitmodules",
-    ".submodule-branches",
-    "scripts/create_worktree.py",
-    "scripts/update_submodules.py",
-    "docs/github-first-branch-and-pr-conventions.md",
+from review_env_probe import (
+    MONOLITH_MARKERS,
+    begin_startup_profile,
+    emit_startup_profile,
+    probe_environment,
 )
+from review_registry import update_registry_best_effort, upsert_batch
+
+
+MONOLITH_ROOT_MARKERS: tuple[str, ...] = MONOLITH_MARKERS
 REPO_MAP: dict[str, tuple[str, str | None]] = {
     "monolith": ("mono", None),
     "Django4Lyfe": ("bk", "backend"),
@@ -49,6 +54,10 @@ REPO_MAP: dict[str, tuple[str, str | None]] = {
     "agent-skills-marketplace": ("asm", "agent-skills-marketplace"),
     "terraform-modules": ("tfm", "terraform-modules"),
 }
+# Batch keys feed directory and file names; past this length the joined entry
+# keys are truncated and suffixed with a digest of the full key.
+MAX_BATCH_KEY_LENGTH = 48
+BATCH_KEY_DIGEST_LENGTH = 10
 PR_PATH_PATTERN = re.compile(
     r"^/(?P<owner>[^/]+)/(?P<repo>[^/]+)/pull/(?P<number>\d+)(?:/.*)?$"
 )
@@ -76,9 +85,7 @@ class ReviewBatchPayload(TypedDict):
 
 
 def validate_monolith_root(root: Path) -> Path:
-    missing_markers = [
-        marker for marker in MONOLITH_ROOT_MARKERS if not (root / marker).exists()
-    ]
+    missing_markers = probe_environment(root)["missing_markers"]
     if missing_markers:
         required_markers = ", ".join(MONOLITH_ROOT_MARKERS)
         raise click.ClickException(
@@ -91,9 +98,9 @@ def validate_monolith_root(root: Path) -> Path:
 
 def discover_monolith_root(start: Path) -> Path:
     current = start.expanduser().resolve()
-    for candidate in (current, *current.parents):
-        if all((candidate / marker).exists() for marker in MONOLITH_ROOT_MARKERS):
-            return candidate
+    discovered = probe_environment(current)["monolith_root"]
+    if discovered is not None:
+        return Path(discovered)
     required_markers = ", ".join(MONOLITH_ROOT_MARKERS)
     raise click.ClickException(
         "Could not discover monolith root from "
@@ -133,6 +140,23 @@ def parse_pr_url(pr_url: str) -> PullRequestTarget:
     }
 
 
+def build_batch_key(entry_keys: list[str]) -> str:
+    """Join sorted entry keys into one bounded, stable batch key.
+
+    Short batches keep the readable joined form such as `bk2779-of389`. Long
+    ones keep a readable prefix and append a digest of the full joined key, so
+    two different PR sets can never collapse onto the same truncated key.
+    """
+
+    joined = "-".join(entry_keys)
+    if len(joined) <= MAX_BATCH_KEY_LENGTH:
+        return joined
+    digest = hashlib.sha256(joined.encode("utf-8")).hexdigest()
+    prefix_length = MAX_BATCH_KEY_LENGTH - BATCH_KEY_DIGEST_LENGTH - 1
+    prefix = joined[:prefix_length].rstrip("-")
+    return f"{prefix}-{digest[:BATCH_KEY_DIGEST_LENGTH]}"
+
+
 def reviews_root(worktree_root: Path) -> Path:
     """Return the review-artifact directory for one resolved worktree root."""
 
@@ -170,14 +194,22 @@ def reviews_root(worktree_root: Path) -> Path:
         "worktrees live as siblings to the monolith root."
     ),
 )
+@click.option(
+    "--profile-startup/--no-profile-startup",
+    default=False,
+    show_default=True,
+    help="Print startup and run timings as one JSON line on stderr.",
+)
 def main(
     monolith_root: Path,
     pr_urls: tuple[str, ...],
     review_root: Path | None,
     worktree_root: Path | None,
+    profile_startup: bool,
 ) -> None:
     """Resolve one deterministic review batch and print JSON."""
 
+    profile = begin_startup_profile("resolve_review_batch") if profile_startup else None
     if monolith_root is None:
         root = discover_monolith_root(Path.cwd())
     else:
@@ -193,16 +225,19 @@ def main(
         seen_identities.add(identity)
     items.sort(key=lambda item: (str(item["alias"]), int(item["pr_number"])))
 
-    if len(items) > 2:
-        raise click.ClickException(
-            "V1 only supports one PR or one explicitly linked cross-repo PR pair."
-        )
-    if len(items) == 2 and str(items[0]["repo"]) == str(items[1]["repo"]):
-        raise click.ClickException(
-            "V1 linked pairs must be cross-repo. Use a single PR batch for same-repo review."
-        )
+    # One shared worktree has exactly one checkout per repo, so a batch can
+    # hold any number of PRs as long as each comes from a different repo.
+    seen_repos: set[str] = set()
+    for item in items:
+        if str(item["repo"]) in seen_repos:
+            raise click.ClickException(
+                "Linked PR batches must be cross-repo: one shared worktree holds "
+                f"one checkout of `{item['repo']}`. Review same-repo PRs as "
+                "separate batches."
+            )
+        seen_repos.add(str(item["repo"]))
 
-    batch_key = "-".join(str(item["entry_key"]) for item in items)
+    batch_key = build_batch_key([str(item["entry_key"]) for item in items])
     resolved_worktree_root = root.parent if worktree_root is None else worktree_root.expanduser().resolve()
     worktree_path = resolved_worktree_root / f"monolith-review-{batch_key}"
     if review_root is None:
@@ -224,6 +259,29 @@ def main(
         "state_path": str(state_path),
         "prs": items,
     }
+    update_registry_best_effort(
+        "resolve",
+        upsert_batch,
+        {
+            "batch_key": batch_key,
+            "monolith_root": str(root),
+            "worktree_path": str(worktree_path),
+            "review_dir": str(review_dir),
+            "artifact_path": str(artifact_path),
+            "state_path": str(state_path),
+            "prs": [
+                {
+                    "owner": item["owner"],
+                    "repo": item["repo"],
+                    "pr_number": item["pr_number"],
+                }
+                for item in items
+            ],
+        },
+        True,
+    )
+    if profile is not None:
+        emit_startup_profile(profile)
     click.echo(json.dumps(payload, indent=2, sort_keys=True))
 
 
@@ -0,0 +1,389 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#   "click>=8.1,<9",
+# ]
+# ///
+"""Shared, cached environment probe for the monolith review helpers.
+
+Why this helper exists:
+- preflight, batch resolution, and worktree prep each used to walk parents for
+  the monolith markers and spawn their own `git worktree list` / `gh auth
+  status`
+- an orchestrator setup phase runs those helpers back to back, so it paid the
+  same probes three or four times
+- `gh auth status` hits the network and can take over a second on its own
+
+Mental model:
+    start path
+        -> one probe pass (marker walk, tool lookup, concurrent subprocesses)
+        -> short-TTL cache file keyed by the start path
+        -> every helper in the same setup phase reads the cached answer
+
+Only successful results are served from cache. A failed check is always
+re-probed, so the cache can skip work but can never hide a fix.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+import zlib
+from pathlib import Path
+from typing import TypedDict
+
+import click
+
+# `concurrent.futures` and `tempfile` are imported where they are used:
+# together they cost more startup time than the cached fast path itself,
+# and every setup-phase helper imports this module.
+
+
+PROBE_SCHEMA_VERSION = 2
+PROBE_TTL_SECONDS = 30.0
+PROBED_TOOLS: tuple[str, ...] = ("git", "uv", "gh")
+# `gh` is only required when a caller asks for GitHub auth.
+REQUIRED_TOOLS: tuple[str, ...] = ("git", "uv")
+# Direct imports listed in a `--profile-startup` breakdown, slowest first.
+IMPORT_BREAKDOWN_LIMIT = 8
+MONOLITH_MARKERS: tuple[str, ...] = (
+    ".gitmodules",
+    ".submodule-branches",
+    "scripts/create_worktree.py",
+    "scripts/update_submodules.py",
+    "docs/github-first-branch-and-pr-conventions.md",
+)
+
+
+class StartupProfile(TypedDict):
+    script: str
+    startup_cpu_ms: float
+    entered_at: float
+
+
+class EnvProbe(TypedDict):
+    schema_version: int
+    probed_at: float
+    start_path: str
+    monolith_root: str | None
+    missing_markers: list[str]
+    tools: dict[str, str | None]
+    worktrees: list[str] | None
+    worktree_error: str | None
+    github_auth: bool | None
+    # Wall time of each probe step from the run that produced this payload.
+    timings_ms: dict[str, float]
+
+
+def run_command(
+    cmd: list[str], cwd: Path | None = None
+) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, check=False)
+
+
+def elapsed_ms(started_at: float) -> float:
+    return round((time.perf_counter() - started_at) * 1000, 2)
+
+
+def timed_command(
+    cmd: list[str], cwd: Path | None = None
+) -> tuple[subprocess.CompletedProcess[str], float]:
+    started_at = time.perf_counter()
+    result = run_command(cmd, cwd)
+    return result, elapsed_ms(started_at)
+
+
+def cache_root() -> Path:
+    """Resolve the XDG-aware cache directory for probe results."""
+
+    custom = os.environ.get("MONOLITH_REVIEW_CACHE_HOME")
+    if custom:
+        return Path(custom).expanduser().resolve()
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    if xdg_cache:
+        return Path(xdg_cache).expanduser().resolve() / "monolith-review-orchestrator"
+    return Path.home().resolve() / ".cache" / "monolith-review-orchestrator"
+
+
+def probe_cache_path(start: Path) -> Path:
+    # A checksum is enough for a file name: readers reject entries whose
+    # recorded start path differs, so a collision is only a cache miss.
+    digest = zlib.crc32(str(start).encode("utf-8"))
+    return cache_root() / "env-probe" / f"{digest:08x}.json"
+
+
+def begin_startup_profile(script: str) -> StartupProfile:
+    """Capture startup cost at command entry for `--profile-startup`.
+
+    Process CPU time at entry covers interpreter start plus every import,
+    including click, without timing code at the top of each script.
+    """
+
+    return {
+        "script": script,
+        "startup_cpu_ms": round(time.process_time() * 1000, 2),
+        "entered_at": time.perf_counter(),
+    }
+
+
+def import_time_breakdown(module: str) -> tuple[float | None, list[dict[str, object]]]:
+    """Return `-X importtime` cumulative milliseconds for `module`'s imports.
+
+    The running process has already imported everything, so the breakdown
+    comes from one extra interpreter that only imports the script module.
+    Returns the script's own import total and its direct imports, slowest
+    first.
+    """
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=Path(__file__).resolve().parent,
+        text=True,
+        capture_output=True,
+        check=False,
+    )
+    children: list[tuple[str, float]] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue
+        # Children print before their parent, indented two more spaces.
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        cumulative_ms = round(int(cumulative) / 1000, 2)
+        if depth == 1:
+            children.append((name.strip(), cumulative_ms))
+        elif depth == 0:
+            if name.strip() == module:
+                children.sort(key=lambda item: item[1], reverse=True)
+                return cumulative_ms, [
+                    {"module": child, "cumulative_ms": child_ms}
+                    for child, child_ms in children[:IMPORT_BREAKDOWN_LIMIT]
+                ]
+            children = []
+    return None, []
+
+
+def emit_startup_profile(profile: StartupProfile) -> None:
+    """Print one startup timing line to stderr, leaving stdout untouched."""
+
+    run_ms = round((time.perf_counter() - profile["entered_at"]) * 1000, 2)
+    total_cpu_ms = round(time.process_time() * 1000, 2)
+    report = {
+        "script": profile["script"],
+        "startup_cpu_ms": profile["startup_cpu_ms"],
+        "run_ms": run_ms,
+        "total_cpu_ms": total_cpu_ms,
+    }
+    report["import_ms"], report["imports"] = import_time_breakdown(profile["script"])
+    click.echo("STARTUP: " + json.dumps(report, sort_keys=True), err=True)
+
+
+def missing_markers(candidate: Path) -> list[str]:
+    return [marker for marker in MONOLITH_MARKERS if not (candidate / marker).exists()]
+
+
+def find_monolith_root(start: Path) -> Path | None:
+    """Walk upward until we find a directory holding every monolith marker."""
+
+    for candidate in (start, *start.parents):
+        if not missing_markers(candidate):
+            return candidate
+    return None
+
+
+def parse_worktree_paths(porcelain: str) -> list[str]:
+    return [
+        str(Path(line.removeprefix("worktree ").strip()).resolve())
+        for line in porcelain.splitlines()
+        if line.startswith("worktree ")
+    ]
+
+
+def read_cached_probe(
+    path: Path, start: Path, max_age_seconds: float
+) -> EnvProbe | None:
+    try:
+        with path.open(encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(data, dict) or data.get("schema_version") != PROBE_SCHEMA_VERSION:
+        return None
+    if data.get("start_path") != str(start):
+        return None
+    probed_at = data.get("probed_at")
+    if not isinstance(probed_at, (int, float)):
+        return None
+    if time.time() - probed_at > max_age_seconds:
+        return None
+    return data
+
+
+def write_cached_probe(path: Path, payload: EnvProbe) -> None:
+    from tempfile import NamedTemporaryFile
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with NamedTemporaryFile(
+        "w", delete=False, dir=path.parent, encoding="utf-8"
+    ) as handle:
+        json.dump(payload, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+        temp_path = Path(handle.name)
+    os.replace(temp_path, path)
+
+
+def cached_probe_is_usable(cached: EnvProbe, include_github_auth: bool) -> bool:
+    # Anything a caller would report as a failure forces a re-probe, so a
+    # marker or tool fixed within the TTL is seen straight away.
+    if cached["monolith_root"] is None or cached["missing_markers"]:
+        return False
+    if any(cached["tools"].get(tool_name) is None for tool_name in REQUIRED_TOOLS):
+        return False
+    if cached["worktrees"] is None:
+        return False
+    if include_github_auth and cached["github_auth"] is not True:
+        return False
+    return True
+
+
+def cached_github_auth(
+    start: Path, max_age_seconds: float = PROBE_TTL_SECONDS
+) -> bool:
+    """Return whether a fresh cached probe already saw `gh auth status` pass.
+
+    Never probes: callers that only need auth fall back to their own single
+    `gh auth status` on a miss instead of paying for a full probe.
+    """
+
+    resolved_start = start.expanduser().resolve()
+    cached = read_cached_probe(
+        probe_cache_path(resolved_start), resolved_start, max_age_seconds
+    )
+    return cached is not None and cached.get("github_auth") is True
+
+
+def probe_environment(
+    start: Path,
+    *,
+    include_github_auth: bool = False,
+    refresh: bool = False,
+    max_age_seconds: float = PROBE_TTL_SECONDS,
+) -> EnvProbe:
+    """Return the environment facts the review helpers need, cached briefly.
+
+    `start` may be the monolith root, a sibling review worktree, or any
+    directory below either. The marker walk, tool lookup, `git worktree list`,
+    and optional `gh auth status` all happen in one pass; the two subprocesses
+    run concurrently.
+    """
+
+    resolved_start = start.expanduser().resolve()
+    if resolved_start.is_file():
+        resolved_start = resolved_start.parent
+    cache_path = probe_cache_path(resolved_start)
+    if not refresh:
+        cached = read_cached_probe(cache_path, resolved_start, max_age_seconds)
+        if cached is not None and cached_probe_is_usable(cached, include_github_auth):
+            return cached
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    timings_ms: dict[str, float] = {}
+    started_at = time.perf_counter()
+    root = find_monolith_root(resolved_start)
+    start_missing_markers = missing_markers(resolved_start)
+    timings_ms["markers"] = elapsed_ms(started_at)
+    git_cwd = root or resolved_start
+    started_at = time.perf_counter()
+    tools = {tool_name: shutil.which(tool_name) for tool_name in PROBED_TOOLS}
+    timings_ms["tools"] = elapsed_ms(started_at)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        worktree_future = executor.submit(
+            timed_command, ["git", "worktree", "list", "--porcelain"], git_cwd
+        )
+        auth_future = (
+            executor.submit(timed_command, ["gh", "auth", "status"], git_cwd)
+            if include_github_auth and tools["gh"] is not None
+            else None
+        )
+        worktree_result, timings_ms["worktrees"] = worktree_future.result()
+        auth_result = None
+        if auth_future is not None:
+            auth_result, timings_ms["github_auth"] = auth_future.result()
+
+    payload: EnvProbe = {
+        "schema_version": PROBE_SCHEMA_VERSION,
+        "probed_at": time.time(),
+        "start_path": str(resolved_start),
+        "monolith_root": None if root is None else str(root),
+        # Markers are checked on the start path itself so callers that were
+        # handed an explicit root validate that exact directory.
+        "missing_markers": start_missing_markers,
+        "tools": tools,
+        "worktrees": (
+            parse_worktree_paths(worktree_result.stdout)
+            if worktree_result.returncode == 0
+            else None
+        ),
+        "worktree_error": (
+            None
+            if worktree_result.returncode == 0
+            else worktree_result.stderr.strip() or "`git worktree list` failed."
+        ),
+        "github_auth": None if auth_result is None else auth_result.returncode == 0,
+        "timings_ms": timings_ms,
+    }
+    if not include_github_auth:
+        # Keep a still-fresh auth answer from an earlier probe that asked for it.
+        cached = read_cached_probe(cache_path, resolved_start, max_age_seconds)
+        if cached is not None and cached.get("github_auth") is True:
+            payload["github_auth"] = True
+    write_cached_probe(cache_path, payload)
+    return payload
+
+
+def invalidate_probes() -> None:
+    """Drop every cached probe after a helper mutates the worktree registry.
+
+    Probes are keyed by start path, and several start paths can describe the
+    same monolith, so clearing them all is the only simple correct option.
+    The next helper simply re-probes once.
+    """
+
+    for path in (cache_root() / "env-probe").glob("*.json"):
+        path.unlink(missing_ok=True)
+
+
+@click.command()
+@click.option(
+    "--start-path",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Directory to probe from. Defaults to the current directory.",
+)
+@click.option(
+    "--include-github-auth/--no-include-github-auth",
+    default=False,
+    show_default=True,
+)
+@click.option("--refresh/--no-refresh", default=False, show_default=True)
+def main(start_path: Path | None, include_github_auth: bool, refresh: bool) -> None:
+    """Print the (possibly cached) environment probe as JSON."""
+
+    payload = probe_environment(
+        Path.cwd() if start_path is None else start_path,
+        include_github_auth=include_github_auth,
+        refresh=refresh,
+    )
+    click.echo(json.dumps(payload, indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,657 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#   "click>=8.1,<9",
+# ]
+# ///
+"""Global index of review batches across monolith review roots.
+
+Why this helper exists:
+- batch state lives next to each worktree or under an external review root, so
+  "which batches are open or stale?" used to mean walking every sibling
+  `monolith-review-*` worktree and parsing its `reviews/.state/*.json`
+- cleanup and status tooling need PR identities and paths without opening
+  each state file
+- one small SQLite file answers those queries in milliseconds
+
+Mental model:
+    resolve_review_batch.py   -> registers batch key, paths, PR identities
+    prepare_review_worktree.py -> stamps when the worktree was last prepared
+    review_state.py           -> stamps last pass and posting status
+    review_registry.py list   -> reads the index, never the state files
+    review_registry.py gc     -> archives and removes batches whose PRs closed
+                                 or that sat idle past a TTL
+
+The registry is an index, not a source of truth. The state JSON stays
+authoritative, and helpers only warn when the index cannot be updated.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sqlite3
+import subprocess
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TypedDict
+
+import click
+
+from review_env_probe import invalidate_probes
+
+
+REGISTRY_FILE = "registry.sqlite3"
+REGISTRY_TIMEOUT_SECONDS = 5.0
+NOT_POSTED_STATUSES: tuple[str, ...] = ("not_posted",)
+CLOSED_PR_STATES: frozenset[str] = frozenset({"MERGED", "CLOSED"})
+PR_STATE_TTL_SECONDS = 3600.0
+DEFAULT_GC_IDLE_DAYS = 14.0
+DEFAULT_GC_JOBS = 4
+ARCHIVE_DIR = "archive"
+REGISTRY_SCHEMA = """\
+CREATE TABLE IF NOT EXISTS batches (
+    batch_key TEXT PRIMARY KEY,
+    monolith_root TEXT,
+    worktree_path TEXT,
+    review_dir TEXT,
+    artifact_path TEXT,
+    state_path TEXT,
+    prs TEXT NOT NULL DEFAULT '[]',
+    created_at_utc TEXT NOT NULL,
+    updated_at_utc TEXT NOT NULL,
+    worktree_prepared_at_utc TEXT,
+    last_pass_number INTEGER NOT NULL DEFAULT 0,
+    last_pass_at_utc TEXT,
+    posting_status TEXT
+);
+CREATE INDEX IF NOT EXISTS batches_updated_at ON batches (updated_at_utc);
+CREATE INDEX IF NOT EXISTS batches_worktree_path ON batches (worktree_path);
+CREATE TABLE IF NOT EXISTS pr_states (
+    owner TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    pr_number INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    checked_at_utc TEXT NOT NULL,
+    PRIMARY KEY (owner, repo, pr_number)
+);
+"""
+# Columns a helper may set. A column missing from an update keeps its indexed
+# value.
+UPDATABLE_COLUMNS: tuple[str, ...] = (
+    "monolith_root",
+    "worktree_path",
+    "review_dir",
+    "artifact_path",
+    "state_path",
+    "last_pass_number",
+    "last_pass_at_utc",
+    "posting_status",
+)
+
+
+class RegisteredPullRequest(TypedDict, total=False):
+    owner: str
+    repo: str
+    pr_number: int
+
+
+class BatchRegistryUpdate(TypedDict, total=False):
+    batch_key: str
+    monolith_root: str
+    worktree_path: str
+    review_dir: str
+    artifact_path: str
+    state_path: str
+    prs: list[RegisteredPullRequest]
+    last_pass_number: int
+    last_pass_at_utc: str
+    posting_status: str
+
+
+class BatchRegistryRecord(TypedDict):
+    batch_key: str
+    monolith_root: str | None
+    worktree_path: str | None
+    review_dir: str | None
+    artifact_path: str | None
+    state_path: str | None
+    prs: list[RegisteredPullRequest]
+    created_at_utc: str
+    updated_at_utc: str
+    worktree_prepared_at_utc: str | None
+    last_pass_number: int
+    last_pass_at_utc: str | None
+    posting_status: str | None
+
+
+class GcResult(TypedDict):
+    batch_key: str
+    reason: str
+    worktree_path: str | None
+    archive_path: str | None
+    status: str
+    detail: str
+
+
+def format_utc(moment: datetime) -> str:
+    return moment.replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def utc_now() -> str:
+    return format_utc(datetime.now(timezone.utc))
+
+
+def utc_cutoff(*, days: float = 0.0, seconds: float = 0.0) -> str:
+    """Return the UTC timestamp that far in the past, comparable as text."""
+
+    return format_utc(
+        datetime.now(timezone.utc) - timedelta(days=days, seconds=seconds)
+    )
+
+
+def run_command(
+    cmd: list[str], cwd: Path | None = None
+) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, check=False)
+
+
+def registry_root() -> Path:
+    """Resolve the XDG-aware state directory that holds the registry."""
+
+    custom = os.environ.get("MONOLITH_REVIEW_STATE_HOME")
+    if custom:
+        return Path(custom).expanduser().resolve()
+    xdg_state = os.environ.get("XDG_STATE_HOME")
+    if xdg_state:
+        return Path(xdg_state).expanduser().resolve() / "monolith-review-orchestrator"
+    return Path.home().resolve() / ".local" / "state" / "monolith-review-orchestrator"
+
+
+@contextmanager
+def open_registry() -> Iterator[sqlite3.Connection]:
+    """Open the registry in WAL mode and commit on a clean exit.
+
+    WAL lets a `list` query read while another helper is writing, and the busy
+    timeout covers concurrent workers upserting different batches.
+    """
+
+    root = registry_root()
+    root.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(
+        root / REGISTRY_FILE, timeout=REGISTRY_TIMEOUT_SECONDS
+    )
+    try:
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(REGISTRY_SCHEMA)
+        with connection:
+            yield connection
+    finally:
+        connection.close()
+
+
+def upsert_batch(
+    update: BatchRegistryUpdate, authoritative_prs: bool = False
+) -> None:
+    """Insert or refresh one batch row, keeping values the update omits.
+
+    PR identities from batch resolution carry the GitHub owner and are
+    authoritative; the state file only knows repo and number, so its list only
+    fills an empty index entry.
+    """
+
+    now = utc_now()
+    columns = [column for column in UPDATABLE_COLUMNS if column in update]
+    values = [update.get(column) for column in columns]
+    prs = update.get("prs", [])
+    assignments = "".join(
+        f", {column} = COALESCE(excluded.{column}, batches.{column})"
+        for column in columns
+    )
+    with open_registry() as connection:
+        connection.execute(
+            f"""
+            INSERT INTO batches (
+                batch_key, prs, created_at_utc, updated_at_utc
+                {"".join(f", {column}" for column in columns)}
+            )
+            VALUES (?, ?, ?, ?{", ?" * len(columns)})
+            ON CONFLICT (batch_key) DO UPDATE SET
+                updated_at_utc = excluded.updated_at_utc,
+                prs = CASE
+                    WHEN ? THEN excluded.prs
+                    WHEN batches.prs = '[]' THEN excluded.prs
+                    ELSE batches.prs
+                END
+                {assignments}
+            """,
+            [
+                update["batch_key"],
+                json.dumps(prs, sort_keys=True),
+                now,
+                now,
+                *values,
+                authoritative_prs,
+            ],
+        )
+
+
+def mark_worktree_prepared(worktree_path: str) -> None:
+    """Stamp every batch registered for this worktree as freshly prepared."""
+
+    now = utc_now()
+    with open_registry() as connection:
+        connection.execute(
+            """
+            UPDATE batches
+            SET worktree_prepared_at_utc = ?, updated_at_utc = ?
+            WHERE worktree_path = ?
+            """,
+            [now, now, worktree_path],
+        )
+
+
+def forget_batch(batch_key: str) -> bool:
+    with open_registry() as connection:
+        cursor = connection.execute(
+            "DELETE FROM batches WHERE batch_key = ?", [batch_key]
+        )
+    return cursor.rowcount > 0
+
+
+def row_to_record(row: sqlite3.Row) -> BatchRegistryRecord:
+    record: BatchRegistryRecord = dict(row)
+    record["prs"] = json.loads(row["prs"])
+    return record
+
+
+def list_batches(
+    idle_days: float | None = None, unposted_only: bool = False
+) -> list[BatchRegistryRecord]:
+    """Return indexed batches, most recently touched first."""
+
+    clauses: list[str] = []
+    params: list[object] = []
+    if idle_days is not None:
+        clauses.append("updated_at_utc < ?")
+        params.append(utc_cutoff(days=idle_days))
+    if unposted_only:
+        placeholders = ", ".join("?" for _ in NOT_POSTED_STATUSES)
+        clauses.append(
+            f"(posting_status IS NULL OR posting_status IN ({placeholders}))"
+        )
+        params.extend(NOT_POSTED_STATUSES)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    with open_registry() as connection:
+        rows = connection.execute(
+            f"SELECT * FROM batches {where} ORDER BY updated_at_utc DESC",
+            params,
+        ).fetchall()
+    return [row_to_record(row) for row in rows]
+
+
+def update_registry_best_effort(
+    action: str, update: Callable[..., object], *args: object
+) -> None:
+    """Run one registry write, downgrading failures to a stderr warning.
+
+    A read-only home directory or a locked database must never fail the review
+    step that triggered the index update.
+    """
+
+    try:
+        update(*args)
+    except (sqlite3.Error, OSError) as exc:
+        click.echo(f"WARNING: review registry not updated ({action}): {exc}", err=True)
+
+
+def fetch_pr_state(owner: str, repo: str, pr_number: int) -> str | None:
+    result = run_command(
+        [
+            "gh",
+            "pr",
+            "view",
+            str(pr_number),
+            "--repo",
+            f"{owner}/{repo}",
+            "--json",
+            "state",
+            "--jq",
+            ".state",
+        ]
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def resolve_pr_states(
+    prs: list[tuple[str, str, int]], jobs: int
+) -> dict[tuple[str, str, int], str]:
+    """Return GitHub PR states, served from the registry cache when fresh.
+
+    Merged and closed PRs never reopen into a different review, so only open
+    or unknown PRs are asked again once their cached answer expires.
+    """
+
+    states: dict[tuple[str, str, int], str] = {}
+    cutoff = utc_cutoff(seconds=PR_STATE_TTL_SECONDS)
+    with open_registry() as connection:
+        for owner, repo, pr_number, state, checked_at in connection.execute(
+            "SELECT owner, repo, pr_number, state, checked_at_utc FROM pr_states"
+        ):
+            if state in CLOSED_PR_STATES or checked_at >= cutoff:
+                states[(owner, repo, pr_number)] = state
+    missing = [pr for pr in dict.fromkeys(prs) if pr not in states]
+    if not missing:
+        return states
+    with ThreadPoolExecutor(max_workers=min(jobs, len(missing))) as executor:
+        fetched = list(executor.map(lambda pr: fetch_pr_state(*pr), missing))
+    now = utc_now()
+    with open_registry() as connection:
+        for pr, state in zip(missing, fetched):
+            if state is None:
+                continue
+            states[pr] = state
+            connection.execute(
+                """
+                INSERT INTO pr_states (owner, repo, pr_number, state, checked_at_utc)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (owner, repo, pr_number) DO UPDATE SET
+                    state = excluded.state,
+                    checked_at_utc = excluded.checked_at_utc
+                """,
+                [*pr, state, now],
+            )
+    return states
+
+
+def batch_pr_keys(record: BatchRegistryRecord) -> list[tuple[str, str, int]] | None:
+    """Return GitHub identities for every PR, or None if any lacks an owner."""
+
+    keys: list[tuple[str, str, int]] = []
+    for pr in record["prs"]:
+        owner = pr.get("owner")
+        if not owner:
+            return None
+        keys.append((owner, pr["repo"], pr["pr_number"]))
+    return keys or None
+
+
+def gc_reason(
+    record: BatchRegistryRecord,
+    pr_states: dict[tuple[str, str, int], str],
+    idle_cutoff: str,
+) -> str | None:
+    keys = batch_pr_keys(record)
+    if keys is not None and all(
+        pr_states.get(key) in CLOSED_PR_STATES for key in keys
+    ):
+        return "prs_closed"
+    if record["updated_at_utc"] < idle_cutoff:
+        return "idle"
+    return None
+
+
+def archive_batch(record: BatchRegistryRecord, archive_root: Path) -> Path:
+    """Copy a batch's state and artifacts out before its worktree goes away.
+
+    Review dirs often live inside the worktree, so this must finish before
+    removal starts.
+    """
+
+    stamp = utc_now().replace("-", "").replace(":", "")
+    archive_path = archive_root / f"{record['batch_key']}-{stamp}"
+    archive_path.mkdir(parents=True, exist_ok=True)
+    review_dir = Path(record["review_dir"]) if record["review_dir"] else None
+    if review_dir is not None and review_dir.is_dir():
+        shutil.copytree(review_dir, archive_path / "reviews", dirs_exist_ok=True)
+    else:
+        for key in ("state_path", "artifact_path"):
+            value = record[key]
+            if value and Path(value).is_file():
+                shutil.copy2(value, archive_path / Path(value).name)
+    with (archive_path / "registry.json").open("w", encoding="utf-8") as handle:
+        json.dump(record, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+    return archive_path
+
+
+def worktree_has_changes(record: BatchRegistryRecord) -> bool:
+    """Return whether a batch worktree holds work beyond its own review files.
+
+    The default review dir lives inside the worktree and is archived anyway,
+    so it is excluded from the dirtiness check. Submodule contents count:
+    review edits usually land inside the batch submodules.
+
+    Pooled batch paths are symlinks, so the probe runs in the leased slot.
+    The next lease force-resets that slot, which would destroy the work.
+    """
+
+    if not record["worktree_path"]:
+        return False
+    worktree = Path(record["worktree_path"])
+    checkout = worktree.resolve()
+    if not checkout.is_dir():
+        return False
+    status_cmd = ["git", "status", "--porcelain"]
+    review_dir = Path(record["review_dir"] or "")
+    for base in (worktree, checkout):
+        if record["review_dir"] and review_dir.is_relative_to(base):
+            status_cmd += ["--", ".", f":(exclude){review_dir.relative_to(base)}"]
+            break
+    status = run_command(status_cmd, checkout)
+    return status.returncode != 0 or bool(status.stdout.strip())
+
+
+def is_helper_worktree(record: BatchRegistryRecord) -> bool:
+    """Return whether gc may remove this batch's worktree.
+
+    `review_state init` can point a batch at any existing worktree, so only
+    pool links and the `monolith-review-<batch_key>` checkouts the helpers
+    create are ever removed.
+    """
+
+    if not record["worktree_path"]:
+        return True
+    worktree = Path(record["worktree_path"])
+    return (
+        worktree.is_symlink()
+        or worktree.name == f"monolith-review-{record['batch_key']}"
+    )
+
+
+def remove_batch_worktree(record: BatchRegistryRecord) -> tuple[str, str]:
+    """Remove one batch worktree and return `(status, detail)`.
+
+    Pooled batch paths are symlinks; dropping the link is enough, because the
+    pool treats a slot whose batch link is gone as idle again.
+    """
+
+    if not record["worktree_path"]:
+        return "removed", "no worktree recorded"
+    worktree = Path(record["worktree_path"])
+    if worktree.is_symlink():
+        worktree.unlink()
+        return "removed", "released pool slot link"
+    if not worktree.exists():
+        return "removed", "worktree already gone"
+    monolith_root = Path(record["monolith_root"] or worktree)
+    result = run_command(
+        ["git", "worktree", "remove", "--force", str(worktree)], monolith_root
+    )
+    if result.returncode != 0:
+        return "failed", result.stderr.strip() or "`git worktree remove` failed"
+    return "removed", "worktree removed"
+
+
+def gc_result(
+    record: BatchRegistryRecord,
+    reason: str,
+    archive_path: Path | None,
+    status: str,
+    detail: str,
+) -> GcResult:
+    return {
+        "batch_key": record["batch_key"],
+        "reason": reason,
+        "worktree_path": record["worktree_path"],
+        "archive_path": None if archive_path is None else str(archive_path),
+        "status": status,
+        "detail": detail,
+    }
+
+
+def collect_gc_candidates(
+    idle_days: float, check_pr_state: bool, jobs: int
+) -> list[tuple[BatchRegistryRecord, str]]:
+    records = list_batches()
+    pr_states: dict[tuple[str, str, int], str] = {}
+    if check_pr_state and shutil.which("gh") is not None:
+        wanted = [
+            key for record in records for key in (batch_pr_keys(record) or [])
+        ]
+        if wanted:
+            pr_states = resolve_pr_states(wanted, jobs)
+    idle_cutoff = utc_cutoff(days=idle_days)
+    candidates: list[tuple[BatchRegistryRecord, str]] = []
+    for record in records:
+        reason = gc_reason(record, pr_states, idle_cutoff)
+        if reason is not None:
+            candidates.append((record, reason))
+    return candidates
+
+
+@click.group()
+def cli() -> None:
+    """Query the global review-batch registry."""
+
+
+@cli.command("list")
+@click.option(
+    "--idle-days",
+    type=click.FloatRange(min=0),
+    default=None,
+    help="Only batches not touched by any helper for this many days.",
+)
+@click.option(
+    "--unposted/--all",
+    "unposted_only",
+    default=False,
+    show_default=True,
+    help="Only batches whose review has not been posted yet.",
+)
+def list_command(idle_days: float | None, unposted_only: bool) -> None:
+    """Print indexed batches as JSON."""
+
+    batches = list_batches(idle_days=idle_days, unposted_only=unposted_only)
+    click.echo(json.dumps(batches, indent=2, sort_keys=True))
+
+
+@cli.command("forget")
+@click.option("--batch-key", required=True)
+def forget_command(batch_key: str) -> None:
+    """Drop one batch from the index without touching its files."""
+
+    if not forget_batch(batch_key):
+        raise click.ClickException(f"Batch `{batch_key}` is not registered.")
+    click.echo(json.dumps({"forgotten": batch_key}, indent=2, sort_keys=True))
+
+
+@cli.command("gc")
+@click.option(
+    "--idle-days",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_GC_IDLE_DAYS,
+    show_default=True,
+    help="Collect batches no helper has touched for this many days.",
+)
+@click.option(
+    "--check-pr-state/--no-check-pr-state",
+    default=True,
+    show_default=True,
+    help="Also collect batches whose PRs are all merged or closed.",
+)
+@click.option(
+    "--include-dirty/--skip-dirty",
+    default=False,
+    show_default=True,
+    help="Remove worktrees even when they have local changes.",
+)
+@click.option("--jobs", type=click.IntRange(min=1), default=DEFAULT_GC_JOBS)
+@click.option("--dry-run/--apply", default=False, show_default=True)
+def gc_command(
+    idle_days: float,
+    check_pr_state: bool,
+    include_dirty: bool,
+    jobs: int,
+    dry_run: bool,
+) -> None:
+    """Archive and remove stale review worktrees, then prune git metadata."""
+
+    candidates = collect_gc_candidates(idle_days, check_pr_state, jobs)
+    results: list[GcResult] = []
+    managed: list[tuple[BatchRegistryRecord, str]] = []
+    for record, reason in candidates:
+        if is_helper_worktree(record):
+            managed.append((record, reason))
+        else:
+            results.append(
+                gc_result(
+                    record,
+                    reason,
+                    None,
+                    "skipped_unmanaged",
+                    "worktree was not created by the review helpers",
+                )
+            )
+    if dry_run:
+        results += [
+            gc_result(record, reason, None, "would_remove", "dry run")
+            for record, reason in managed
+        ]
+        click.echo(json.dumps(results, indent=2, sort_keys=True))
+        return
+
+    removable: list[tuple[BatchRegistryRecord, str]] = []
+    for record, reason in managed:
+        if not include_dirty and worktree_has_changes(record):
+            results.append(
+                gc_result(record, reason, None, "skipped_dirty", "local changes")
+            )
+        else:
+            removable.append((record, reason))
+
+    archive_root = registry_root() / ARCHIVE_DIR
+    archives = [archive_batch(record, archive_root) for record, _ in removable]
+    # Each `git worktree remove` touches only its own admin dir, so removals
+    # run side by side; one prune per monolith afterwards tidies leftovers.
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        outcomes = list(
+            executor.map(remove_batch_worktree, [record for record, _ in removable])
+        )
+    for (record, reason), archive_path, (status, detail) in zip(
+        removable, archives, outcomes
+    ):
+        if status == "removed":
+            forget_batch(record["batch_key"])
+        results.append(gc_result(record, reason, archive_path, status, detail))
+    monolith_roots = {
+        record["monolith_root"] for record, _ in removable if record["monolith_root"]
+    }
+    for monolith_root in sorted(monolith_roots):
+        if Path(monolith_root).is_dir():
+            run_command(["git", "worktree", "prune"], Path(monolith_root))
+    if removable:
+        invalidate_probes()
+    click.echo(json.dumps(results, indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    cli()
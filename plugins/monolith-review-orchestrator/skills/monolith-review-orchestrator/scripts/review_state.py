@@ -32,6 +32,12 @@ from typing import Literal, TypedDict
 
 import click
 
+from review_registry import (
+    BatchRegistryUpdate,
+    update_registry_best_effort,
+    upsert_batch,
+)
+
 
 SCHEMA_VERSION = 2
 SUPPORTED_SCHEMA_VERSIONS: set[int] = {1, SCHEMA_VERSION}
@@ -249,6 +255,31 @@ def atomic_write_json(path: Path, payload: ReviewStateRecord) -> None:
     os.replace(temp_path, path)
 
 
+def sync_registry(path: Path, payload: ReviewStateRecord) -> None:
+    """Mirror the index-relevant state fields into the global batch registry."""
+
+    batch_key = payload.get("batch_key")
+    if batch_key is None:
+        return
+    update: BatchRegistryUpdate = {
+        "batch_key": batch_key,
+        "state_path": str(path),
+        "prs": [
+            {"repo": entry["repo"], "pr_number": entry["pr_number"]}
+            for entry in payload.get("prs", [])
+        ],
+        "last_pass_number": payload.get("review_pass_number", 0),
+        "posting_status": payload.get("posting_status", "not_posted"),
+    }
+    for key in ("worktree_path", "artifact_path"):
+        value = payload.get(key)
+        if value is not None:
+            update[key] = value
+    if update["last_pass_number"] and "updated_at_utc" in payload:
+        update["last_pass_at_utc"] = payload["updated_at_utc"]
+    update_registry_best_effort("review_state", upsert_batch, update)
+
+
 def read_json(path: Path) -> ReviewStateRecord:
     with path.open(encoding="utf-8") as handle:
         data = json.load(handle)
@@ -1431,18 +1462,24 @@ def init_state(
         )
 
     now = utc_now()
+    # Resolve only the parent: a pooled batch path is a symlink to its slot,
+    # and the registry must keep the link, not the slot behind it.
+    expanded_worktree_path = Path(worktree_path).expanduser()
     payload: ReviewStateRecord = {
         "schema_version": SCHEMA_VERSION,
         "batch_key": batch_key,
         "created_at_utc": now,
         "updated_at_utc": now,
-        "worktree_path": str(Path(worktree_path).expanduser().resolve()),
+        "worktree_path": str(
+            expanded_worktree_path.parent.resolve() / expanded_worktree_path.name
+        ),
         "artifact_path": str(Path(artifact_path).expanduser().resolve()),
         "review_pass_number": 0,
         "posting_status": "not_posted",
         "prs": entries,
     }
     atomic_write_json(resolved_state_path, payload)
+    sync_registry(resolved_state_path, payload)
     click.echo(json.dumps(payload, indent=2, sort_keys=True))
 
 
@@ -1697,6 +1734,7 @@ def record_pass(
     payload["posting_status"] = posting_status
 
     atomic_write_json(path, payload)
+    sync_registry(path, payload)
     click.echo(json.dumps(pass_record, indent=2, sort_keys=True))
 
 
@@ -1812,6 +1850,7 @@ def record_review(state_path: Path) -> None:
     payload["posting_status"] = posting_status
 
     atomic_write_json(path, payload)
+    sync_registry(path, payload)
     click.echo(json.dumps(pass_record, indent=2, sort_keys=True))
 
 
@@ -0,0 +1,475 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#   "click>=8.1,<9",
+# ]
+# ///
+"""Manage a pool of pre-warmed detached monolith review worktrees.
+
+Why this helper exists:
+- `git worktree add --detach` plus submodule init takes tens of seconds on the
+  monolith, and that cost used to sit on the critical path of every new batch
+- a detached checkout of an already-materialized worktree is cheap
+- warming slots ahead of time lets batch startup become "reset one slot"
+  instead of "materialize one monolith"
+
+Mental model:
+    warm: create N detached slots with submodules initialized
+    lease: reset one idle slot and point the batch worktree path at it
+    release: clean the slot and hand it back to the pool
+
+The batch keeps its deterministic `monolith-review-<batch_key>` path. That path
+becomes a symlink to the leased slot, so every other helper keeps working with
+the same path it always had.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import subprocess
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import TypedDict
+
+import click
+
+from review_env_probe import invalidate_probes
+
+
+POOL_STATE_FILE = "pool.json"
+POOL_LOCK_FILE = ".pool.lock"
+POOL_SLOT_PREFIX = "slot-"
+DEFAULT_SUBMODULE_JOBS = 4
+
+
+class PoolSlotRecord(TypedDict, total=False):
+    slot_path: str
+    leased_to: str | None
+    leased_at_utc: str | None
+    start_ref: str
+
+
+class PoolStateRecord(TypedDict):
+    slots: dict[str, PoolSlotRecord]
+
+
+def utc_now() -> str:
+    return (
+        datetime.now(timezone.utc)
+        .replace(microsecond=0)
+        .isoformat()
+        .replace("+00:00", "Z")
+    )
+
+
+def run_command(
+    cmd: list[str], cwd: Path | None = None
+) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, check=False)
+
+
+def run_checked(cmd: list[str], cwd: Path, failure_message: str) -> None:
+    result = run_command(cmd, cwd=cwd)
+    if result.returncode != 0:
+        raise click.ClickException(result.stderr.strip() or failure_message)
+
+
+@contextmanager
+def pool_lock(pool_dir: Path) -> Iterator[None]:
+    """Serialize pool bookkeeping across concurrent batch workers.
+
+    The lock only guards `pool.json` reads and writes plus slot selection. Slot
+    resets run under the lock too so two workers can never pick the same idle
+    slot between "choose" and "mark leased".
+    """
+
+    pool_dir.mkdir(parents=True, exist_ok=True)
+    with (pool_dir / POOL_LOCK_FILE).open("a+") as handle:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def read_pool_state(pool_dir: Path) -> PoolStateRecord:
+    path = pool_dir / POOL_STATE_FILE
+    if not path.exists():
+        return {"slots": {}}
+    with path.open(encoding="utf-8") as handle:
+        data = json.load(handle)
+    if not isinstance(data, dict) or not isinstance(data.get("slots"), dict):
+        raise click.ClickException(f"{path} does not contain a valid pool state.")
+    return data
+
+
+def write_pool_state(pool_dir: Path, payload: PoolStateRecord) -> None:
+    with NamedTemporaryFile(
+        "w", delete=False, dir=pool_dir, encoding="utf-8"
+    ) as handle:
+        json.dump(payload, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+        handle.flush()
+        os.fsync(handle.fileno())
+        temp_path = Path(handle.name)
+    os.replace(temp_path, pool_dir / POOL_STATE_FILE)
+
+
+def lease_is_live(slot: PoolSlotRecord) -> bool:
+    """Return whether a recorded lease still points at its slot.
+
+    A lease whose batch path was deleted by hand (or never finished being
+    linked because the worker crashed) should not keep the slot out of the
+    pool forever.
+    """
+
+    leased_to = slot.get("leased_to")
+    if not leased_to:
+        return False
+    link = Path(leased_to)
+    if not link.is_symlink():
+        return False
+    return link.resolve() == Path(slot["slot_path"]).resolve()
+
+
+def submodule_reference(
+    reference_root: Path | None, submodule_path: str
+) -> Path | None:
+    """Return the monolith root's checkout of a submodule that can lend objects.
+
+    Only initialized submodules qualify. An uninitialized path has no object
+    store to borrow from, and `--reference` to a missing repo fails the clone.
+    """
+
+    if reference_root is None:
+        return None
+    candidate = reference_root / submodule_path
+    if not (candidate / ".git").exists():
+        return None
+    return candidate
+
+
+def initialize_submodules(
+    worktree_path: Path,
+    submodule_paths: tuple[str, ...],
+    reference_root: Path | None = None,
+    jobs: int = DEFAULT_SUBMODULE_JOBS,
+) -> tuple[str, ...]:
+    """Initialize the listed submodules concurrently, borrowing local objects.
+
+    Returns the submodule paths git actually checked out. `git submodule
+    update` is silent on stdout when a submodule already sits at its recorded
+    commit, which lets callers skip re-inspecting untouched submodules.
+
+    Why per-path processes instead of one `git submodule update --jobs`:
+    `--reference` takes one repository for the whole command, but each
+    submodule needs its own reference (the monolith root's checkout of that
+    same submodule). The clone then records an alternate instead of fetching
+    or copying objects that already sit on disk.
+
+    `git submodule init` writes the shared superproject config, so it runs
+    once up front. Running it per path in parallel would race on
+    `config.lock`.
+    """
+
+    if not submodule_paths:
+        return ()
+    run_checked(
+        ["git", "submodule", "init", "--", *submodule_paths],
+        worktree_path,
+        "Failed to register review-batch submodules.",
+    )
+
+    def update_one(
+        submodule_path: str,
+    ) -> tuple[str, subprocess.CompletedProcess[str]]:
+        cmd = ["git", "submodule", "update"]
+        reference = submodule_reference(reference_root, submodule_path)
+        if reference is not None:
+            cmd.extend(["--reference", str(reference)])
+        cmd.extend(["--", submodule_path])
+        return submodule_path, run_command(cmd, cwd=worktree_path)
+
+    max_workers = max(1, min(jobs, len(submodule_paths)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(update_one, submodule_paths))
+
+    failures = [
+        f"{submodule_path}: {result.stderr.strip() or 'git submodule update failed'}"
+        for submodule_path, result in results
+        if result.returncode != 0
+    ]
+    if failures:
+        raise click.ClickException(
+            "Failed to initialize review-batch submodules. " + "; ".join(failures)
+        )
+    return tuple(
+        submodule_path for submodule_path, result in results if result.stdout.strip()
+    )
+
+
+def resolve_start_commit(monolith_root: Path, start_ref: str) -> str:
+    """Resolve `start_ref` to a commit SHA in the monolith root.
+
+    Slots are checked out from inside the slot, where `HEAD` means the slot's
+    own previous commit. Resolving in the root first gives pooled batches the
+    same base a fresh `git worktree add` would get.
+    """
+
+    result = run_command(
+        ["git", "rev-parse", "--verify", f"{start_ref}^{{commit}}"], cwd=monolith_root
+    )
+    if result.returncode != 0:
+        raise click.ClickException(
+            result.stderr.strip()
+            or f"Failed to resolve {start_ref} in {monolith_root}"
+        )
+    return result.stdout.strip()
+
+
+def reset_slot(slot_path: Path, start_commit: str) -> None:
+    """Return one slot to a pristine detached checkout of `start_commit`.
+
+    Pass a SHA from `resolve_start_commit`, not a symbolic ref. Initialized
+    submodules are moved to the gitlinks of the new commit; uninitialized ones
+    stay that way.
+
+    `git clean -ffd` intentionally keeps ignored files. Dependency caches such
+    as `node_modules/` or `.venv/` are exactly the warm state that makes a
+    pooled slot cheaper than a fresh worktree, and they are not review input.
+    """
+
+    run_checked(
+        ["git", "checkout", "--force", "--detach", start_commit],
+        slot_path,
+        f"Failed to check out {start_commit} in pool slot {slot_path}",
+    )
+    run_checked(
+        ["git", "clean", "-ffdq"],
+        slot_path,
+        f"Failed to clean pool slot {slot_path}",
+    )
+    # Without `--init`, only submodules the slot already has are updated.
+    run_checked(
+        ["git", "submodule", "update", "--force", "--checkout", "--recursive"],
+        slot_path,
+        f"Failed to move submodules to {start_commit} in pool slot {slot_path}",
+    )
+    run_checked(
+        [
+            "git",
+            "submodule",
+            "foreach",
+            "--quiet",
+            "git reset --hard --quiet && git clean -ffdq",
+        ],
+        slot_path,
+        f"Failed to clean submodules in pool slot {slot_path}",
+    )
+
+
+def is_pool_slot(pool_dir: Path, path: Path) -> bool:
+    resolved_pool_dir = pool_dir.expanduser().resolve()
+    return path.resolve().parent == resolved_pool_dir and path.name.startswith(
+        POOL_SLOT_PREFIX
+    )
+
+
+def warm_pool(
+    monolith_root: Path,
+    pool_dir: Path,
+    size: int,
+    start_ref: str,
+    submodule_paths: tuple[str, ...],
+    jobs: int = DEFAULT_SUBMODULE_JOBS,
+) -> list[str]:
+    """Create missing slots until the pool holds `size` worktrees."""
+
+    created: list[str] = []
+    with pool_lock(pool_dir):
+        state = read_pool_state(pool_dir)
+        for index in range(1, size + 1):
+            slot_name = f"{POOL_SLOT_PREFIX}{index:02d}"
+            slot_path = pool_dir / slot_name
+            if slot_name in state["slots"] and slot_path.exists():
+                continue
+            run_checked(
+                ["git", "worktree", "add", "--detach", str(slot_path), start_ref],
+                monolith_root,
+                f"Failed to create pool slot {slot_path}",
+            )
+            initialize_submodules(slot_path, submodule_paths, monolith_root, jobs)
+            state["slots"][slot_name] = {
+                "slot_path": str(slot_path),
+                "leased_to": None,
+                "leased_at_utc": None,
+                "start_ref": start_ref,
+            }
+            created.append(str(slot_path))
+        write_pool_state(pool_dir, state)
+    if created:
+        invalidate_probes()
+    return created
+
+
+def lease_pool_slot(pool_dir: Path, worktree_path: Path, start_commit: str) -> Path:
+    """Lease one idle slot to `worktree_path` and return the slot path.
+
+    `start_commit` must already be resolved in the monolith root.
+
+    The caller is expected to initialize the batch submodules afterwards; the
+    slot already has them materialized, so that step only moves gitlinks.
+    """
+
+    resolved_pool_dir = pool_dir.expanduser().resolve()
+    with pool_lock(resolved_pool_dir):
+        state = read_pool_state(resolved_pool_dir)
+        for slot_name in sorted(state["slots"]):
+            slot = state["slots"][slot_name]
+            slot_path = Path(slot["slot_path"])
+            if not slot_path.exists() or lease_is_live(slot):
+                continue
+            reset_slot(slot_path, start_commit)
+            worktree_path.parent.mkdir(parents=True, exist_ok=True)
+            worktree_path.symlink_to(slot_path, target_is_directory=True)
+            slot["leased_to"] = str(worktree_path)
+            slot["leased_at_utc"] = utc_now()
+            slot["start_ref"] = start_commit
+            write_pool_state(resolved_pool_dir, state)
+            return slot_path
+    raise click.ClickException(
+        f"No idle worktree in pool {resolved_pool_dir}. Warm more slots with "
+        "`worktree_pool.py warm` or release finished batches."
+    )
+
+
+def release_pool_slot(pool_dir: Path, worktree_path: Path) -> Path:
+    """Unlink one batch path from its slot and hand the slot back."""
+
+    resolved_pool_dir = pool_dir.expanduser().resolve()
+    with pool_lock(resolved_pool_dir):
+        state = read_pool_state(resolved_pool_dir)
+        for slot in state["slots"].values():
+            if slot.get("leased_to") != str(worktree_path):
+                continue
+            slot_path = Path(slot["slot_path"])
+            if worktree_path.is_symlink():
+                worktree_path.unlink()
+            run_checked(
+                ["git", "clean", "-ffdq"],
+                slot_path,
+                f"Failed to clean pool slot {slot_path}",
+            )
+            slot["leased_to"] = None
+            slot["leased_at_utc"] = None
+            write_pool_state(resolved_pool_dir, state)
+            return slot_path
+    raise click.ClickException(f"{worktree_path} does not hold a pool lease.")
+
+
+def absolute_link_path(path: Path) -> Path:
+    """Resolve the parent but keep the leaf, so batch symlinks stay visible."""
+
+    expanded = path.expanduser()
+    return expanded.parent.resolve() / expanded.name
+
+
+@click.group()
+def cli() -> None:
+    """Manage pre-warmed detached review worktrees."""
+
+
+@cli.command("warm")
+@click.option(
+    "--monolith-root", type=click.Path(path_type=Path, file_okay=False), required=True
+)
+@click.option(
+    "--pool-dir", type=click.Path(path_type=Path, file_okay=False), required=True
+)
+@click.option("--size", type=click.IntRange(min=1), default=2, show_default=True)
+@click.option("--start-ref", default="HEAD", show_default=True)
+@click.option(
+    "--submodule-path",
+    "submodule_paths",
+    multiple=True,
+    help="Repeat for each submodule path every slot should have initialized.",
+)
+@click.option(
+    "--submodule-jobs",
+    type=click.IntRange(min=1),
+    default=DEFAULT_SUBMODULE_JOBS,
+    show_default=True,
+)
+def warm_command(
+    monolith_root: Path,
+    pool_dir: Path,
+    size: int,
+    start_ref: str,
+    submodule_paths: tuple[str, ...],
+    submodule_jobs: int,
+) -> None:
+    """Create missing pool slots ahead of time, off the batch critical path."""
+
+    root = monolith_root.expanduser().resolve()
+    resolved_pool_dir = pool_dir.expanduser().resolve()
+    created = warm_pool(
+        root,
+        resolved_pool_dir,
+        size,
+        start_ref,
+        tuple(dict.fromkeys(submodule_paths)),
+        submodule_jobs,
+    )
+    payload = {
+        "pool_dir": str(resolved_pool_dir),
+        "created": created,
+        "size": size,
+    }
+    click.echo(json.dumps(payload, indent=2, sort_keys=True))
+
+
+@cli.command("release")
+@click.option(
+    "--pool-dir", type=click.Path(path_type=Path, file_okay=False), required=True
+)
+@click.option("--worktree-path", type=click.Path(path_type=Path), required=True)
+def release_command(pool_dir: Path, worktree_path: Path) -> None:
+    """Return one leased slot to the pool once its batch is finished."""
+
+    link_path = absolute_link_path(worktree_path)
+    slot_path = release_pool_slot(pool_dir, link_path)
+    payload = {"released": str(link_path), "slot_path": str(slot_path)}
+    click.echo(json.dumps(payload, indent=2, sort_keys=True))
+
+
+@cli.command("status")
+@click.option(
+    "--pool-dir", type=click.Path(path_type=Path, file_okay=False), required=True
+)
+def status_command(pool_dir: Path) -> None:
+    """Show which slots are idle and which batch holds each lease."""
+
+    resolved_pool_dir = pool_dir.expanduser().resolve()
+    with pool_lock(resolved_pool_dir):
+        state = read_pool_state(resolved_pool_dir)
+    slots = [
+        {**slot, "slot": slot_name, "live": lease_is_live(slot)}
+        for slot_name, slot in sorted(state["slots"].items())
+    ]
+    payload = {
+        "pool_dir": str(resolved_pool_dir),
+        "idle": sum(1 for slot in slots if not slot["live"]),
+        "slots": slots,
+    }
+    click.echo(json.dumps(payload, indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    cli()
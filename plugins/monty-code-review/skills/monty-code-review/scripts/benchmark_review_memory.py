@@ -0,0 +1,188 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#   "click>=8.1,<9",
+# ]
+# ///
+"""Measure review-memory write throughput for each durability mode.
+
+Why this helper exists:
+- `record-review --durability` trades crash safety for fsync cost, and that
+  cost depends almost entirely on the filesystem underneath the memory root
+- tmpfs makes fsync free while ext4 on a real disk does not, so one number
+  does not describe both
+
+Mental model:
+    for each root directory (by default /dev/shm plus one disk-backed dir)
+        for each durability mode
+            write N reviews into a fresh scope, in-process
+            -> reviews/sec
+
+Reviews are written through `record_reviews_in_scope`, so process startup is
+excluded and only the storage path is measured. `batched` commits groups of
+`--batch-size` reviews per lock acquisition; the other modes commit one
+review at a time, as separate `record-review` calls would.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import TypedDict
+
+import click
+
+import review_memory as memory
+
+
+class BenchmarkResult(TypedDict):
+    root: str
+    filesystem: str
+    durability: str
+    reviews: int
+    seconds: float
+    reviews_per_second: float
+
+
+def filesystem_type(path: Path) -> str:
+    """Return the mount type holding ``path`` from /proc/self/mounts, if any."""
+
+    try:
+        mounts = Path("/proc/self/mounts").read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return "unknown"
+    resolved = str(path.resolve())
+    best_match = ("", "unknown")
+    for line in mounts:
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        mount_point, fs_type = fields[1], fields[2]
+        inside = resolved == mount_point or resolved.startswith(
+            mount_point.rstrip("/") + "/"
+        )
+        if inside and len(mount_point) >= len(best_match[0]):
+            best_match = (mount_point, fs_type)
+    return best_match[1]
+
+
+def benchmark_review(index: int) -> memory.ReviewInput:
+    return memory.parse_review_input(
+        {
+            "head_sha": f"{index:040x}",
+            "history_status": "linear",
+            "repo_review_file": "docs/code_reviews/benchmark_review.md",
+            "recommendation": "comment",
+            "touched_paths": ["app/service.py", "app/views.py"],
+            # Resolve the previous finding so state size stays constant and
+            # the numbers reflect storage cost rather than state growth.
+            "findings": {
+                "new": [{"finding_id": f"bench|app/service.py|case_{index}"}],
+                "carried_forward": [],
+                "resolved": [{"finding_id": f"bench|app/service.py|case_{index - 1}"}],
+            },
+        }
+    )
+
+
+def run_mode(
+    root: Path, durability: memory.Durability, review_count: int, batch_size: int
+) -> BenchmarkResult:
+    with tempfile.TemporaryDirectory(dir=root) as temp_dir:
+        # Blobs land under the storage root, so point it at the benchmark dir.
+        os.environ["MONTY_REVIEW_MEMORY_HOME"] = temp_dir
+        scope_dir = Path(temp_dir) / "targets" / f"bench-{durability}"
+        memory.ensure_dir(scope_dir)
+        memory.atomic_write_json(
+            memory.state_path(scope_dir),
+            memory.default_state(f"bench/{durability}", f"bench-{durability}", None),
+        )
+        memory.ensure_reviews_file(scope_dir)
+        reviews = [benchmark_review(index) for index in range(review_count)]
+        group_size = batch_size if durability == "batched" else 1
+
+        started_at = time.perf_counter()
+        for start in range(0, review_count, group_size):
+            memory.record_reviews_in_scope(
+                scope_dir,
+                reviews[start : start + group_size],
+                durability=durability,
+            )
+        seconds = time.perf_counter() - started_at
+    return {
+        "root": str(root),
+        "filesystem": filesystem_type(root),
+        "durability": durability,
+        "reviews": review_count,
+        "seconds": round(seconds, 4),
+        "reviews_per_second": round(review_count / seconds, 1),
+    }
+
+
+def default_roots() -> list[Path]:
+    """Return one tmpfs root and one disk-backed root, where they exist.
+
+    $TMPDIR is often tmpfs too, so the disk-backed root is the first of
+    $TMPDIR, /var/tmp, and the home directory whose mount is not tmpfs.
+    """
+
+    roots: list[Path] = []
+    shm = Path("/dev/shm")
+    if shm.is_dir() and filesystem_type(shm) == "tmpfs":
+        roots.append(shm)
+    for candidate in (Path(tempfile.gettempdir()), Path("/var/tmp"), Path.home()):
+        if candidate.is_dir() and filesystem_type(candidate) not in {"tmpfs", "unknown"}:
+            roots.append(candidate)
+            break
+    return roots
+
+
+@click.command()
+@click.option(
+    "--root",
+    "roots",
+    multiple=True,
+    type=click.Path(path_type=Path, file_okay=False, exists=True),
+    help=(
+        "Directory to benchmark in. Repeatable. Defaults to /dev/shm and the "
+        "first of $TMPDIR, /var/tmp, and $HOME that is not tmpfs."
+    ),
+)
+@click.option(
+    "--reviews",
+    "review_count",
+    type=click.IntRange(min=1),
+    default=200,
+    show_default=True,
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=20,
+    show_default=True,
+    help="Reviews per group commit in batched mode.",
+)
+def main(roots: tuple[Path, ...], review_count: int, batch_size: int) -> None:
+    """Print reviews/sec per durability mode and root as JSON."""
+
+    selected_roots = list(roots) or default_roots()
+    if not selected_roots:
+        raise click.UsageError(
+            "No tmpfs or disk-backed default root was found; pass --root."
+        )
+    for root in selected_roots:
+        click.echo(f"{root}: {filesystem_type(root)}", err=True)
+    results = [
+        run_mode(root, durability, review_count, batch_size)
+        for root in selected_roots
+        for durability in memory.DURABILITY_MODES
+    ]
+    click.echo(json.dumps(results, indent=2, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
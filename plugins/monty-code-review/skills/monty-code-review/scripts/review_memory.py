@@ -7,18 +7,31 @@
 # ///
 """JSON-first review memory helper for ``monty-code-review``.
 
-This is intentionally a small v1 helper.
-
-What it does:
-- resolve one deterministic review-memory scope
-- summarize the compact state a new review needs
-- persist one completed review pass
+Each scope (one PR or branch) is one compact ``state.json`` plus an
+append-only review log: the active ``reviews.jsonl`` and the gzip segments
+older reviews are sealed into. Large review payloads live in a shared
+SHA-256 blob store. Offset indexes, the report index, and the cross-scope
+path index are derived data that keep reads cheap as histories grow.
+
+Commands:
+- ``resolve-scope``: create or refresh one deterministic scope directory
+- ``summarize-context``: the compact state a new review needs
+- ``record-review`` / ``record-reviews``: persist one review pass, or bulk
+  NDJSON across scopes, under a chosen durability mode
+- ``read-reviews`` / ``diff-reviews``: random access and finding lifecycle
+  over the history, via ``reviews.idx`` and compressed segments
+- ``report``: open findings across every stored scope, read-only
+- ``path-history``: prior reviews and findings for a file, across scopes
+- ``read-blob``: one blob from the shared content-addressed store
+
+Writers take a per-scope ``flock``; readers take it shared or read a
+consistent snapshot without it.
 
 What it intentionally does not do:
 - multi-target bundles
 - separate changelog files
 - comment-thread persistence
-- reset/archive workflows
+- deleting or resetting a scope (remove its directory by hand)
 
 The goal is to keep the durable state simple enough that future reviewers can
 understand it quickly and future agents can load it cheaply.
@@ -26,15 +39,24 @@ understand it quickly and future agents can load it cheaply.
 
 from __future__ import annotations
 
+import fcntl
+import gzip
 import hashlib
 import json
+import mmap
 import os
 import re
+import signal
+import struct
 import sys
+import threading
 import time
-from collections.abc import Callable, Iterator, Mapping, Sequence
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path, PurePosixPath, PureWindowsPath
 from tempfile import NamedTemporaryFile
 from typing import Literal, NotRequired, TypedDict
@@ -45,10 +67,39 @@ import click
 SCHEMA_VERSION = 1
 LOCK_TIMEOUT_SECONDS = 10.0
 LOCK_POLL_INTERVAL_SECONDS = 0.1
-LOCK_STALE_SECONDS = 300
+SNAPSHOT_READ_ATTEMPTS = 3
+# One fixed-width entry per review in reviews.idx: review number, byte offset
+# into reviews.jsonl, and row length. Entry N lives at (N - 1) * size.
+REVIEW_INDEX_ENTRY = struct.Struct("<QQQ")
+# The active reviews.jsonl is sealed into a compressed segment once it holds
+# this many reviews or bytes.
+DEFAULT_SEGMENT_MAX_REVIEWS = 100
+DEFAULT_SEGMENT_MAX_BYTES = 1024 * 1024
+DURABILITY_MODES = ("strict", "batched", "relaxed")
+REPORT_INDEX_VERSION = 1
+DEFAULT_REPORT_JOBS = 8
+BLOB_DIGEST_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+PATH_INDEX_SHARD_HEX_DIGITS = 2
+# Keys a posting must carry to be deduplicated and sorted; appends are never
+# fsynced, so a crash can leave a partial row behind.
+PATH_POSTING_KEYS = ("scope_id", "review_number", "created_at_utc")
+DEFAULT_PATH_HISTORY_LIMIT = 20
+# Review row fields stored as JSON blobs and referenced by ``<field>_sha256``.
+REVIEW_BLOB_FIELDS = ("commits", "touched_paths")
+# Buckets for how many review passes a finding has stayed open, inclusive.
+FINDING_AGE_BUCKETS: tuple[tuple[str, int, int | None], ...] = (
+    ("1", 1, 1),
+    ("2", 2, 2),
+    ("3-5", 3, 5),
+    ("6+", 6, None),
+)
 HISTORY_STATUS_VALUES = {"linear", "rewritten", "uncertain"}
 
 JsonObject = dict[str, object]
+# strict: fsync every file and directory entry per review, in commit order.
+# batched: the same ordering, but one commit for a whole group of reviews.
+# relaxed: no fsync; a crash keeps the log consistent but may lose reviews.
+Durability = Literal["strict", "batched", "relaxed"]
 
 
 class BranchContext(TypedDict):
@@ -104,14 +155,47 @@ class ReviewRecord(TypedDict):
     merge_base_sha: str | None
     history_status: str
     repo_review_file: str
+    # SHA-256 of the review markdown in the blob store, when it was captured.
+    review_markdown_sha256: str | None
     recommendation: str
     review_basis: str | None
     summary_points: list[str]
-    commits: list[CommitRecord]
-    touched_paths: list[str]
+    # Rows written before the blob store keep ``commits`` and
+    # ``touched_paths`` inline instead of these references.
+    commits_sha256: str
+    touched_paths_sha256: str
     findings: ReviewGroups
 
 
+class ReviewBlobs(TypedDict):
+    """Blob store digests for the bulky parts of one review row."""
+
+    review_markdown_sha256: str | None
+    commits_sha256: str
+    touched_paths_sha256: str
+
+
+class PathFinding(TypedDict):
+    """One finding raised against a path in one review, with its status there."""
+
+    finding_id: str
+    severity: str | None
+    summary: str | None
+    status: str
+
+
+class PathPosting(TypedDict):
+    """One path-index row: a review that touched a path or raised a finding on it."""
+
+    path: str
+    scope_id: str
+    scope_dir: str
+    review_number: int
+    created_at_utc: str
+    head_sha: str
+    findings: list[PathFinding]
+
+
 class StateRecord(TypedDict):
     """Current compact state for one deterministic review target."""
 
@@ -128,6 +212,39 @@ class StateRecord(TypedDict):
     history_status: str
     next_review_number: int
     open_findings: list[OpenFinding]
+    # Byte length of reviews.jsonl this state covers. It only grows, so it also
+    # serves as the snapshot generation for lock-free readers. Absent on
+    # scopes written before it existed, until their next record-review.
+    reviews_log_bytes: NotRequired[int]
+    # Highest review number stored in sealed segments; later reviews live in
+    # the active reviews.jsonl. Absent until the first rotation.
+    sealed_through_review: NotRequired[int]
+
+
+class ReviewInput(TypedDict):
+    """One validated record-review payload, before it is numbered."""
+
+    head_sha: str
+    merge_base_sha: str | None
+    history_status: str
+    repo_review_file: str
+    review_markdown: str | None
+    recommendation: str
+    review_basis: str | None
+    summary_points: list[str]
+    commits: list[CommitRecord]
+    touched_paths: list[str]
+    findings: ReviewGroups
+
+
+class SegmentRecord(TypedDict):
+    """One sealed, compressed slice of the reviews log listed in the manifest."""
+
+    file: str
+    first_review: int
+    last_review: int
+    bytes: int
+    compressed_bytes: int
 
 
 class CompactFinding(TypedDict, total=False):
@@ -141,6 +258,18 @@ class CompactFinding(TypedDict, total=False):
     last_seen_review: int
 
 
+class ScopeReport(TypedDict):
+    """Per-scope facts the cross-scope report aggregates."""
+
+    scope_dir: str
+    scope_id: str
+    repo: str
+    next_review_number: int
+    last_synced_at_utc: str | None
+    latest_recommendation: str | None
+    open_findings: list[CompactFinding]
+
+
 def utc_now() -> str:
     """Return a canonical UTC timestamp for persistence."""
 
@@ -229,8 +358,41 @@ def ensure_dir(path: Path) -> None:
         pass
 
 
-def atomic_write_json(path: Path, payload: object) -> None:
-    """Write JSON via a temp file so readers never see a half-written object."""
+def fsync_directory(path: Path) -> None:
+    """Flush a directory so a rename or newly created file survives a crash."""
+
+    descriptor = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+def atomic_write_bytes(path: Path, payload: bytes, *, sync: bool = True) -> None:
+    """Write binary data via a temp file so readers never see a partial file."""
+
+    ensure_dir(path.parent)
+    with NamedTemporaryFile("wb", delete=False, dir=path.parent) as handle:
+        handle.write(payload)
+        if sync:
+            handle.flush()
+            os.fsync(handle.fileno())
+        temp_path = Path(handle.name)
+    os.replace(temp_path, path)
+    if sync:
+        fsync_directory(path.parent)
+    try:
+        path.chmod(0o600)
+    except OSError:
+        pass
+
+
+def atomic_write_json(path: Path, payload: object, *, sync: bool = True) -> None:
+    """Write JSON via a temp file so readers never see a half-written object.
+
+    With ``sync`` the data is fsynced before the rename and the directory
+    after it, so the new file is durable and not only atomic.
+    """
 
     ensure_dir(path.parent)
     with NamedTemporaryFile(
@@ -239,27 +401,34 @@ def atomic_write_json(path: Path, payload: object) -> None:
         dir=path.parent,
         encoding="utf-8",
     ) as handle:
-        json.dump(payload, handle, indent=2, sort_keys=True)
-        handle.write("\n")
-        handle.flush()
-        os.fsync(handle.fileno())
+        # One write call: json.dump would push every token through the temp
+        # file wrapper separately.
+        handle.write(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+        if sync:
+            handle.flush()
+            os.fsync(handle.fileno())
         temp_path = Path(handle.name)
     os.replace(temp_path, path)
+    if sync:
+        fsync_directory(path.parent)
     try:
         path.chmod(0o600)
     except OSError:
         pass
 
 
-def append_jsonl(path: Path, rows: Sequence[object]) -> None:
-    """Append newline-delimited JSON records without rewriting prior history."""
+def append_bytes(path: Path, payload: bytes, *, sync: bool = True) -> None:
+    """Append to a log file without rewriting prior history."""
 
     ensure_dir(path.parent)
-    with path.open("a", encoding="utf-8") as handle:
-        for row in rows:
-            handle.write(json.dumps(row, sort_keys=True) + "\n")
-        handle.flush()
-        os.fsync(handle.fileno())
+    created = not path.exists()
+    with path.open("ab") as handle:
+        handle.write(payload)
+        if sync:
+            handle.flush()
+            os.fsync(handle.fileno())
+    if sync and created:
+        fsync_directory(path.parent)
     try:
         path.chmod(0o600)
     except OSError:
@@ -279,21 +448,36 @@ def read_json_object(path: Path, *, default: JsonObject | None = None) -> JsonOb
     return dict(loaded)
 
 
-def read_jsonl_tail(path: Path, limit: int) -> list[JsonObject]:
-    """Read only the newest JSONL rows needed for a compact context summary."""
+def read_jsonl_tail(
+    path: Path, limit: int, *, end: int | None = None
+) -> list[JsonObject]:
+    """Read only the newest JSONL rows needed for a compact context summary.
 
-    if not path.exists() or limit <= 0:
+    ``end`` bounds the read to a committed byte offset so rows appended after
+    that point are ignored.
+    """
+
+    if not path.exists() or limit <= 0 or end == 0:
         return []
     chunk_size = 8192
-    buffer = b""
+    chunks: list[bytes] = []
+    newline_count = 0
     with path.open("rb") as handle:
         handle.seek(0, os.SEEK_END)
         position = handle.tell()
-        while position > 0 and buffer.count(b"\n") <= limit:
+        if end is not None:
+            if position < end:
+                raise ValueError(f"{path} is shorter than its recorded length")
+            position = end
+        # Count newlines per chunk and join once, so the scan stays linear.
+        while position > 0 and newline_count <= limit:
             read_size = min(chunk_size, position)
             position -= read_size
             handle.seek(position)
-            buffer = handle.read(read_size) + buffer
+            chunk = handle.read(read_size)
+            chunks.append(chunk)
+            newline_count += chunk.count(b"\n")
+    buffer = b"".join(reversed(chunks))
 
     rows: list[JsonObject] = []
     for line in buffer.splitlines()[-limit:]:
@@ -364,6 +548,14 @@ def object_dict(value: object, label: str) -> JsonObject:
     return dict(value)
 
 
+def object_list(value: object, label: str) -> list[object]:
+    """Require a JSON array from an unknown value."""
+
+    if not isinstance(value, list):
+        raise ValueError(f"expected JSON array for '{label}'")
+    return list(value)
+
+
 def object_dict_list(value: object, label: str) -> list[JsonObject]:
     """Require a list of JSON objects from an unknown value."""
 
@@ -591,6 +783,12 @@ def normalize_state(
     branch_context = normalize_branch_context(raw.get("branch_context"))
     if branch_context is not None:
         state["branch_context"] = branch_context
+    reviews_log_bytes = optional_int(raw, "reviews_log_bytes")
+    if reviews_log_bytes is not None:
+        state["reviews_log_bytes"] = reviews_log_bytes
+    sealed_through_review = optional_int(raw, "sealed_through_review")
+    if sealed_through_review is not None:
+        state["sealed_through_review"] = sealed_through_review
     return state
 
 
@@ -625,6 +823,7 @@ def default_state(
         "history_status": "uncertain",
         "next_review_number": 1,
         "open_findings": [],
+        "reviews_log_bytes": 0,
     }
     if branch_context is not None:
         state["branch_context"] = branch_context
@@ -632,46 +831,72 @@ def default_state(
 
 
 @contextmanager
-def scope_lock(scope_dir: Path, *, create: bool = True) -> Iterator[None]:
-    """Serialize per-scope access without always creating missing scope dirs."""
+def scope_lock(
+    scope_dir: Path,
+    *,
+    create: bool = True,
+    shared: bool = False,
+) -> Iterator[None]:
+    """Lock one scope with ``flock``: shared for readers, exclusive for writers.
+
+    The kernel drops the lock when the holding process exits, so a crashed
+    writer never leaves a stale lock behind. The ``.lock`` file itself is
+    never removed: unlinking it would let two processes lock different inodes.
+    """
 
     lock_path = scope_dir / ".lock"
     if create:
         ensure_dir(scope_dir)
     elif not scope_dir.is_dir():
         raise FileNotFoundError(f"scope directory does not exist: {scope_dir}")
-    deadline = time.monotonic() + LOCK_TIMEOUT_SECONDS
-    while True:
-        try:
-            descriptor = os.open(
-                lock_path,
-                os.O_CREAT | os.O_EXCL | os.O_WRONLY,
-                0o600,
-            )
-            os.write(
-                descriptor,
-                json.dumps(
-                    {"pid": os.getpid(), "created_at_utc": utc_now()},
-                    sort_keys=True,
-                ).encode("utf-8"),
-            )
-            os.close(descriptor)
-            break
-        except FileExistsError:
-            if stale_lock_recovered(lock_path):
-                continue
-            if time.monotonic() >= deadline:
-                raise TimeoutError(f"timed out waiting for lock: {lock_path}")
-            time.sleep(LOCK_POLL_INTERVAL_SECONDS)
+    descriptor = os.open(lock_path, os.O_CREAT | os.O_RDWR, 0o600)
     try:
+        acquire_flock(
+            descriptor,
+            fcntl.LOCK_SH if shared else fcntl.LOCK_EX,
+            lock_path,
+        )
         yield
     finally:
-        try:
-            lock_path.unlink()
-        except FileNotFoundError:
-            pass
+        # Closing the descriptor releases the lock.
+        os.close(descriptor)
+
+
+def acquire_flock(descriptor: int, operation: int, lock_path: Path) -> None:
+    """Take ``flock`` within ``LOCK_TIMEOUT_SECONDS``, blocking in the kernel."""
+
+    try:
+        fcntl.flock(descriptor, operation | fcntl.LOCK_NB)
+        return
+    except BlockingIOError:
+        pass
+    timeout_error = TimeoutError(f"timed out waiting for lock: {lock_path}")
+
+    if threading.current_thread() is not threading.main_thread():
+        # Signals only reach the main thread, so other threads poll instead.
+        deadline = time.monotonic() + LOCK_TIMEOUT_SECONDS
+        while True:
+            time.sleep(LOCK_POLL_INTERVAL_SECONDS)
+            try:
+                fcntl.flock(descriptor, operation | fcntl.LOCK_NB)
+                return
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise timeout_error from None
+
+    def on_alarm(signum: int, frame: object) -> None:
+        raise timeout_error
+
+    previous_handler = signal.signal(signal.SIGALRM, on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, LOCK_TIMEOUT_SECONDS)
+    try:
+        fcntl.flock(descriptor, operation)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
 
 
+@lru_cache(maxsize=256)
 def canonical_scope_id(
     *,
     provider: Literal["github", "git"],
@@ -684,7 +909,19 @@ def canonical_scope_id(
     base_branch: str | None,
     merge_base_sha: str | None,
 ) -> tuple[str, str, BranchContext | None]:
-    """Build the stable identity used to store and re-find review memory."""
+    """Build the stable identity used to store and re-find review memory.
+
+    Results are memoized per process, so bulk ingestion that names the same
+    scope on every line validates and hashes it once. For git scopes that is
+    about 50us a line, roughly a tenth of batched ``record-reviews``. Callers
+    must treat the returned branch context as read-only.
+
+    There is deliberately no on-disk args-to-scope_dir cache. Looking one up
+    (hash the args, open and parse a small JSON file) costs about 35us, more
+    than canonicalizing a github scope (about 4us) and close to a git scope
+    (about 50us). Either is noise next to the ~150ms ``resolve-scope``
+    process, most of which is interpreter startup and imports.
+    """
 
     if provider == "github":
         if owner is None or repo is None or pull_number is None:
@@ -741,6 +978,24 @@ def reviews_path(scope_dir: Path) -> Path:
     return scope_dir / "reviews.jsonl"
 
 
+def reviews_index_path(scope_dir: Path) -> Path:
+    """Return the sidecar offset index for the reviews log."""
+
+    return scope_dir / "reviews.idx"
+
+
+def segments_dir(scope_dir: Path) -> Path:
+    """Return the directory holding sealed, compressed log segments."""
+
+    return scope_dir / "segments"
+
+
+def segment_manifest_path(scope_dir: Path) -> Path:
+    """Return the manifest that lists sealed segments in review order."""
+
+    return segments_dir(scope_dir) / "manifest.json"
+
+
 def require_state(scope_dir: Path) -> StateRecord:
     """Load one resolved scope and fail closed if it does not exist yet."""
 
@@ -756,220 +1011,1318 @@ def require_state(scope_dir: Path) -> StateRecord:
     return normalize_state(raw, scope_id, scope_slug)
 
 
-def ensure_reviews_file(scope_dir: Path) -> None:
-    """Create the append-only reviews log if it does not exist yet."""
+def read_snapshot(scope_dir: Path) -> tuple[StateRecord, list[JsonObject]] | None:
+    """Read state plus the latest review it covers, or None when they disagree.
 
-    path = reviews_path(scope_dir)
-    if not path.exists():
-        ensure_dir(path.parent)
-        path.touch(mode=0o600)
+    ``state.json`` is swapped atomically after the log append, so the state a
+    reader sees always points at rows that are already on disk. A mismatch
+    means the log changed underneath the reader and the caller should retry.
+    """
 
+    state = require_state(scope_dir)
+    log_bytes = state.get("reviews_log_bytes")
+    if log_bytes is None:
+        return None
+    try:
+        rows = read_latest_review(scope_dir, state, log_bytes)
+    except (ValueError, FileNotFoundError):
+        return None
+    latest_number = rows[-1].get("review_number") if rows else 0
+    if latest_number != state["next_review_number"] - 1:
+        return None
+    return state, rows
 
-def process_is_alive(pid: int) -> bool:
-    """Return whether a recorded PID still appears to be alive."""
 
-    try:
-        os.kill(pid, 0)
-    except ProcessLookupError:
-        return False
-    except PermissionError:
-        return True
-    return True
+def load_snapshot(scope_dir: Path) -> tuple[StateRecord, list[JsonObject]]:
+    """Load a consistent summary snapshot, taking the shared lock only as a fallback."""
 
+    for _attempt in range(SNAPSHOT_READ_ATTEMPTS):
+        snapshot = read_snapshot(scope_dir)
+        if snapshot is not None:
+            return snapshot
+    # Older scopes have no recorded log length yet, and a log that keeps
+    # disagreeing is read as-is once writers are held off.
+    with scope_lock(scope_dir, create=False, shared=True):
+        state = require_state(scope_dir)
+        rows = read_latest_review(scope_dir, state, state.get("reviews_log_bytes"))
+    return state, rows
 
-def stale_lock_recovered(lock_path: Path) -> bool:
-    """Remove a stale lock when the owner is gone or the lock is too old."""
 
-    try:
-        age_seconds = time.time() - lock_path.stat().st_mtime
-    except FileNotFoundError:
-        return True
+def read_latest_review(
+    scope_dir: Path, state: StateRecord, log_bytes: int | None
+) -> list[JsonObject]:
+    """Read the newest review row, looking into sealed segments when needed."""
 
-    pid: int | None = None
-    try:
-        raw = json.loads(lock_path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError):
-        raw = None
-
-    if isinstance(raw, dict):
-        raw_pid = raw.get("pid")
-        if isinstance(raw_pid, bool):
-            pid = None
-        elif isinstance(raw_pid, int):
-            pid = raw_pid
-
-    if pid is not None:
-        if process_is_alive(pid):
-            return False
-        stale = True
-    else:
-        stale = age_seconds > LOCK_STALE_SECONDS
+    sealed_through = state.get("sealed_through_review", 0)
+    if log_bytes is None or log_bytes > 0 or sealed_through == 0:
+        return read_jsonl_tail(reviews_path(scope_dir), 1, end=log_bytes)
+    # Right after a rotation the active log is empty, so the newest review is
+    # the last sealed one.
+    return list(iter_sealed_reviews(scope_dir, sealed_through, sealed_through))
 
-    if not stale:
-        return False
 
+def scan_review_offsets(path: Path, end: int) -> list[tuple[int, int, int]]:
+    """Rebuild index entries with one linear pass over the committed log."""
+
+    entries: list[tuple[int, int, int]] = []
+    if not path.exists():
+        return entries
+    offset = 0
+    with path.open("rb") as handle:
+        for line in handle:
+            if offset + len(line) > end:
+                break
+            if line.strip():
+                review_number = json.loads(line.decode("utf-8")).get("review_number")
+                if isinstance(review_number, int) and not isinstance(
+                    review_number, bool
+                ):
+                    entries.append((review_number, offset, len(line)))
+            offset += len(line)
+    return entries
+
+
+def sync_review_index(scope_dir: Path, log_bytes: int, *, sync: bool = True) -> None:
+    """Make the offset index cover exactly the committed log, rebuilding if needed.
+
+    Callers must hold the exclusive scope lock.
+    """
+
+    path = reviews_index_path(scope_dir)
     try:
-        lock_path.unlink()
+        data = path.read_bytes()
     except FileNotFoundError:
-        return True
-    return True
+        data = b""
+    whole_entries = data[: len(data) - len(data) % REVIEW_INDEX_ENTRY.size]
+    entries = [
+        entry
+        for entry in REVIEW_INDEX_ENTRY.iter_unpack(whole_entries)
+        if entry[1] + entry[2] <= log_bytes
+    ]
+    covered_bytes = entries[-1][1] + entries[-1][2] if entries else 0
+    if covered_bytes != log_bytes:
+        entries = scan_review_offsets(reviews_path(scope_dir), log_bytes)
+    rebuilt = b"".join(REVIEW_INDEX_ENTRY.pack(*entry) for entry in entries)
+    if rebuilt != data:
+        atomic_write_bytes(path, rebuilt, sync=sync)
+
+
+def read_segment_manifest(scope_dir: Path) -> list[SegmentRecord]:
+    """Load the sealed segment list, or an empty list before the first rotation."""
+
+    raw = read_json_object(segment_manifest_path(scope_dir))
+    segments: list[SegmentRecord] = []
+    for item in object_dict_list(raw.get("segments"), "segments"):
+        segments.append(
+            {
+                "file": require_string(item, "file"),
+                "first_review": optional_int(item, "first_review") or 0,
+                "last_review": optional_int(item, "last_review") or 0,
+                "bytes": optional_int(item, "bytes") or 0,
+                "compressed_bytes": optional_int(item, "compressed_bytes") or 0,
+            }
+        )
+    return segments
 
 
-def add_local_display_fields(
-    record: Mapping[str, object],
-    keys: Sequence[str],
-) -> JsonObject:
-    """Augment persisted UTC records with local-time display fields for humans."""
+def seal_active_segment(
+    scope_dir: Path, state: StateRecord, log_bytes: int, *, sync: bool = True
+) -> None:
+    """Move the committed active log into a compressed segment and empty it.
 
-    enriched: JsonObject = dict(record)
-    for key in keys:
-        timestamp = record.get(key)
-        if isinstance(timestamp, str):
-            local_key = key.removesuffix("_utc") + "_local"
-            enriched[local_key] = format_local(timestamp)
-    return enriched
+    Callers must hold the exclusive scope lock. Each step is safe to interrupt:
+    the segment and manifest are written before state points past them, and
+    manifest entries beyond ``sealed_through_review`` are ignored by readers
+    and replaced by the next rotation.
+    """
 
+    sealed_through = state.get("sealed_through_review", 0)
+    first_review = sealed_through + 1
+    last_review = state["next_review_number"] - 1
+    with reviews_path(scope_dir).open("rb") as handle:
+        payload = handle.read(log_bytes)
+    compressed = gzip.compress(payload, mtime=0)
+    segment_name = f"reviews-{first_review:06d}-{last_review:06d}.jsonl.gz"
+    atomic_write_bytes(segments_dir(scope_dir) / segment_name, compressed, sync=sync)
+
+    segments = [
+        segment
+        for segment in read_segment_manifest(scope_dir)
+        if segment["last_review"] <= sealed_through
+    ]
+    segments.append(
+        {
+            "file": segment_name,
+            "first_review": first_review,
+            "last_review": last_review,
+            "bytes": len(payload),
+            "compressed_bytes": len(compressed),
+        }
+    )
+    atomic_write_json(
+        segment_manifest_path(scope_dir),
+        {"schema_version": SCHEMA_VERSION, "segments": segments},
+        sync=sync,
+    )
 
-def compact_open_findings(
-    items: Sequence[OpenFinding], limit: int
-) -> list[CompactFinding]:
-    """Trim open findings to the smallest summary the model usually needs."""
+    state["sealed_through_review"] = last_review
+    state["reviews_log_bytes"] = 0
+    atomic_write_json(state_path(scope_dir), state, sync=sync)
+    for path in (reviews_path(scope_dir), reviews_index_path(scope_dir)):
+        if path.exists():
+            truncate_file(path, 0, sync=sync)
 
-    trimmed: list[CompactFinding] = []
-    for item in items[:limit]:
-        trimmed.append(
-            {
-                "finding_id": item["finding_id"],
-                "severity": item["severity"],
-                "summary": item["summary"],
-                "status": item["status"],
-                "first_seen_review": item["first_seen_review"],
-                "last_seen_review": item["last_seen_review"],
-            }
-        )
-    return trimmed
 
+def iter_sealed_reviews(scope_dir: Path, first: int, last: int) -> Iterator[JsonObject]:
+    """Stream reviews ``first..last`` out of sealed segments, decompressing lazily."""
 
-def normalize_open_findings(
-    incoming: Sequence[ReviewFinding],
-    existing_open: Mapping[str, OpenFinding],
-    review_number: int,
-    status: str,
-) -> dict[str, OpenFinding]:
-    """Normalize findings while preserving when an issue was first seen."""
+    for segment in read_segment_manifest(scope_dir):
+        if segment["last_review"] < first or segment["first_review"] > last:
+            continue
+        with gzip.open(segments_dir(scope_dir) / segment["file"], "rb") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                loaded = json.loads(line.decode("utf-8"))
+                if not isinstance(loaded, dict):
+                    raise ValueError(
+                        f"expected JSON object lines in {segment['file']}"
+                    )
+                review_number = loaded.get("review_number")
+                if isinstance(review_number, int) and first <= review_number <= last:
+                    yield dict(loaded)
+
+
+def review_span(
+    scope_dir: Path, first: int, last: int, log_bytes: int, base: int = 1
+) -> tuple[int, int] | None:
+    """Look up the byte span of reviews ``first..last`` with two index seeks.
+
+    ``base`` is the first review number held in the active log.
+    """
 
-    normalized: dict[str, OpenFinding] = {}
-    for item in incoming:
-        previous = existing_open.get(item["finding_id"])
-        first_seen_review = review_number
-        if previous is not None:
-            first_seen_review = previous["first_seen_review"]
-        normalized[item["finding_id"]] = {
-            "finding_id": item["finding_id"],
-            "first_seen_review": first_seen_review,
-            "last_seen_review": review_number,
-            "status": status,
-            "severity": item["severity"],
-            "summary": item["summary"],
-        }
-    return normalized
+    size = REVIEW_INDEX_ENTRY.size
+    try:
+        with reviews_index_path(scope_dir).open("rb") as handle:
+            handle.seek((first - base) * size)
+            first_entry = handle.read(size)
+            handle.seek((last - base) * size)
+            last_entry = handle.read(size)
+    except FileNotFoundError:
+        return None
+    if len(first_entry) != size or len(last_entry) != size:
+        return None
+    first_number, start, _first_length = REVIEW_INDEX_ENTRY.unpack(first_entry)
+    last_number, last_offset, last_length = REVIEW_INDEX_ENTRY.unpack(last_entry)
+    end = last_offset + last_length
+    if first_number != first or last_number != last or end > log_bytes:
+        return None
+    return start, end
 
 
-def print_json(payload: object) -> None:
-    """Print one pretty JSON object to stdout."""
+def iter_review_range(
+    scope_dir: Path, first: int, last: int, state: StateRecord, log_bytes: int
+) -> Iterator[JsonObject]:
+    """Stream reviews ``first..last`` across sealed segments and the active log."""
 
-    json.dump(payload, sys.stdout, indent=2, sort_keys=True)
-    sys.stdout.write("\n")
+    sealed_through = state.get("sealed_through_review", 0)
+    if first <= sealed_through:
+        yield from iter_sealed_reviews(scope_dir, first, min(last, sealed_through))
+    if last > sealed_through:
+        yield from iter_active_reviews(
+            scope_dir, max(first, sealed_through + 1), last, log_bytes, sealed_through
+        )
 
 
-def read_stdin_json() -> object:
-    """Read one JSON payload from stdin."""
+def iter_active_reviews(
+    scope_dir: Path, first: int, last: int, log_bytes: int, sealed_through: int
+) -> Iterator[JsonObject]:
+    """Stream reviews ``first..last`` one row at a time from the memory-mapped log."""
+
+    span = review_span(scope_dir, first, last, log_bytes, sealed_through + 1)
+    if span is None:
+        # Scopes recorded before the index existed take one linear pass instead.
+        entries = [
+            entry
+            for entry in scan_review_offsets(reviews_path(scope_dir), log_bytes)
+            if first <= entry[0] <= last
+        ]
+        if not entries:
+            return
+        span = (entries[0][1], entries[-1][1] + entries[-1][2])
+    start, end = span
+    with reviews_path(scope_dir).open("rb") as handle, mmap.mmap(
+        handle.fileno(), 0, access=mmap.ACCESS_READ
+    ) as view:
+        view.seek(start)
+        while view.tell() < end:
+            line = view.readline()
+            if not line.strip():
+                continue
+            loaded = json.loads(line.decode("utf-8"))
+            if not isinstance(loaded, dict):
+                raise ValueError(
+                    f"expected JSON object lines in {reviews_path(scope_dir)}"
+                )
+            review_number = loaded.get("review_number")
+            if isinstance(review_number, int) and first <= review_number <= last:
+                yield dict(loaded)
 
-    raw = sys.stdin.read().strip()
-    if not raw:
-        raise ValueError("expected JSON on stdin")
-    return json.loads(raw)
 
+def read_review_range(
+    scope_dir: Path, first: int, last: int, state: StateRecord, log_bytes: int
+) -> list[JsonObject]:
+    """Read reviews ``first..last`` from sealed segments and the active log."""
 
-def command_resolve_scope(
-    *,
-    provider: Literal["github", "git"],
-    host: str,
-    owner: str | None,
-    repo: str | None,
-    pull_number: int | None,
-    repo_key: str | None,
-    branch_name: str | None,
-    base_branch: str | None,
-    merge_base_sha: str | None,
-) -> int:
-    """Create or update the deterministic directory that owns one memory scope."""
+    return list(iter_review_range(scope_dir, first, last, state, log_bytes))
 
-    root = storage_root()
-    ensure_dir(root)
-    targets_root = root / "targets"
-    ensure_dir(targets_root)
 
-    scope_id, scope_slug, branch_context = canonical_scope_id(
-        provider=provider,
-        host=host,
-        owner=owner,
-        repo=repo,
-        pull_number=pull_number,
-        repo_key=repo_key,
-        branch_name=branch_name,
-        base_branch=base_branch,
-        merge_base_sha=merge_base_sha,
-    )
-    scope_hash = short_hash(scope_id)
-    scope_dir = targets_root / f"{scope_slug}--{scope_hash}"
+def committed_review_range(
+    scope_dir: Path, first: int, last: int
+) -> tuple[StateRecord, int]:
+    """Return state plus the committed log length after validating a review range.
 
-    with scope_lock(scope_dir):
-        current_state_path = state_path(scope_dir)
-        if current_state_path.exists():
-            state = require_state(scope_dir)
-        else:
-            state = default_state(scope_id, scope_slug, branch_context)
-        state["updated_at_utc"] = utc_now()
-        if branch_context is not None:
-            state["branch_context"] = branch_context
-        atomic_write_json(current_state_path, state)
-        ensure_reviews_file(scope_dir)
+    Callers hold the shared scope lock: a range can span a segment rotation, so
+    history readers do not use the lock-free snapshot path.
+    """
 
-    response: JsonObject = {
-        "schema_version": SCHEMA_VERSION,
-        "scope_dir": str(scope_dir),
-        "scope_id": scope_id,
-        "scope_kind": "target",
-        "scope_slug": scope_slug,
-        "scope_hash": scope_hash,
-        "display_timezone": local_timezone_name(),
-        "display_utc_offset": local_utc_offset(),
-    }
-    print_json(response)
-    return 0
+    state = require_state(scope_dir)
+    log_bytes = state.get("reviews_log_bytes")
+    if log_bytes is None:
+        reviews_file = reviews_path(scope_dir)
+        log_bytes = reviews_file.stat().st_size if reviews_file.exists() else 0
+    latest_number = state["next_review_number"] - 1
+    if last > latest_number:
+        raise ValueError(
+            f"review {last} does not exist; the latest review is {latest_number}"
+        )
+    return state, log_bytes
 
 
-def command_summarize_context(*, scope_dir: Path, finding_limit: int) -> int:
-    """Return a compact summary so the skill can avoid loading raw history files."""
+def diff_review_rows(rows: Iterable[JsonObject]) -> JsonObject:
+    """Fold a stream of review rows into finding, path, and head-SHA changes.
 
-    resolved_scope_dir = scope_dir.expanduser().resolve()
-    require_state(resolved_scope_dir)
-    with scope_lock(resolved_scope_dir, create=False):
-        state = require_state(resolved_scope_dir)
-        latest_review = None
-        recent_resolved_findings: list[ReviewFinding] = []
-        review_rows = read_jsonl_tail(reviews_path(resolved_scope_dir), 1)
-        if review_rows:
-            latest_review = add_local_display_fields(
-                review_rows[-1],
-                ["created_at_utc"],
-            )
-            latest_findings = normalize_review_groups(review_rows[-1].get("findings"))
-            recent_resolved_findings = latest_findings["resolved"][:finding_limit]
+    The first row is only the baseline: its findings, paths, and head SHA are
+    what later rows are compared against, so a finding it already carried is
+    never reported as introduced. Only per-finding transitions and the two
+    end path sets are kept, so memory grows with the number of distinct
+    findings rather than with the log.
+    """
 
-    last_synced_at_utc = state["last_synced_at_utc"]
-    response: JsonObject = {
+    baseline: dict[str, str] = {}
+    transitions: dict[str, list[JsonObject]] = {}
+    details: dict[str, ReviewFinding] = {}
+    head_changes: list[JsonObject] = []
+    touched_in_range: set[str] = set()
+    first_paths: set[str] | None = None
+    last_paths: set[str] = set()
+    previous_head: str | None = None
+    blob_cache: dict[str, object] = {}
+    for row in rows:
+        review_number = row["review_number"]
+        is_baseline = first_paths is None
+        head_sha = row.get("head_sha")
+        if not is_baseline and head_sha != previous_head:
+            head_changes.append(
+                {
+                    "review_number": review_number,
+                    "head_sha": head_sha,
+                    "history_status": row.get("history_status"),
+                }
+            )
+        previous_head = head_sha if isinstance(head_sha, str) else None
+        last_paths = set(
+            string_list(
+                review_blob_field(row, "touched_paths", blob_cache), "touched_paths"
+            )
+        )
+        groups = normalize_review_groups(row.get("findings"))
+        if is_baseline:
+            first_paths = last_paths
+            for status in ("new", "carried_forward", "resolved"):
+                for item in groups[status]:
+                    baseline[item["finding_id"]] = status
+            continue
+        touched_in_range.update(last_paths)
+        for status in ("new", "carried_forward", "resolved"):
+            for item in groups[status]:
+                finding_id = item["finding_id"]
+                details[finding_id] = item
+                history = transitions.setdefault(finding_id, [])
+                # Record status changes only; repeated carries add nothing.
+                previous_status = (
+                    history[-1]["status"] if history else baseline.get(finding_id)
+                )
+                if previous_status != status:
+                    history.append({"review_number": review_number, "status": status})
+
+    findings: list[JsonObject] = []
+    final_counts = {"open": 0, "resolved": 0}
+    for finding_id in sorted(transitions):
+        history = transitions[finding_id]
+        if not history:
+            continue
+        final_status = "resolved" if history[-1]["status"] == "resolved" else "open"
+        final_counts[final_status] += 1
+        baseline_status = baseline.get(finding_id)
+        findings.append(
+            {
+                "finding_id": finding_id,
+                "severity": details[finding_id]["severity"],
+                "summary": details[finding_id]["summary"],
+                "status_at_from_review": baseline_status,
+                "introduced_in_range": (
+                    baseline_status in {None, "resolved"}
+                    and history[0]["status"] == "new"
+                ),
+                "final_status": final_status,
+                "transitions": history,
+            }
+        )
+    first_paths = first_paths or set()
+    return {
+        "findings": findings,
+        "findings_count": {**final_counts, "total": len(findings)},
+        "touched_paths": {
+            "added": sorted(last_paths - first_paths),
+            "dropped": sorted(first_paths - last_paths),
+            "touched_in_range": sorted(touched_in_range),
+        },
+        "head_changes": head_changes,
+    }
+
+
+def truncate_file(path: Path, size: int, *, sync: bool = True) -> None:
+    """Cut a log file back to a committed length."""
+
+    with path.open("r+b") as handle:
+        handle.truncate(size)
+        if sync:
+            handle.flush()
+            os.fsync(handle.fileno())
+
+
+def parse_review_input(raw_payload: Mapping[str, object]) -> ReviewInput:
+    """Validate one record-review payload before any lock is taken."""
+
+    merge_base_sha_raw = optional_string(raw_payload, "merge_base_sha")
+    return {
+        "head_sha": validate_git_sha(
+            require_string(raw_payload, "head_sha"), "head_sha"
+        ),
+        "merge_base_sha": (
+            validate_git_sha(merge_base_sha_raw, "merge_base_sha")
+            if merge_base_sha_raw is not None
+            else None
+        ),
+        "history_status": normalize_history_status(
+            require_string(raw_payload, "history_status")
+        ),
+        "repo_review_file": validate_repo_review_file(
+            require_string(raw_payload, "repo_review_file")
+        ),
+        "review_markdown": optional_string(raw_payload, "review_markdown"),
+        "recommendation": require_string(raw_payload, "recommendation"),
+        "review_basis": optional_string(raw_payload, "review_basis"),
+        "summary_points": string_list(
+            raw_payload.get("summary_points"), "summary_points"
+        ),
+        "commits": normalize_commit_list(raw_payload.get("commits"), "commits"),
+        "touched_paths": string_list(raw_payload.get("touched_paths"), "touched_paths"),
+        "findings": normalize_review_groups(raw_payload.get("findings")),
+    }
+
+
+def apply_review_input(
+    state: StateRecord, review: ReviewInput, blobs: ReviewBlobs
+) -> tuple[ReviewRecord, JsonObject]:
+    """Number one review, fold it into ``state``, and return its log row.
+
+    Important behavior:
+    - Explicitly resolved findings leave open state.
+    - Newly omitted findings stay open until a later review resolves them.
+    """
+
+    findings = review["findings"]
+    review_number = state["next_review_number"]
+    recorded_at = utc_now()
+    existing_open = {item["finding_id"]: item for item in state["open_findings"]}
+    new_findings = normalize_open_findings(
+        findings["new"],
+        existing_open,
+        review_number,
+        "new",
+    )
+    carried_findings = normalize_open_findings(
+        findings["carried_forward"],
+        existing_open,
+        review_number,
+        "carried_forward",
+    )
+    current_open = dict(existing_open)
+    current_open.update(new_findings)
+    current_open.update(carried_findings)
+    for item in findings["resolved"]:
+        current_open.pop(item["finding_id"], None)
+
+    review_record: ReviewRecord = {
+        "schema_version": SCHEMA_VERSION,
+        "review_number": review_number,
+        "scope_id": state["scope_id"],
+        "created_at_utc": recorded_at,
+        "head_sha": review["head_sha"],
+        "merge_base_sha": review["merge_base_sha"],
+        "history_status": review["history_status"],
+        "repo_review_file": review["repo_review_file"],
+        "review_markdown_sha256": blobs["review_markdown_sha256"],
+        "recommendation": review["recommendation"],
+        "review_basis": review["review_basis"],
+        "summary_points": review["summary_points"],
+        "commits_sha256": blobs["commits_sha256"],
+        "touched_paths_sha256": blobs["touched_paths_sha256"],
+        "findings": findings,
+    }
+    state["updated_at_utc"] = recorded_at
+    state["last_synced_at_utc"] = recorded_at
+    state["last_reviewed_head_sha"] = review["head_sha"]
+    state["last_reviewed_merge_base_sha"] = review["merge_base_sha"]
+    state["history_status"] = review["history_status"]
+    state["next_review_number"] = review_number + 1
+    state["open_findings"] = sorted(
+        current_open.values(),
+        key=lambda item: item["finding_id"],
+    )
+    summary: JsonObject = {
+        "review_number": review_number,
+        "created_at_utc": recorded_at,
+        "created_at_local": format_local(recorded_at),
+        "repo_review_file": review["repo_review_file"],
+        "review_markdown_sha256": blobs["review_markdown_sha256"],
+        "open_findings_count": len(current_open),
+        "resolved_findings_count": len(findings["resolved"]),
+    }
+    return review_record, summary
+
+
+def record_reviews_in_scope(
+    scope_dir: Path,
+    reviews: Sequence[ReviewInput],
+    *,
+    durability: Durability = "strict",
+    segment_max_reviews: int = DEFAULT_SEGMENT_MAX_REVIEWS,
+    segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+) -> list[JsonObject]:
+    """Append reviews to one scope in order under a single exclusive lock.
+
+    Every commit follows the same order: blobs, log rows, offset index, then
+    the atomic state swap that makes them visible. The touched-path index is
+    appended last; it is derived data and can be rebuilt. ``batched`` commits the whole
+    group at once instead of once per review.
+    """
+
+    sync = durability != "relaxed"
+    require_state(scope_dir)
+    with scope_lock(scope_dir, create=False):
+        state = require_state(scope_dir)
+        reviews_file = reviews_path(scope_dir)
+        index_file = reviews_index_path(scope_dir)
+        log_size = reviews_file.stat().st_size if reviews_file.exists() else 0
+        committed_size = state.get("reviews_log_bytes")
+        if committed_size is not None and log_size > committed_size:
+            # Bytes past the committed length come from a writer that died
+            # before swapping state; drop them so the log stays parseable.
+            truncate_file(reviews_file, committed_size, sync=sync)
+            log_size = committed_size
+        sync_review_index(scope_dir, log_size, sync=sync)
+        pending_rows: list[tuple[int, bytes]] = []
+        pending_postings: list[PathPosting] = []
+        # batched writes blobs unsynced and flushes them once per group.
+        unsynced_blobs: set[Path] | None = set() if durability == "batched" else None
+        summaries: list[JsonObject] = []
+
+        def commit_pending() -> None:
+            nonlocal log_size
+            if not pending_rows:
+                return
+            if unsynced_blobs:
+                sync_blobs(unsynced_blobs)
+                unsynced_blobs.clear()
+            index_size = index_file.stat().st_size if index_file.exists() else 0
+            entries: list[bytes] = []
+            offset = log_size
+            for review_number, line in pending_rows:
+                entries.append(
+                    REVIEW_INDEX_ENTRY.pack(review_number, offset, len(line))
+                )
+                offset += len(line)
+            append_bytes(
+                reviews_file, b"".join(line for _, line in pending_rows), sync=sync
+            )
+            state["reviews_log_bytes"] = offset
+            try:
+                append_bytes(index_file, b"".join(entries), sync=sync)
+                atomic_write_json(state_path(scope_dir), state, sync=sync)
+            except OSError:
+                truncate_file(reviews_file, log_size, sync=sync)
+                if index_file.exists():
+                    truncate_file(index_file, index_size, sync=sync)
+                raise
+            log_size = offset
+            pending_rows.clear()
+            index_review_paths(pending_postings)
+            pending_postings.clear()
+
+        for review in reviews:
+            pending_bytes = sum(len(line) for _, line in pending_rows)
+            active_reviews = (
+                state["next_review_number"] - 1 - state.get("sealed_through_review", 0)
+            )
+            if active_reviews > 0 and (
+                active_reviews >= segment_max_reviews
+                or log_size + pending_bytes >= segment_max_bytes
+            ):
+                commit_pending()
+                seal_active_segment(scope_dir, state, log_size, sync=sync)
+                log_size = 0
+            # Blobs are durable before the row that references them: strict
+            # syncs each one now, batched syncs them all in commit_pending.
+            blobs = store_review_blobs(
+                review, sync=durability == "strict", unsynced=unsynced_blobs
+            )
+            review_record, summary = apply_review_input(state, review, blobs)
+            line = (json.dumps(review_record, sort_keys=True) + "\n").encode("utf-8")
+            pending_rows.append((review_record["review_number"], line))
+            pending_postings.extend(
+                path_postings(scope_dir, review_record, review["touched_paths"])
+            )
+            summaries.append(summary)
+            if durability != "batched":
+                commit_pending()
+        commit_pending()
+
+    return [
+        {
+            "schema_version": SCHEMA_VERSION,
+            "scope_dir": str(scope_dir),
+            "scope_id": state["scope_id"],
+            "reviews_file": str(reviews_path(scope_dir)),
+            **summary,
+        }
+        for summary in summaries
+    ]
+
+
+def blobs_dir() -> Path:
+    """Return the content-addressed store shared by every scope."""
+
+    return storage_root() / "blobs" / "sha256"
+
+
+def blob_path(digest: str) -> Path:
+    """Return where one blob lives, fanned out by its first two hex digits."""
+
+    if BLOB_DIGEST_PATTERN.fullmatch(digest) is None:
+        raise ValueError(f"invalid sha256 blob digest: {digest!r}")
+    return blobs_dir() / digest[:2] / digest[2:]
+
+
+def store_blob(
+    payload: bytes, *, sync: bool = True, unsynced: set[Path] | None = None
+) -> str:
+    """Store ``payload`` under its SHA-256 and return the hex digest.
+
+    Identical content from any scope or review maps to the same file, so an
+    existing blob is never written again. An unsynced blob can come back
+    short after a crash, so a size mismatch rewrites it. Without ``sync``, a
+    new blob's path is added to ``unsynced`` for ``sync_blobs``.
+    """
+
+    digest = hashlib.sha256(payload).hexdigest()
+    path = blob_path(digest)
+    try:
+        if path.stat().st_size == len(payload):
+            return digest
+    except FileNotFoundError:
+        pass
+    fanout_created = not path.parent.exists()
+    ensure_dir(blobs_dir())
+    atomic_write_bytes(path, payload, sync=sync)
+    if sync and fanout_created:
+        fsync_directory(path.parent.parent)
+    if not sync and unsynced is not None:
+        unsynced.add(path)
+    return digest
+
+
+def sync_blobs(paths: Iterable[Path]) -> None:
+    """Flush blobs written without ``sync``, then each directory entry once."""
+
+    fanout_dirs: set[Path] = set()
+    for path in paths:
+        descriptor = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+        fanout_dirs.add(path.parent)
+    for fanout_dir in sorted(fanout_dirs):
+        fsync_directory(fanout_dir)
+    if fanout_dirs:
+        # Covers fan-out directories created since the last flush.
+        fsync_directory(blobs_dir())
+
+
+def read_blob(digest: str) -> bytes:
+    """Read one blob and fail closed if its content no longer matches."""
+
+    payload = blob_path(digest).read_bytes()
+    if hashlib.sha256(payload).hexdigest() != digest:
+        raise ValueError(f"blob {digest} is corrupt: content hash does not match")
+    return payload
+
+
+def store_review_blobs(
+    review: ReviewInput, *, sync: bool = True, unsynced: set[Path] | None = None
+) -> ReviewBlobs:
+    """Move the review markdown and list payloads of one review into blobs."""
+
+    markdown = review["review_markdown"]
+    return {
+        "review_markdown_sha256": (
+            store_blob(markdown.encode("utf-8"), sync=sync, unsynced=unsynced)
+            if markdown is not None
+            else None
+        ),
+        "commits_sha256": store_blob(
+            json_blob_bytes(review["commits"]), sync=sync, unsynced=unsynced
+        ),
+        "touched_paths_sha256": store_blob(
+            json_blob_bytes(review["touched_paths"]), sync=sync, unsynced=unsynced
+        ),
+    }
+
+
+def json_blob_bytes(value: object) -> bytes:
+    """Encode JSON canonically so equal values share one blob."""
+
+    return json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def review_blob_field(
+    row: Mapping[str, object], key: str, cache: dict[str, object]
+) -> object:
+    """Return a row's ``commits`` or ``touched_paths``, inline or from its blob.
+
+    ``cache`` is keyed by digest, so a list that stayed the same across
+    reviews is read and parsed once.
+    """
+
+    digest = row.get(f"{key}_sha256")
+    if not isinstance(digest, str):
+        return row.get(key)
+    if digest not in cache:
+        cache[digest] = json.loads(read_blob(digest))
+    return cache[digest]
+
+
+def expand_review_blobs(
+    row: Mapping[str, object], cache: dict[str, object]
+) -> JsonObject:
+    """Inline a row's blob-backed list fields for callers that want full rows."""
+
+    expanded: JsonObject = dict(row)
+    for key in REVIEW_BLOB_FIELDS:
+        expanded[key] = review_blob_field(row, key, cache)
+    return expanded
+
+
+def path_index_dir() -> Path:
+    """Return the cross-scope touched-path index directory."""
+
+    return storage_root() / "path-index"
+
+
+def path_index_shard(path: str) -> Path:
+    """Return the shard file that holds every posting for ``path``."""
+
+    digest = hashlib.sha256(path.encode("utf-8")).hexdigest()
+    return path_index_dir() / f"{digest[:PATH_INDEX_SHARD_HEX_DIGITS]}.jsonl"
+
+
+def finding_path(finding_id: str) -> str | None:
+    """Return the ``<path-or-area>`` part of a ``rule|path|symbol`` finding ID."""
+
+    parts = finding_id.split("|")
+    if len(parts) < 3 or parts[1].strip() == "":
+        return None
+    return parts[1].strip()
+
+
+def path_postings(
+    scope_dir: Path,
+    row: Mapping[str, object],
+    touched_paths: Sequence[str],
+) -> list[PathPosting]:
+    """Index one review row under every path it touched or raised a finding on."""
+
+    findings_by_path: dict[str, list[PathFinding]] = {}
+    groups = normalize_review_groups(row.get("findings"))
+    for status in ("new", "carried_forward", "resolved"):
+        for item in groups[status]:
+            path = finding_path(item["finding_id"])
+            if path is not None:
+                findings_by_path.setdefault(path, []).append(
+                    {
+                        "finding_id": item["finding_id"],
+                        "severity": item["severity"],
+                        "summary": item["summary"],
+                        "status": status,
+                    }
+                )
+    review_number = row.get("review_number")
+    if not isinstance(review_number, int):
+        raise ValueError("review row is missing review_number")
+    postings: list[PathPosting] = []
+    for path in sorted(set(touched_paths) | set(findings_by_path)):
+        postings.append(
+            {
+                "path": path,
+                "scope_id": str(row.get("scope_id")),
+                "scope_dir": str(scope_dir),
+                "review_number": review_number,
+                "created_at_utc": str(row.get("created_at_utc")),
+                "head_sha": str(row.get("head_sha")),
+                "findings": findings_by_path.get(path, []),
+            }
+        )
+    return postings
+
+
+def group_postings_by_shard(
+    postings: Iterable[PathPosting],
+) -> dict[Path, list[bytes]]:
+    """Encode postings as JSONL lines grouped by the shard that owns each path."""
+
+    shards: dict[Path, list[bytes]] = {}
+    for posting in postings:
+        line = (json.dumps(posting, sort_keys=True) + "\n").encode("utf-8")
+        shards.setdefault(path_index_shard(posting["path"]), []).append(line)
+    return shards
+
+
+def append_path_postings(postings: Sequence[PathPosting]) -> None:
+    """Append postings to their shards under the path-index lock.
+
+    A shard that ends mid-line (a writer died while appending) gets a newline
+    first, so the torn row stays on its own line and readers skip it. Appends
+    are never fsynced, whatever the commit's durability: the index is derived
+    from the review logs, and ``path-history --rebuild`` restores anything a
+    crash loses.
+    """
+
+    if not postings:
+        return
+    with scope_lock(path_index_dir()):
+        for shard, lines in group_postings_by_shard(postings).items():
+            prefix = b""
+            if shard.exists() and shard.stat().st_size > 0:
+                with shard.open("rb") as handle:
+                    handle.seek(-1, os.SEEK_END)
+                    if handle.read(1) != b"\n":
+                        prefix = b"\n"
+            append_bytes(shard, prefix + b"".join(lines), sync=False)
+
+
+def index_review_paths(postings: Sequence[PathPosting]) -> None:
+    """Update the path index after a commit, downgrading failures to a warning.
+
+    The reviews are already committed at this point, so an index failure
+    must not make the caller retry and record them twice.
+    """
+
+    try:
+        append_path_postings(postings)
+    except (OSError, TimeoutError) as error:
+        click.echo(
+            "WARNING: path index not updated; run `path-history --rebuild` "
+            f"to repair it: {error}",
+            err=True,
+        )
+
+
+def read_path_postings(path: str) -> list[PathPosting]:
+    """Return every posting for ``path``, oldest first, without duplicates.
+
+    The index is read lock-free: appends never rewrite earlier bytes, and a
+    torn or unparsable line is skipped. A review indexed twice keeps its
+    latest posting.
+    """
+
+    shard = path_index_shard(path)
+    try:
+        payload = shard.read_bytes()
+    except FileNotFoundError:
+        return []
+    postings: dict[tuple[str, int], PathPosting] = {}
+    for line in payload.splitlines():
+        try:
+            loaded = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+        if (
+            not isinstance(loaded, dict)
+            or loaded.get("path") != path
+            or any(key not in loaded for key in PATH_POSTING_KEYS)
+        ):
+            continue
+        postings[(loaded["scope_id"], loaded["review_number"])] = loaded
+    # Timestamps have one-second resolution; the stable sort keeps append
+    # order for reviews recorded within the same second.
+    return sorted(postings.values(), key=lambda posting: posting["created_at_utc"])
+
+
+def scan_scope_postings(scope_dir: Path) -> list[PathPosting]:
+    """Rebuild one scope's postings from its review history, without its lock."""
+
+    for _attempt in range(SNAPSHOT_READ_ATTEMPTS):
+        state = require_state(scope_dir)
+        last = state["next_review_number"] - 1
+        if last < 1:
+            return []
+        log_bytes = state.get("reviews_log_bytes")
+        if log_bytes is None:
+            log_bytes = reviews_path(scope_dir).stat().st_size
+        blob_cache: dict[str, object] = {}
+        try:
+            return [
+                posting
+                for row in iter_review_range(scope_dir, 1, last, state, log_bytes)
+                for posting in path_postings(
+                    scope_dir,
+                    row,
+                    string_list(
+                        review_blob_field(row, "touched_paths", blob_cache),
+                        "touched_paths",
+                    ),
+                )
+            ]
+        except (ValueError, FileNotFoundError):
+            # A concurrent rotation moved rows into a new segment; re-read state.
+            continue
+    raise ValueError(f"could not read a stable review history from {scope_dir}")
+
+
+def rebuild_path_index(scope_dirs: Sequence[Path]) -> list[JsonObject]:
+    """Regenerate every shard from the scopes' logs and return per-scope errors.
+
+    The index lock is held throughout, so writers that commit meanwhile wait
+    and then append on top of the rebuilt shards. Scopes are read lock-free,
+    which keeps the lock order (scope, then index) the same as record-review.
+    """
+
+    errors: list[JsonObject] = []
+    index_dir = path_index_dir()
+    ensure_dir(index_dir)
+    with scope_lock(index_dir):
+        postings: list[PathPosting] = []
+        for scope_dir in scope_dirs:
+            try:
+                postings.extend(scan_scope_postings(scope_dir))
+            except (FileNotFoundError, ValueError, OSError) as error:
+                errors.append({"scope_dir": str(scope_dir), "error": str(error)})
+        shards = group_postings_by_shard(postings)
+        for shard in index_dir.glob("*.jsonl"):
+            if shard not in shards:
+                shard.unlink()
+        for shard, lines in shards.items():
+            atomic_write_bytes(shard, b"".join(lines))
+    return errors
+
+
+def summarize_path_postings(path: str, postings: Sequence[PathPosting]) -> JsonObject:
+    """Fold one path's postings into its latest finding statuses and reviews."""
+
+    latest_findings: dict[tuple[str, str], JsonObject] = {}
+    for posting in postings:
+        for finding in posting["findings"]:
+            latest_findings[(posting["scope_id"], finding["finding_id"])] = {
+                **finding,
+                "scope_id": posting["scope_id"],
+                "scope_dir": posting["scope_dir"],
+                "review_number": posting["review_number"],
+            }
+    findings = sorted(
+        latest_findings.values(),
+        key=lambda item: (item["status"] == "resolved", str(item["finding_id"])),
+    )
+    return {
+        "path": path,
+        "reviews_count": len(postings),
+        "scopes_count": len({posting["scope_id"] for posting in postings}),
+        "open_findings_count": sum(
+            1 for item in findings if item["status"] != "resolved"
+        ),
+        "findings": findings,
+        "reviews": [
+            {
+                "scope_id": posting["scope_id"],
+                "scope_dir": posting["scope_dir"],
+                "review_number": posting["review_number"],
+                "created_at_utc": posting["created_at_utc"],
+                "head_sha": posting["head_sha"],
+            }
+            for posting in reversed(postings)
+        ],
+    }
+
+
+def ensure_reviews_file(scope_dir: Path) -> None:
+    """Create the append-only reviews log if it does not exist yet."""
+
+    path = reviews_path(scope_dir)
+    if not path.exists():
+        ensure_dir(path.parent)
+        path.touch(mode=0o600)
+
+
+def add_local_display_fields(
+    record: Mapping[str, object],
+    keys: Sequence[str],
+) -> JsonObject:
+    """Augment persisted UTC records with local-time display fields for humans."""
+
+    enriched: JsonObject = dict(record)
+    for key in keys:
+        timestamp = record.get(key)
+        if isinstance(timestamp, str):
+            local_key = key.removesuffix("_utc") + "_local"
+            enriched[local_key] = format_local(timestamp)
+    return enriched
+
+
+def compact_open_findings(
+    items: Sequence[OpenFinding], limit: int
+) -> list[CompactFinding]:
+    """Trim open findings to the smallest summary the model usually needs."""
+
+    trimmed: list[CompactFinding] = []
+    for item in items[:limit]:
+        trimmed.append(
+            {
+                "finding_id": item["finding_id"],
+                "severity": item["severity"],
+                "summary": item["summary"],
+                "status": item["status"],
+                "first_seen_review": item["first_seen_review"],
+                "last_seen_review": item["last_seen_review"],
+            }
+        )
+    return trimmed
+
+
+def normalize_open_findings(
+    incoming: Sequence[ReviewFinding],
+    existing_open: Mapping[str, OpenFinding],
+    review_number: int,
+    status: str,
+) -> dict[str, OpenFinding]:
+    """Normalize findings while preserving when an issue was first seen."""
+
+    normalized: dict[str, OpenFinding] = {}
+    for item in incoming:
+        previous = existing_open.get(item["finding_id"])
+        first_seen_review = review_number
+        if previous is not None:
+            first_seen_review = previous["first_seen_review"]
+        normalized[item["finding_id"]] = {
+            "finding_id": item["finding_id"],
+            "first_seen_review": first_seen_review,
+            "last_seen_review": review_number,
+            "status": status,
+            "severity": item["severity"],
+            "summary": item["summary"],
+        }
+    return normalized
+
+
+def scope_repo(scope_id: str) -> str:
+    """Return the repository part of a canonical scope ID."""
+
+    if scope_id.startswith("git/"):
+        return scope_id.removeprefix("git/").rsplit("/branch/", 1)[0]
+    host_owner_repo = scope_id.rsplit("/pull/", 1)[0]
+    return host_owner_repo.split("/", 1)[-1]
+
+
+def scope_signature(scope_dir: Path) -> list[int]:
+    """Fingerprint one scope's files so the report index can skip unchanged scopes."""
+
+    signature: list[int] = []
+    for path in (state_path(scope_dir), reviews_path(scope_dir)):
+        try:
+            stat_result = path.stat()
+        except FileNotFoundError:
+            signature.extend((0, -1))
+            continue
+        signature.extend((stat_result.st_mtime_ns, stat_result.st_size))
+    return signature
+
+
+def read_scope_report(scope_dir: Path) -> ScopeReport:
+    """Read one scope's state and latest review for the cross-scope report."""
+
+    state, review_rows = load_snapshot(scope_dir)
+    latest_recommendation = None
+    if review_rows:
+        recommendation = review_rows[-1].get("recommendation")
+        if isinstance(recommendation, str):
+            latest_recommendation = recommendation
+    return {
+        "scope_dir": str(scope_dir),
+        "scope_id": state["scope_id"],
+        "repo": scope_repo(state["scope_id"]),
+        "next_review_number": state["next_review_number"],
+        "last_synced_at_utc": state["last_synced_at_utc"],
+        "latest_recommendation": latest_recommendation,
+        "open_findings": compact_open_findings(
+            state["open_findings"],
+            len(state["open_findings"]),
+        ),
+    }
+
+
+def report_index_path() -> Path:
+    """Return the optional index file that caches per-scope report rows."""
+
+    return storage_root() / "report-index.json"
+
+
+def load_report_index() -> dict[str, JsonObject]:
+    """Load cached report rows, treating any unreadable index as empty."""
+
+    try:
+        raw = read_json_object(report_index_path())
+    except (OSError, ValueError):
+        return {}
+    if raw.get("version") != REPORT_INDEX_VERSION:
+        return {}
+    scopes = raw.get("scopes")
+    if not isinstance(scopes, dict):
+        return {}
+    return {key: value for key, value in scopes.items() if isinstance(value, dict)}
+
+
+def finding_age_bucket(reviews_open: int) -> str:
+    """Map how many passes a finding has stayed open onto a report bucket."""
+
+    for label, low, high in FINDING_AGE_BUCKETS:
+        if reviews_open >= low and (high is None or reviews_open <= high):
+            return label
+    return FINDING_AGE_BUCKETS[0][0]
+
+
+def aggregate_scope_reports(reports: Sequence[ScopeReport]) -> JsonObject:
+    """Count open findings by severity, repository, and review age."""
+
+    by_severity: Counter[str] = Counter()
+    by_age: Counter[str] = Counter({label: 0 for label, _, _ in FINDING_AGE_BUCKETS})
+    by_repo: dict[str, dict[str, int]] = {}
+    for report in reports:
+        repo_counts = by_repo.setdefault(report["repo"], {"scopes": 0, "open": 0})
+        repo_counts["scopes"] += 1
+        repo_counts["open"] += len(report["open_findings"])
+        for item in report["open_findings"]:
+            by_severity[item.get("severity") or "unspecified"] += 1
+            # A finding first seen in the latest completed pass is 1 pass old.
+            reviews_open = report["next_review_number"] - item["first_seen_review"]
+            by_age[finding_age_bucket(reviews_open)] += 1
+    return {
+        "open_findings_count": sum(len(item["open_findings"]) for item in reports),
+        "by_severity": dict(by_severity),
+        "by_repo": by_repo,
+        "by_age_reviews": dict(by_age),
+    }
+
+
+def print_json(payload: object) -> None:
+    """Print one pretty JSON object to stdout."""
+
+    json.dump(payload, sys.stdout, indent=2, sort_keys=True)
+    sys.stdout.write("\n")
+
+
+def read_stdin_json() -> object:
+    """Read one JSON payload from stdin."""
+
+    raw = sys.stdin.read().strip()
+    if not raw:
+        raise ValueError("expected JSON on stdin")
+    return json.loads(raw)
+
+
+def iter_stdin_ndjson() -> Iterator[tuple[int, object]]:
+    """Yield ``(line_number, payload)`` for each non-blank NDJSON line on stdin."""
+
+    for line_number, line in enumerate(sys.stdin, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"line {line_number}: {error}") from error
+
+
+def scope_dir_for(scope_id: str, scope_slug: str) -> Path:
+    """Return the deterministic storage directory for one canonical scope."""
+
+    return storage_root() / "targets" / f"{scope_slug}--{short_hash(scope_id)}"
+
+
+def scope_is_current(
+    scope_dir: Path, scope_id: str, branch_context: BranchContext | None
+) -> bool:
+    """Return whether resolving this scope again would leave its files unchanged.
+
+    ``state.json`` is only ever swapped in atomically, so reading it without
+    the lock sees either the old or the new state, never a torn one.
+    """
+
+    if not state_path(scope_dir).exists() or not reviews_path(scope_dir).exists():
+        return False
+    state = require_state(scope_dir)
+    if state["scope_id"] != scope_id:
+        return False
+    return branch_context is None or state.get("branch_context") == branch_context
+
+
+def ensure_scope(
+    scope_id: str, scope_slug: str, branch_context: BranchContext | None
+) -> Path:
+    """Create the scope directory and state, or refresh an existing one.
+
+    An existing scope is only rewritten when its branch context changed.
+    """
+
+    scope_dir = scope_dir_for(scope_id, scope_slug)
+    # resolve-scope runs at the start of every review. When nothing would
+    # change, skip the lock and the fsync'd state rewrite entirely.
+    if scope_is_current(scope_dir, scope_id, branch_context):
+        return scope_dir
+    root = storage_root()
+    ensure_dir(root)
+    ensure_dir(root / "targets")
+    with scope_lock(scope_dir):
+        if scope_is_current(scope_dir, scope_id, branch_context):
+            return scope_dir
+        current_state_path = state_path(scope_dir)
+        if current_state_path.exists():
+            state = require_state(scope_dir)
+        else:
+            state = default_state(scope_id, scope_slug, branch_context)
+        state["updated_at_utc"] = utc_now()
+        if branch_context is not None:
+            state["branch_context"] = branch_context
+        atomic_write_json(current_state_path, state)
+        ensure_reviews_file(scope_dir)
+    return scope_dir
+
+
+def parse_bulk_entry(
+    raw: object, label: str
+) -> tuple[Path, tuple[str, str, BranchContext | None] | None, ReviewInput]:
+    """Validate one bulk entry: a target scope plus one record-review payload.
+
+    The target is either an existing ``scope_dir`` or a ``scope`` object with
+    the same fields as ``resolve-scope``, which is created on demand.
+    """
+
+    try:
+        entry = object_dict(raw, "entry")
+        review = parse_review_input(object_dict(entry.get("review"), "review"))
+        scope_dir_raw = optional_string(entry, "scope_dir")
+        scope_raw = entry.get("scope")
+        if (scope_dir_raw is None) == (scope_raw is None):
+            raise ValueError("expected exactly one of 'scope_dir' or 'scope'")
+        if scope_dir_raw is not None:
+            return Path(scope_dir_raw).expanduser().resolve(), None, review
+        scope = object_dict(scope_raw, "scope")
+        provider = optional_string(scope, "provider") or "github"
+        if provider != "github" and provider != "git":
+            raise ValueError("scope provider must be 'github' or 'git'")
+        identity = canonical_scope_id(
+            provider=provider,
+            host=optional_string(scope, "host") or "github.com",
+            owner=optional_string(scope, "owner"),
+            repo=optional_string(scope, "repo"),
+            pull_number=optional_int(scope, "pull_number"),
+            repo_key=optional_string(scope, "repo_key"),
+            branch_name=optional_string(scope, "branch_name"),
+            base_branch=optional_string(scope, "base_branch"),
+            merge_base_sha=optional_string(scope, "merge_base_sha"),
+        )
+    except ValueError as error:
+        raise ValueError(f"{label}: {error}") from error
+    return scope_dir_for(identity[0], identity[1]), identity, review
+
+
+def command_resolve_scope(
+    *,
+    provider: Literal["github", "git"],
+    host: str,
+    owner: str | None,
+    repo: str | None,
+    pull_number: int | None,
+    repo_key: str | None,
+    branch_name: str | None,
+    base_branch: str | None,
+    merge_base_sha: str | None,
+) -> int:
+    """Create or update the deterministic directory that owns one memory scope."""
+
+    scope_id, scope_slug, branch_context = canonical_scope_id(
+        provider=provider,
+        host=host,
+        owner=owner,
+        repo=repo,
+        pull_number=pull_number,
+        repo_key=repo_key,
+        branch_name=branch_name,
+        base_branch=base_branch,
+        merge_base_sha=merge_base_sha,
+    )
+    scope_dir = ensure_scope(scope_id, scope_slug, branch_context)
+
+    response: JsonObject = {
+        "schema_version": SCHEMA_VERSION,
+        "scope_dir": str(scope_dir),
+        "scope_id": scope_id,
+        "scope_kind": "target",
+        "scope_slug": scope_slug,
+        "scope_hash": short_hash(scope_id),
+        "display_timezone": local_timezone_name(),
+        "display_utc_offset": local_utc_offset(),
+    }
+    print_json(response)
+    return 0
+
+
+def command_summarize_context(*, scope_dir: Path, finding_limit: int) -> int:
+    """Return a compact summary so the skill can avoid loading raw history files."""
+
+    resolved_scope_dir = scope_dir.expanduser().resolve()
+    state, review_rows = load_snapshot(resolved_scope_dir)
+    latest_review = None
+    recent_resolved_findings: list[ReviewFinding] = []
+    if review_rows:
+        latest_review = add_local_display_fields(
+            expand_review_blobs(review_rows[-1], {}),
+            ["created_at_utc"],
+        )
+        latest_findings = normalize_review_groups(review_rows[-1].get("findings"))
+        recent_resolved_findings = latest_findings["resolved"][:finding_limit]
+
+    last_synced_at_utc = state["last_synced_at_utc"]
+    response: JsonObject = {
         "schema_version": SCHEMA_VERSION,
         "scope_dir": str(resolved_scope_dir),
         "scope_id": state["scope_id"],
@@ -996,112 +2349,304 @@ def command_summarize_context(*, scope_dir: Path, finding_limit: int) -> int:
     return 0
 
 
-def command_record_review(*, scope_dir: Path) -> int:
-    """Record one completed review pass into structured memory.
+def command_record_review(
+    *,
+    scope_dir: Path,
+    durability: Durability = "strict",
+    segment_max_reviews: int = DEFAULT_SEGMENT_MAX_REVIEWS,
+    segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+    repo_root: Path | None = None,
+) -> int:
+    """Record one completed review pass, or an ordered list, into structured memory.
 
     Important behavior:
     - Explicitly resolved findings leave open state.
     - Newly omitted findings stay open until a later review resolves them.
     - The repo-local markdown review remains a referenced artifact, not the
-      canonical source of truth.
+      canonical source of truth. A copy of it is kept in the blob store so
+      later overwrites do not lose it. It is read from ``repo_root``, or from
+      the working directory when that holds the file.
     """
 
     resolved_scope_dir = scope_dir.expanduser().resolve()
-    raw_payload = object_dict(read_stdin_json(), "record-review payload")
-    findings = normalize_review_groups(raw_payload.get("findings"))
-    head_sha = validate_git_sha(require_string(raw_payload, "head_sha"), "head_sha")
-    history_status = normalize_history_status(
-        require_string(raw_payload, "history_status")
+    raw = read_stdin_json()
+    raw_payloads = raw if isinstance(raw, list) else [raw]
+    reviews = [
+        parse_review_input(object_dict(item, "record-review payload"))
+        for item in raw_payloads
+    ]
+    if not reviews:
+        raise ValueError("expected at least one record-review payload")
+    resolved_repo_root = (
+        Path.cwd() if repo_root is None else repo_root.expanduser().resolve()
     )
-    repo_review_file = validate_repo_review_file(
-        require_string(raw_payload, "repo_review_file")
+    for review in reviews:
+        if review["review_markdown"] is not None:
+            continue
+        review_file = resolved_repo_root / review["repo_review_file"]
+        # An explicit --repo-root must hold the file; the working directory
+        # is only a best guess.
+        if repo_root is not None or review_file.is_file():
+            review["review_markdown"] = review_file.read_text(encoding="utf-8")
+    responses = record_reviews_in_scope(
+        resolved_scope_dir,
+        reviews,
+        durability=durability,
+        segment_max_reviews=segment_max_reviews,
+        segment_max_bytes=segment_max_bytes,
     )
-    recommendation = require_string(raw_payload, "recommendation")
-    merge_base_sha_raw = optional_string(raw_payload, "merge_base_sha")
-    merge_base_sha = (
-        validate_git_sha(merge_base_sha_raw, "merge_base_sha")
-        if merge_base_sha_raw is not None
-        else None
+    print_json(responses if isinstance(raw, list) else responses[0])
+    return 0
+
+
+def command_record_reviews(*, ndjson: bool, durability: Durability) -> int:
+    """Apply many review payloads, grouped by scope, with one lock per scope.
+
+    Every entry is validated before anything is written. Scopes are then
+    committed independently in first-seen order; a failing scope is reported
+    and does not stop the others.
+    """
+
+    raw_entries = (
+        iter_stdin_ndjson()
+        if ndjson
+        else enumerate(object_list(read_stdin_json(), "record-reviews"), start=1)
     )
-    review_basis = optional_string(raw_payload, "review_basis")
-    summary_points = string_list(raw_payload.get("summary_points"), "summary_points")
-    commits = normalize_commit_list(raw_payload.get("commits"), "commits")
-    touched_paths = string_list(raw_payload.get("touched_paths"), "touched_paths")
-
-    require_state(resolved_scope_dir)
-    with scope_lock(resolved_scope_dir, create=False):
-        state = require_state(resolved_scope_dir)
-        review_number = state["next_review_number"]
-        recorded_at = utc_now()
-        existing_open = {item["finding_id"]: item for item in state["open_findings"]}
-        new_findings = normalize_open_findings(
-            findings["new"],
-            existing_open,
-            review_number,
-            "new",
-        )
-        carried_findings = normalize_open_findings(
-            findings["carried_forward"],
-            existing_open,
-            review_number,
-            "carried_forward",
+    groups: dict[Path, list[ReviewInput]] = {}
+    identities: dict[Path, tuple[str, str, BranchContext | None]] = {}
+    for position, raw in raw_entries:
+        label = f"line {position}" if ndjson else f"entry {position}"
+        scope_dir, identity, review = parse_bulk_entry(raw, label)
+        groups.setdefault(scope_dir, []).append(review)
+        if identity is not None:
+            identities[scope_dir] = identity
+    if not groups:
+        raise ValueError("expected at least one review entry on stdin")
+
+    results: list[JsonObject] = []
+    for scope_dir, reviews in groups.items():
+        try:
+            identity = identities.get(scope_dir)
+            if identity is not None:
+                ensure_scope(*identity)
+            responses = record_reviews_in_scope(
+                scope_dir, reviews, durability=durability
+            )
+        except (FileNotFoundError, ValueError, TimeoutError, OSError) as error:
+            results.append({"scope_dir": str(scope_dir), "error": str(error)})
+            continue
+        results.append(
+            {
+                "scope_dir": str(scope_dir),
+                "scope_id": responses[-1]["scope_id"],
+                "recorded_count": len(responses),
+                "first_review_number": responses[0]["review_number"],
+                "last_review_number": responses[-1]["review_number"],
+                "open_findings_count": responses[-1]["open_findings_count"],
+            }
         )
-        current_open = dict(existing_open)
-        current_open.update(new_findings)
-        current_open.update(carried_findings)
-        for item in findings["resolved"]:
-            current_open.pop(item["finding_id"], None)
 
-        review_record: ReviewRecord = {
+    failed = sum(1 for result in results if "error" in result)
+    print_json(
+        {
             "schema_version": SCHEMA_VERSION,
-            "review_number": review_number,
-            "scope_id": state["scope_id"],
-            "created_at_utc": recorded_at,
-            "head_sha": head_sha,
-            "merge_base_sha": merge_base_sha,
-            "history_status": history_status,
-            "repo_review_file": repo_review_file,
-            "recommendation": recommendation,
-            "review_basis": review_basis,
-            "summary_points": summary_points,
-            "commits": commits,
-            "touched_paths": touched_paths,
-            "findings": findings,
+            "reviews_count": sum(len(reviews) for reviews in groups.values()),
+            "scopes": results,
+            "failed_scopes_count": failed,
         }
-        reviews_file = reviews_path(resolved_scope_dir)
-        previous_size = reviews_file.stat().st_size if reviews_file.exists() else 0
-        state["updated_at_utc"] = recorded_at
-        state["last_synced_at_utc"] = recorded_at
-        state["last_reviewed_head_sha"] = head_sha
-        state["last_reviewed_merge_base_sha"] = merge_base_sha
-        state["history_status"] = history_status
-        state["next_review_number"] = review_number + 1
-        state["open_findings"] = sorted(
-            current_open.values(),
-            key=lambda item: item["finding_id"],
+    )
+    return 1 if failed else 0
+
+
+def command_read_reviews(
+    *, scope_dir: Path, first: int, last: int | None, expand_blobs: bool = False
+) -> int:
+    """Return one historical review, or a contiguous range, from the log."""
+
+    resolved_scope_dir = scope_dir.expanduser().resolve()
+    last_number = first if last is None else last
+    if last_number < first:
+        raise ValueError("--last must not be lower than --first")
+    with scope_lock(resolved_scope_dir, create=False, shared=True):
+        state, log_bytes = committed_review_range(
+            resolved_scope_dir, first, last_number
         )
-        append_jsonl(reviews_file, [review_record])
-        try:
-            atomic_write_json(state_path(resolved_scope_dir), state)
-        except OSError:
-            with reviews_file.open("r+", encoding="utf-8") as handle:
-                handle.truncate(previous_size)
-                handle.flush()
-                os.fsync(handle.fileno())
-            raise
+        rows = read_review_range(
+            resolved_scope_dir, first, last_number, state, log_bytes
+        )
+    if expand_blobs:
+        blob_cache: dict[str, object] = {}
+        rows = [expand_review_blobs(row, blob_cache) for row in rows]
 
     response: JsonObject = {
         "schema_version": SCHEMA_VERSION,
         "scope_dir": str(resolved_scope_dir),
         "scope_id": state["scope_id"],
-        "review_number": review_number,
-        "created_at_utc": recorded_at,
-        "created_at_local": format_local(recorded_at),
-        "reviews_file": str(reviews_path(resolved_scope_dir)),
-        "repo_review_file": repo_review_file,
-        "open_findings_count": len(current_open),
-        "resolved_findings_count": len(findings["resolved"]),
+        "reviews": [add_local_display_fields(row, ["created_at_utc"]) for row in rows],
+    }
+    print_json(response)
+    return 0
+
+
+def command_diff_reviews(*, scope_dir: Path, from_review: int, to_review: int) -> int:
+    """Summarize what changed between two reviews in one streaming pass."""
+
+    resolved_scope_dir = scope_dir.expanduser().resolve()
+    if to_review <= from_review:
+        raise ValueError("--to-review must be greater than --from-review")
+    with scope_lock(resolved_scope_dir, create=False, shared=True):
+        state, log_bytes = committed_review_range(
+            resolved_scope_dir, from_review, to_review
+        )
+        diff = diff_review_rows(
+            iter_review_range(
+                resolved_scope_dir, from_review, to_review, state, log_bytes
+            )
+        )
+
+    response: JsonObject = {
+        "schema_version": SCHEMA_VERSION,
+        "scope_dir": str(resolved_scope_dir),
+        "scope_id": state["scope_id"],
+        "from_review": from_review,
+        "to_review": to_review,
+        **diff,
+    }
+    print_json(response)
+    return 0
+
+
+def command_read_blob(*, digest: str) -> int:
+    """Write one stored blob, such as an earlier review's markdown, to stdout."""
+
+    sys.stdout.buffer.write(read_blob(digest.strip().lower()))
+    sys.stdout.buffer.flush()
+    return 0
+
+
+def command_path_history(
+    *, paths: Sequence[str], limit: int, rebuild: bool
+) -> int:
+    """Return prior reviews and findings for files, across every scope.
+
+    Each path is answered from one index shard instead of scanning every
+    scope's log. ``rebuild`` regenerates the index from the logs first.
+    """
+
+    errors: list[JsonObject] = []
+    if rebuild:
+        targets_root = storage_root() / "targets"
+        scope_dirs = (
+            sorted(path.parent for path in targets_root.glob("*/state.json"))
+            if targets_root.is_dir()
+            else []
+        )
+        errors = rebuild_path_index(scope_dirs)
+    results: list[JsonObject] = []
+    for raw_path in paths:
+        path = raw_path.strip().removeprefix("./")
+        summary = summarize_path_postings(path, read_path_postings(path))
+        reviews = summary["reviews"]
+        if isinstance(reviews, list):
+            summary["reviews"] = reviews[:limit]
+        results.append(summary)
+    response: JsonObject = {
+        "schema_version": SCHEMA_VERSION,
+        "paths": results,
+    }
+    if rebuild:
+        response["errors"] = errors
+    print_json(response)
+    return 0
+
+
+def command_report(*, jobs: int, use_index: bool, scope_limit: int) -> int:
+    """Aggregate open findings across every stored scope.
+
+    Scopes are read in parallel and lock-free. With ``use_index`` the per-scope
+    rows are cached in ``report-index.json``, and later reports re-read only
+    scopes whose files changed.
+    """
+
+    targets_root = storage_root() / "targets"
+    scope_dirs = (
+        sorted(path.parent for path in targets_root.glob("*/state.json"))
+        if targets_root.is_dir()
+        else []
+    )
+    index = load_report_index() if use_index else {}
+    signatures = {scope_dir: scope_signature(scope_dir) for scope_dir in scope_dirs}
+    reports: dict[Path, ScopeReport] = {}
+    stale_dirs: list[Path] = []
+    for scope_dir in scope_dirs:
+        cached = index.get(str(scope_dir))
+        if cached is not None and cached.get("signature") == signatures[scope_dir]:
+            reports[scope_dir] = cached["report"]  # type: ignore[assignment]
+        else:
+            stale_dirs.append(scope_dir)
+
+    errors: list[JsonObject] = []
+
+    def read_or_error(scope_dir: Path) -> ScopeReport | None:
+        try:
+            return read_scope_report(scope_dir)
+        except (OSError, ValueError, TimeoutError) as error:
+            errors.append({"scope_dir": str(scope_dir), "error": str(error)})
+            return None
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for scope_dir, report in zip(
+            stale_dirs, executor.map(read_or_error, stale_dirs), strict=True
+        ):
+            if report is not None:
+                reports[scope_dir] = report
+
+    if use_index:
+        atomic_write_json(
+            report_index_path(),
+            {
+                "version": REPORT_INDEX_VERSION,
+                "scopes": {
+                    str(scope_dir): {
+                        "signature": signatures[scope_dir],
+                        "report": report,
+                    }
+                    for scope_dir, report in reports.items()
+                },
+            },
+            # The index is a rebuildable cache, not memory worth an fsync.
+            sync=False,
+        )
+
+    ordered_reports = [reports[scope_dir] for scope_dir in sorted(reports)]
+    busiest_scopes = sorted(
+        ordered_reports,
+        key=lambda item: (-len(item["open_findings"]), item["scope_id"]),
+    )[:scope_limit]
+    response: JsonObject = {
+        "schema_version": SCHEMA_VERSION,
+        "storage_root": str(storage_root()),
+        "generated_at_utc": utc_now(),
+        "scopes_count": len(ordered_reports),
+        **aggregate_scope_reports(ordered_reports),
+        "scopes": [
+            {
+                "scope_dir": item["scope_dir"],
+                "scope_id": item["scope_id"],
+                "open_findings_count": len(item["open_findings"]),
+                "next_review_number": item["next_review_number"],
+                "last_synced_at_utc": item["last_synced_at_utc"],
+                "latest_recommendation": item["latest_recommendation"],
+            }
+            for item in busiest_scopes
+        ],
+        "errors": sorted(errors, key=lambda item: str(item["scope_dir"])),
     }
+    if use_index:
+        response["index"] = {
+            "reused": len(scope_dirs) - len(stale_dirs),
+            "read": len(stale_dirs),
+        }
     print_json(response)
     return 0
 
@@ -1127,8 +2672,10 @@ def run_click_command(command: Callable[[], int]) -> None:
     context_settings={"help_option_names": ["-h", "--help"]},
     help=(
         "Manage monty-code-review's persistent JSON-first review memory.\n\n"
-        "This v1 helper intentionally stays small: one deterministic target, one "
-        "compact state file, and one append-only reviews log."
+        "Each PR or branch scope keeps one compact state file and one "
+        "append-only review log, sealed into compressed segments as it grows. "
+        "Review markdown lives in a shared blob store; offset, report, and "
+        "path indexes are derived from the logs."
     ),
 )
 def cli() -> None:
@@ -1219,8 +2766,136 @@ def summarize_context_cli(scope_dir: Path, finding_limit: int) -> None:
 @cli.command(
     "record-review",
     help=(
-        "Read one completed review result from stdin and persist it into the "
-        "canonical JSON-first memory store."
+        "Read one completed review result (or a JSON array of them) from stdin "
+        "and persist it into the canonical JSON-first memory store."
+    ),
+)
+@click.option(
+    "--scope-dir",
+    type=click.Path(path_type=Path),
+    required=True,
+    help="Resolved memory directory returned by resolve-scope.",
+)
+@click.option(
+    "--durability",
+    type=click.Choice(DURABILITY_MODES),
+    default="strict",
+    show_default=True,
+    help=(
+        "strict fsyncs files and directories per review; batched commits a "
+        "JSON array of reviews with one fsync; relaxed skips fsync."
+    ),
+)
+@click.option(
+    "--segment-max-reviews",
+    type=click.IntRange(min=1),
+    default=DEFAULT_SEGMENT_MAX_REVIEWS,
+    show_default=True,
+    help="Seal the active reviews log into a compressed segment at this many rows.",
+)
+@click.option(
+    "--segment-max-bytes",
+    type=click.IntRange(min=1),
+    default=DEFAULT_SEGMENT_MAX_BYTES,
+    show_default=True,
+    help="Seal the active reviews log into a compressed segment at this size.",
+)
+@click.option(
+    "--repo-root",
+    type=click.Path(path_type=Path, file_okay=False, exists=True),
+    default=None,
+    help=(
+        "Repository checkout holding repo_review_file, whose markdown is "
+        "copied into the blob store. Defaults to the working directory, "
+        "skipping the copy when the file is not there."
+    ),
+)
+def record_review_cli(
+    scope_dir: Path,
+    durability: Durability,
+    segment_max_reviews: int,
+    segment_max_bytes: int,
+    repo_root: Path | None,
+) -> None:
+    run_click_command(
+        lambda: command_record_review(
+            scope_dir=scope_dir,
+            durability=durability,
+            segment_max_reviews=segment_max_reviews,
+            segment_max_bytes=segment_max_bytes,
+            repo_root=repo_root,
+        )
+    )
+
+
+@cli.command(
+    "record-reviews",
+    help=(
+        "Bulk-record review payloads for one or many scopes from stdin, with "
+        "one lock and one state write per scope."
+    ),
+)
+@click.option(
+    "--ndjson/--json-array",
+    default=True,
+    show_default=True,
+    help="Read one entry per line, or a single JSON array of entries.",
+)
+@click.option(
+    "--durability",
+    type=click.Choice(DURABILITY_MODES),
+    default="batched",
+    show_default=True,
+    help="Durability mode used for each scope's commit.",
+)
+def record_reviews_cli(ndjson: bool, durability: Durability) -> None:
+    run_click_command(
+        lambda: command_record_reviews(ndjson=ndjson, durability=durability)
+    )
+
+
+@cli.command(
+    "read-reviews",
+    help="Return one historical review, or a range of reviews, from the log.",
+)
+@click.option(
+    "--scope-dir",
+    type=click.Path(path_type=Path),
+    required=True,
+    help="Resolved memory directory returned by resolve-scope.",
+)
+@click.option(
+    "--first",
+    type=click.IntRange(min=1),
+    required=True,
+    help="First review number to return.",
+)
+@click.option(
+    "--last",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Last review number to return. Defaults to --first.",
+)
+@click.option(
+    "--expand-blobs",
+    is_flag=True,
+    help="Inline commits and touched_paths instead of their blob digests.",
+)
+def read_reviews_cli(
+    scope_dir: Path, first: int, last: int | None, expand_blobs: bool
+) -> None:
+    run_click_command(
+        lambda: command_read_reviews(
+            scope_dir=scope_dir, first=first, last=last, expand_blobs=expand_blobs
+        )
+    )
+
+
+@cli.command(
+    "diff-reviews",
+    help=(
+        "Show finding lifecycle transitions, touched-path changes, and head "
+        "SHA changes between two reviews."
     ),
 )
 @click.option(
@@ -1229,8 +2904,109 @@ def summarize_context_cli(scope_dir: Path, finding_limit: int) -> None:
     required=True,
     help="Resolved memory directory returned by resolve-scope.",
 )
-def record_review_cli(scope_dir: Path) -> None:
-    run_click_command(lambda: command_record_review(scope_dir=scope_dir))
+@click.option(
+    "--from-review",
+    type=click.IntRange(min=1),
+    required=True,
+    help="Earlier review number; included in the range.",
+)
+@click.option(
+    "--to-review",
+    type=click.IntRange(min=1),
+    required=True,
+    help="Later review number; included in the range.",
+)
+def diff_reviews_cli(scope_dir: Path, from_review: int, to_review: int) -> None:
+    run_click_command(
+        lambda: command_diff_reviews(
+            scope_dir=scope_dir,
+            from_review=from_review,
+            to_review=to_review,
+        )
+    )
+
+
+@cli.command(
+    "report",
+    help=(
+        "Aggregate open findings across every stored scope by severity, "
+        "repository, and review age."
+    ),
+)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=DEFAULT_REPORT_JOBS,
+    show_default=True,
+    help="Number of scopes to read in parallel.",
+)
+@click.option(
+    "--use-index/--no-use-index",
+    default=False,
+    show_default=True,
+    help="Cache per-scope rows and re-read only scopes whose files changed.",
+)
+@click.option(
+    "--scope-limit",
+    type=click.IntRange(min=0),
+    default=20,
+    show_default=True,
+    help="Maximum number of scopes to list, busiest first.",
+)
+def report_cli(jobs: int, use_index: bool, scope_limit: int) -> None:
+    run_click_command(
+        lambda: command_report(
+            jobs=jobs,
+            use_index=use_index,
+            scope_limit=scope_limit,
+        )
+    )
+
+
+@cli.command(
+    "path-history",
+    help=(
+        "Show prior reviews and findings for one or more files across every "
+        "scope, from the touched-path index."
+    ),
+)
+@click.option(
+    "--path",
+    "paths",
+    multiple=True,
+    required=True,
+    help="Repo-relative file path. Repeatable.",
+)
+@click.option(
+    "--limit",
+    type=click.IntRange(min=1),
+    default=DEFAULT_PATH_HISTORY_LIMIT,
+    show_default=True,
+    help="Most recent reviews to list per path. Findings are never trimmed.",
+)
+@click.option(
+    "--rebuild",
+    is_flag=True,
+    help="Regenerate the index from every scope's review log before querying.",
+)
+def path_history_cli(paths: tuple[str, ...], limit: int, rebuild: bool) -> None:
+    run_click_command(
+        lambda: command_path_history(paths=paths, limit=limit, rebuild=rebuild)
+    )
+
+
+@cli.command(
+    "read-blob",
+    help="Print one blob from the content-addressed store, e.g. review markdown.",
+)
+@click.option(
+    "--sha256",
+    "digest",
+    required=True,
+    help="Blob digest, as stored in a review row's *_sha256 field.",
+)
+def read_blob_cli(digest: str) -> None:
+    run_click_command(lambda: command_read_blob(digest=digest))
 
 
 if __name__ == "__main__":
@@ -1,31 +1,60 @@
 #!/usr/bin/env python3
-"""Publish a generated visual explainer HTML file to a fresh Netlify site."""
+"""Publish a generated visual explainer HTML file to Netlify.
+
+Each publish goes to a fresh site unless ``--update`` finds an earlier receipt
+for the same explainer, in which case it redeploys to that site instead.
+"""
 
 from __future__ import annotations
 
 import argparse
+import email.utils
+import hashlib
+import http.client
 import json
 import os
 import re
-import shutil
-import tempfile
+import ssl
+import threading
 import time
-import urllib.error
 import urllib.parse
-import urllib.request
 import uuid
 import webbrowser
-import zipfile
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 
-API_BASE = "https://api.netlify.com/api/v1"
+# Overridable so the publish flow can run against a local stub of the API.
+API_BASE = os.environ.get(
+    "NETLIFY_VISUAL_EXPLAINER_API_BASE", "https://api.netlify.com/api/v1"
+).rstrip("/")
 CONFIG_DIR = Path.home() / ".config" / "visual-explainer"
 GLOBAL_CONFIG_PATH = CONFIG_DIR / "global.json"
 PUBLISH_HISTORY_DIR = CONFIG_DIR / "publish-history"
+DEFAULT_UPLOAD_WORKERS = 4
+HASH_CHUNK_BYTES = 1024 * 1024
+HTTP_TIMEOUT_SECONDS = 30
+MAX_REDIRECTS = 5
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+USER_AGENT = "visual-explainer-netlify-publisher"
+# Polls start fast and back off, because most deploys are ready within seconds.
+INITIAL_POLL_INTERVAL_SECONDS = 0.25
+POLL_BACKOFF_FACTOR = 1.6
+VERIFY_MAX_INTERVAL_SECONDS = 2.0
+VERIFY_GRACE_SECONDS = 10.0
+THROTTLED_STATUSES = {429, 503}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT"}
+# Forces the explainer entry point to be served as HTML.
+HTML_HEADERS_RULES = (
+    "/\n"
+    "  Content-Type: text/html; charset=UTF-8\n"
+    "/index.html\n"
+    "  Content-Type: text/html; charset=UTF-8\n"
+)
 DEFAULT_CONFIG: dict[str, Any] = {
     "version": "1.0",
     "publisher": "netlify",
@@ -49,10 +78,140 @@ class PublishError(RuntimeError):
 class NetlifyApiError(PublishError):
     """Raised when Netlify returns an API error."""
 
-    def __init__(self, message: str, status_code: int, details: str = "") -> None:
+    def __init__(
+        self,
+        message: str,
+        status_code: int,
+        details: str = "",
+        retry_after: float | None = None,
+    ) -> None:
         super().__init__(message)
         self.status_code = status_code
         self.details = details
+        self.retry_after = retry_after
+
+
+@dataclass
+class DeployFile:
+    """One file in a digest deploy, read from disk or generated in memory."""
+
+    deploy_path: str
+    sha1: str
+    size: int
+    source: Path | None = None
+    content: bytes | None = None
+
+    def read_bytes(self) -> bytes:
+        if self.content is not None:
+            return self.content
+        assert self.source is not None
+        return self.source.read_bytes()
+
+
+@dataclass
+class HttpResponse:
+    status: int
+    headers: http.client.HTTPMessage
+    body: bytes
+
+
+class PooledHttpClient:
+    """Keep-alive HTTP(S) connections shared across the whole publish flow.
+
+    Idle connections are pooled per scheme and host, so the create, deploy,
+    upload, poll, and verify requests reuse a handful of TLS sessions instead
+    of handshaking on every call. Each request is timed for the receipt.
+    """
+
+    def __init__(self, timeout_seconds: float = HTTP_TIMEOUT_SECONDS) -> None:
+        self.timeout_seconds = timeout_seconds
+        self.timings: list[dict[str, Any]] = []
+        self.connections_opened = 0
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._ssl_context: ssl.SSLContext | None = None
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        body: bytes | None = None,
+    ) -> HttpResponse:
+        parsed = urllib.parse.urlsplit(url)
+        if parsed.scheme not in {"http", "https"} or not parsed.netloc:
+            raise ValueError(f"unsupported URL: {url}")
+        key = (parsed.scheme, parsed.netloc)
+        target = urllib.parse.urlunsplit(("", "", parsed.path or "/", parsed.query, ""))
+        while True:
+            connection, reused = self._acquire(key)
+            started = time.perf_counter()
+            sent = False
+            try:
+                connection.request(method, target, body=body, headers=headers or {})
+                sent = True
+                response = connection.getresponse()
+                payload = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                connection.close()
+                if reused and (not sent or method in IDEMPOTENT_METHODS):
+                    # The server closed an idle keep-alive connection; resend
+                    # on a fresh one. A POST that was fully sent may already
+                    # have been applied, so it is never sent twice.
+                    continue
+                raise
+            except BaseException:
+                connection.close()
+                raise
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(key, connection)
+            with self._lock:
+                self.timings.append(
+                    {
+                        "method": method,
+                        "host": parsed.netloc,
+                        "path": parsed.path or "/",
+                        "status": response.status,
+                        "elapsed_ms": round(elapsed_ms, 1),
+                        "reused_connection": reused,
+                    }
+                )
+            return HttpResponse(status=response.status, headers=response.headers, body=payload)
+
+    def close(self) -> None:
+        with self._lock:
+            idle = [conn for pool in self._idle.values() for conn in pool]
+            self._idle.clear()
+        for connection in idle:
+            connection.close()
+
+    def _acquire(self, key: tuple[str, str]) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            pool = self._idle.get(key)
+            if pool:
+                return pool.pop(), True
+            self.connections_opened += 1
+            if key[0] == "https" and self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+        scheme, netloc = key
+        if scheme == "https":
+            return (
+                http.client.HTTPSConnection(
+                    netloc, timeout=self.timeout_seconds, context=self._ssl_context
+                ),
+                False,
+            )
+        return http.client.HTTPConnection(netloc, timeout=self.timeout_seconds), False
+
+    def _release(self, key: tuple[str, str], connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            self._idle.setdefault(key, []).append(connection)
+
+
+HTTP_CLIENT = PooledHttpClient()
 
 
 @dataclass
@@ -65,12 +224,22 @@ class RuntimeSettings:
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
-        description="Publish a visual explainer HTML file to a fresh Netlify preview site.",
+        description=(
+            "Publish a visual explainer HTML file to a fresh Netlify preview site, "
+            "or redeploy to the site of an earlier publish with --update."
+        ),
     )
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
         "--html-path",
-        required=True,
-        help="Path to the generated local HTML file.",
+        help="Path to the generated local HTML file. Published as index.html.",
+    )
+    source.add_argument(
+        "--site-dir",
+        help=(
+            "Directory holding a multi-file explainer (index.html plus images, "
+            "CSS, and JS). Published as-is."
+        ),
     )
     parser.add_argument(
         "--title",
@@ -97,14 +266,39 @@ def parse_args() -> argparse.Namespace:
         "--poll-interval-seconds",
         type=float,
         default=3.0,
-        help="Delay between deploy status polls.",
+        help=(
+            "Longest delay between deploy status polls. Polling starts at "
+            f"{INITIAL_POLL_INTERVAL_SECONDS}s and backs off up to this value."
+        ),
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help=(
+            "Redeploy to the site from the latest successful publish of the same "
+            "path (or, failing that, the same title) instead of creating a new "
+            "site. Falls back to a new site when none is found."
+        ),
+    )
+    parser.add_argument(
+        "--upload-workers",
+        type=int,
+        default=DEFAULT_UPLOAD_WORKERS,
+        help="Files to upload to Netlify in parallel.",
     )
     return parser.parse_args()
 
 
 def main() -> int:
     args = parse_args()
-    html_path = Path(args.html_path).expanduser().resolve()
+    site_dir = (
+        Path(args.site_dir).expanduser().resolve() if args.site_dir is not None else None
+    )
+    html_path = (
+        site_dir / "index.html"
+        if site_dir is not None
+        else Path(args.html_path).expanduser().resolve()
+    )
     created_at = utc_now()
     receipt_stamp = datetime_for_receipt(created_at)
     receipt: dict[str, Any] = {
@@ -113,39 +307,74 @@ def main() -> int:
         "local_html_path": str(html_path),
         "state": "error",
     }
+    if site_dir is not None:
+        receipt["local_site_dir"] = str(site_dir)
+    publish_started = time.perf_counter()
 
     try:
+        phase_started = time.perf_counter()
         ensure_local_html_exists(html_path)
+        deploy_files = collect_deploy_files(html_path=html_path, site_dir=site_dir)
+        receipt["files_count"] = len(deploy_files)
+        record_phase(receipt, "prepare_files", phase_started)
         config = load_or_bootstrap_config()
         settings = resolve_runtime_settings(config, force_open=args.open_url)
-        site_name = build_site_name(settings.site_prefix)
-        receipt["site_name"] = site_name
-
-        site = create_site(
-            token=settings.token,
-            account_slug=settings.account_slug,
-            site_name=site_name,
-        )
+        phase_started = time.perf_counter()
+        site: dict[str, Any] | None = None
+        if args.update:
+            site = find_reusable_site(
+                token=settings.token,
+                title=args.title,
+                local_path=str(site_dir if site_dir is not None else html_path),
+                receipt=receipt,
+            )
+        if site is None:
+            site_name = build_site_name(settings.site_prefix)
+            receipt["site_name"] = site_name
+            site = create_site(
+                token=settings.token,
+                account_slug=settings.account_slug,
+                site_name=site_name,
+            )
+        else:
+            site_name = require_string(site, "name", "site lookup")
+            receipt["site_name"] = site_name
         receipt["site_id"] = require_string(site, "id", "site creation")
         receipt["admin_url"] = site.get("admin_url")
+        record_phase(receipt, "site", phase_started)
 
+        phase_started = time.perf_counter()
         deploy = create_deploy(
             token=settings.token,
             site_id=receipt["site_id"],
             title=args.title,
-            html_path=html_path,
+            deploy_files=deploy_files,
         )
         receipt["deploy_id"] = require_string(deploy, "id", "deploy creation")
+        record_phase(receipt, "create_deploy", phase_started)
+        phase_started = time.perf_counter()
+        uploaded = upload_required_files(
+            token=settings.token,
+            deploy_id=receipt["deploy_id"],
+            deploy_files=deploy_files,
+            required=deploy.get("required") or [],
+            workers=args.upload_workers,
+        )
+        receipt["uploaded_files_count"] = len(uploaded)
+        receipt["uploaded_bytes"] = sum(deploy_file.size for deploy_file in uploaded)
+        record_phase(receipt, "upload", phase_started)
 
-        final_deploy = poll_deploy(
+        final_deploy = poll_and_verify_deploy(
             token=settings.token,
             deploy_id=receipt["deploy_id"],
+            site_name=site_name,
+            site=site,
+            deploy=deploy,
+            receipt=receipt,
             timeout_seconds=args.timeout_seconds,
             poll_interval_seconds=args.poll_interval_seconds,
         )
-        deploy_url = select_deploy_url(site_name=site_name, site=site, deploy=final_deploy)
-        receipt["deploy_url"] = deploy_url
-        verify_deploy_content_type(deploy_url)
+        deploy_url = receipt["deploy_url"]
         state = final_deploy.get("state", "ready")
         if state != "ready":
             raise PublishError(
@@ -156,6 +385,8 @@ def main() -> int:
 
         receipt["state"] = state
 
+        record_phase(receipt, "total", publish_started)
+        record_http_timings(receipt)
         receipt_path = write_receipt(receipt, receipt_stamp)
         receipt["receipt_path"] = str(receipt_path)
 
@@ -167,10 +398,24 @@ def main() -> int:
     except PublishError as error:
         receipt["state"] = "error"
         receipt["error_message"] = str(error)
+        record_phase(receipt, "total", publish_started)
+        record_http_timings(receipt)
         receipt_path = write_receipt(receipt, receipt_stamp)
         receipt["receipt_path"] = str(receipt_path)
         emit_failure(receipt, error, json_output=args.json)
         return 1
+    finally:
+        HTTP_CLIENT.close()
+
+
+def record_phase(receipt: dict[str, Any], phase: str, started: float) -> None:
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+    receipt.setdefault("phase_timings_ms", {})[phase] = elapsed_ms
+
+
+def record_http_timings(receipt: dict[str, Any]) -> None:
+    receipt["http_connections_opened"] = HTTP_CLIENT.connections_opened
+    receipt["http_requests"] = list(HTTP_CLIENT.timings)
 
 
 def utc_now() -> str:
@@ -387,6 +632,64 @@ def build_site_name(site_prefix: str) -> str:
     return f"{slug}-{timestamp}-{suffix}"
 
 
+def find_reusable_site(
+    token: str,
+    title: str,
+    local_path: str,
+    receipt: dict[str, Any],
+) -> dict[str, Any] | None:
+    previous = find_previous_receipt(title=title, local_path=local_path)
+    receipt["site_reused"] = False
+    if previous is None:
+        return None
+    try:
+        site = request_json(
+            url=f"{API_BASE}/sites/{urllib.parse.quote(previous['site_id'])}",
+            token=token,
+        )
+    except NetlifyApiError as error:
+        if error.status_code in {403, 404}:
+            # The site was deleted, or belongs to an account this token can no
+            # longer reach; publish to a fresh one instead.
+            return None
+        if error.status_code == 401:
+            raise PublishError(
+                "Netlify API authentication failed.\n\n"
+                "Check whether NETLIFY_VISUAL_EXPLAINER_TOKEN is valid and still active.",
+            ) from error
+        raise PublishError(
+            "Could not look up the previously published Netlify site.\n\n"
+            "Check network access and retry, or publish without --update.",
+        ) from error
+    receipt["site_reused"] = True
+    receipt["previous_receipt_path"] = previous.get("receipt_path")
+    return site
+
+
+def find_previous_receipt(title: str, local_path: str) -> dict[str, Any] | None:
+    if not PUBLISH_HISTORY_DIR.is_dir():
+        return None
+    title_match: dict[str, Any] | None = None
+    # Receipt file names are UTC timestamps, so reverse name order is newest first.
+    for receipt_path in sorted(PUBLISH_HISTORY_DIR.glob("*.json"), reverse=True):
+        try:
+            previous = json.loads(receipt_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            continue
+        if (
+            not isinstance(previous, dict)
+            or previous.get("state") != "ready"
+            or not isinstance(previous.get("site_id"), str)
+        ):
+            continue
+        previous_path = previous.get("local_site_dir") or previous.get("local_html_path")
+        if previous_path == local_path:
+            return previous
+        if title_match is None and previous.get("title") == title:
+            title_match = previous
+    return title_match
+
+
 def create_site(token: str, account_slug: str, site_name: str) -> dict[str, Any]:
     payload = json.dumps({"name": site_name}).encode("utf-8")
     try:
@@ -410,50 +713,181 @@ def create_site(token: str, account_slug: str, site_name: str) -> dict[str, Any]
         ) from error
 
 
-def create_deploy(token: str, site_id: str, title: str, html_path: Path) -> dict[str, Any]:
-    with tempfile.TemporaryDirectory(prefix="visual-explainer-") as temp_dir_name:
-        temp_dir = Path(temp_dir_name)
-        index_path = temp_dir / "index.html"
-        headers_path = temp_dir / "_headers"
-        shutil.copy2(html_path, index_path)
-        headers_path.write_text(
-            "/\n"
-            "  Content-Type: text/html; charset=UTF-8\n"
-            "/index.html\n"
-            "  Content-Type: text/html; charset=UTF-8\n",
-            encoding="utf-8",
+def collect_deploy_files(html_path: Path, site_dir: Path | None) -> list[DeployFile]:
+    if site_dir is None:
+        sources = {"/index.html": html_path}
+    else:
+        sources = {
+            "/" + path.relative_to(site_dir).as_posix(): path
+            for path in sorted(site_dir.rglob("*"))
+            if path.is_file()
+            and not any(
+                part.startswith(".") for part in path.relative_to(site_dir).parts
+            )
+        }
+
+    deploy_files = [
+        DeployFile(
+            deploy_path=deploy_path,
+            sha1=file_sha1(source),
+            size=source.stat().st_size,
+            source=source,
+        )
+        for deploy_path, source in sources.items()
+    ]
+    if "/_headers" not in sources:
+        headers = HTML_HEADERS_RULES.encode("utf-8")
+        deploy_files.append(
+            DeployFile(
+                deploy_path="/_headers",
+                sha1=hashlib.sha1(headers).hexdigest(),
+                size=len(headers),
+                content=headers,
+            )
         )
-        archive_path = temp_dir / "site.zip"
+    return deploy_files
+
+
+def file_sha1(path: Path) -> str:
+    digest = hashlib.sha1()
+    with path.open("rb") as handle:
+        while chunk := handle.read(HASH_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
 
-        with zipfile.ZipFile(
-            archive_path,
-            mode="w",
-            compression=zipfile.ZIP_DEFLATED,
-        ) as archive:
-            archive.write(index_path, arcname="index.html")
-            archive.write(headers_path, arcname="_headers")
 
+def create_deploy(
+    token: str,
+    site_id: str,
+    title: str,
+    deploy_files: list[DeployFile],
+) -> dict[str, Any]:
+    # Netlify answers a file-digest deploy with the SHA-1s it does not have yet.
+    digests = {deploy_file.deploy_path: deploy_file.sha1 for deploy_file in deploy_files}
+    payload = json.dumps({"files": digests}).encode("utf-8")
+    try:
+        return request_json(
+            url=(
+                f"{API_BASE}/sites/{urllib.parse.quote(site_id)}/deploys?"
+                f"{urllib.parse.urlencode({'title': title})}"
+            ),
+            token=token,
+            method="POST",
+            headers={"Content-Type": "application/json"},
+            data=payload,
+        )
+    except NetlifyApiError as error:
+        raise upload_error(error) from error
+
+
+def upload_required_files(
+    token: str,
+    deploy_id: str,
+    deploy_files: list[DeployFile],
+    required: list[Any],
+    workers: int,
+) -> list[DeployFile]:
+    by_sha1: dict[str, DeployFile] = {}
+    for deploy_file in deploy_files:
+        by_sha1.setdefault(deploy_file.sha1, deploy_file)
+    pending = [by_sha1[sha1] for sha1 in dict.fromkeys(required) if sha1 in by_sha1]
+    if not pending:
+        return []
+
+    def upload(deploy_file: DeployFile) -> None:
+        request_json(
+            url=(
+                f"{API_BASE}/deploys/{urllib.parse.quote(deploy_id)}/files/"
+                f"{urllib.parse.quote(deploy_file.deploy_path.lstrip('/'), safe='/')}"
+            ),
+            token=token,
+            method="PUT",
+            headers={"Content-Type": "application/octet-stream"},
+            data=deploy_file.read_bytes(),
+        )
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(pending)))) as pool:
+        futures = [pool.submit(upload, deploy_file) for deploy_file in pending]
+        for future in futures:
+            try:
+                future.result()
+            except NetlifyApiError as error:
+                raise upload_error(error) from error
+            except OSError as error:
+                raise PublishError(
+                    "Could not read a local explainer file for upload.\n\n"
+                    f"{error}. The local files are unchanged; fix this and retry.",
+                ) from error
+    return pending
+
+
+def upload_error(error: NetlifyApiError) -> PublishError:
+    if error.status_code in {401, 403}:
+        return PublishError(
+            "Netlify API authentication failed.\n\n"
+            "Check whether NETLIFY_VISUAL_EXPLAINER_TOKEN is valid and still active.",
+        )
+    return PublishError(
+        "Could not upload the explainer to Netlify.\n\n"
+        "The local HTML still exists. Check token permissions and try again.",
+    )
+
+
+def poll_and_verify_deploy(
+    token: str,
+    deploy_id: str,
+    site_name: str,
+    site: dict[str, Any],
+    deploy: dict[str, Any],
+    receipt: dict[str, Any],
+    timeout_seconds: int,
+    poll_interval_seconds: float,
+) -> dict[str, Any]:
+    # Verification runs alongside polling, so the content-type check lands on
+    # the first request after the deploy turns ready instead of after it.
+    deploy_url = select_deploy_url(site_name=site_name, site=site, deploy=deploy)
+    receipt["deploy_url"] = deploy_url
+    ready = threading.Event()
+    cancelled = threading.Event()
+    with ThreadPoolExecutor(max_workers=1) as verifier:
+        verify_started = time.perf_counter()
+        verification = verifier.submit(
+            verify_deploy_content_type,
+            deploy_url,
+            ready=ready,
+            cancelled=cancelled,
+            # A reused site still serves its previous deploy until this one
+            # is live, so only checks made after `ready` count there.
+            accept_before_ready=not receipt.get("site_reused", False),
+        )
+        poll_started = time.perf_counter()
         try:
-            return request_json(
-                url=(
-                    f"{API_BASE}/sites/{urllib.parse.quote(site_id)}/deploys?"
-                    f"{urllib.parse.urlencode({'title': title})}"
-                ),
+            final_deploy = poll_deploy(
                 token=token,
-                method="POST",
-                headers={"Content-Type": "application/zip"},
-                data=archive_path.read_bytes(),
+                deploy_id=deploy_id,
+                timeout_seconds=timeout_seconds,
+                poll_interval_seconds=poll_interval_seconds,
             )
-        except NetlifyApiError as error:
-            if error.status_code in {401, 403}:
-                raise PublishError(
-                    "Netlify API authentication failed.\n\n"
-                    "Check whether NETLIFY_VISUAL_EXPLAINER_TOKEN is valid and still active.",
-                ) from error
-            raise PublishError(
-                "Could not upload the explainer to Netlify.\n\n"
-                "The local HTML still exists. Check token permissions and try again.",
-            ) from error
+        except BaseException:
+            cancelled.set()
+            raise
+        ready.set()
+        ready_at = time.perf_counter()
+        record_phase(receipt, "poll", poll_started)
+        verification.result()
+    record_phase(receipt, "verify", verify_started)
+    record_phase(receipt, "verify_after_ready", ready_at)
+
+    final_url = select_deploy_url(site_name=site_name, site=site, deploy=final_deploy)
+    if final_url != deploy_url:
+        receipt["deploy_url"] = final_url
+        verify_deploy_content_type(
+            final_url,
+            ready=ready,
+            cancelled=threading.Event(),
+            accept_before_ready=False,
+        )
+    return final_deploy
 
 
 def poll_deploy(
@@ -463,21 +897,30 @@ def poll_deploy(
     poll_interval_seconds: float,
 ) -> dict[str, Any]:
     deadline = time.monotonic() + timeout_seconds
+    delays = backoff_delays(max(poll_interval_seconds, INITIAL_POLL_INTERVAL_SECONDS))
     while time.monotonic() < deadline:
-        deploy = request_json(
-            url=f"{API_BASE}/deploys/{urllib.parse.quote(deploy_id)}",
-            token=token,
-        )
-        state = str(deploy.get("state", "")).lower()
-        if state == "ready":
-            return deploy
-        if state == "error":
-            raise PublishError(
-                "Netlify reported a failed deploy.\n\n"
-                "The local HTML still exists. Check the deploy details in Netlify "
-                "and retry after fixing the issue.",
+        try:
+            deploy, headers = request_api(
+                url=f"{API_BASE}/deploys/{urllib.parse.quote(deploy_id)}",
+                token=token,
             )
-        time.sleep(max(poll_interval_seconds, 0.5))
+        except NetlifyApiError as error:
+            if error.status_code not in THROTTLED_STATUSES:
+                raise
+            delay = error.retry_after if error.retry_after is not None else next(delays)
+        else:
+            state = str(deploy.get("state", "")).lower()
+            if state == "ready":
+                return deploy
+            if state == "error":
+                raise PublishError(
+                    "Netlify reported a failed deploy.\n\n"
+                    "The local HTML still exists. Check the deploy details in Netlify "
+                    "and retry after fixing the issue.",
+                )
+            # Never poll faster than the server asks, whatever the backoff says.
+            delay = max(next(delays), server_requested_delay(headers) or 0.0)
+        time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
 
     raise PublishError(
         "Netlify deploy did not reach ready state before the timeout.\n\n"
@@ -486,6 +929,36 @@ def poll_deploy(
     )
 
 
+def backoff_delays(max_seconds: float) -> Iterator[float]:
+    delay = min(INITIAL_POLL_INTERVAL_SECONDS, max_seconds)
+    while True:
+        yield delay
+        delay = min(delay * POLL_BACKOFF_FACTOR, max_seconds)
+
+
+def server_requested_delay(headers: http.client.HTTPMessage) -> float | None:
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        retry_after = retry_after.strip()
+        if retry_after.isdigit():
+            return float(retry_after)
+        try:
+            retry_at = email.utils.parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+    # Netlify also reports its rate-limit window; once it is used up, wait
+    # for the reset instead of spending polls on 429s.
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    if remaining is not None and remaining.strip() == "0" and reset:
+        try:
+            return max(0.0, float(reset) - time.time())
+        except ValueError:
+            return None
+    return None
+
+
 def request_json(
     url: str,
     token: str,
@@ -493,41 +966,45 @@ def request_json(
     headers: dict[str, str] | None = None,
     data: bytes | None = None,
 ) -> dict[str, Any]:
+    payload, _ = request_api(url, token, method=method, headers=headers, data=data)
+    return payload
+
+
+def request_api(
+    url: str,
+    token: str,
+    method: str = "GET",
+    headers: dict[str, str] | None = None,
+    data: bytes | None = None,
+) -> tuple[dict[str, Any], http.client.HTTPMessage]:
     request_headers = {
         "Authorization": f"Bearer {token}",
-        "User-Agent": "visual-explainer-netlify-publisher",
+        "User-Agent": USER_AGENT,
         "Accept": "application/json",
     }
     if headers:
         request_headers.update(headers)
 
-    request = urllib.request.Request(
-        url=url,
-        data=data,
-        headers=request_headers,
-        method=method,
-    )
-
     try:
-        with urllib.request.urlopen(request, timeout=30) as response:
-            body = response.read()
-    except urllib.error.HTTPError as error:
-        details = error.read().decode("utf-8", errors="replace")
-        raise NetlifyApiError(
-            message=f"Netlify API request failed with status {error.code}.",
-            status_code=error.code,
-            details=details,
-        ) from error
-    except urllib.error.URLError as error:
+        response = HTTP_CLIENT.request(method, url, headers=request_headers, body=data)
+    except (OSError, http.client.HTTPException) as error:
         raise PublishError(
             "Could not reach the Netlify API.\n\n"
             "Check your network connection and try again.",
         ) from error
+    if response.status >= 400:
+        raise NetlifyApiError(
+            message=f"Netlify API request failed with status {response.status}.",
+            status_code=response.status,
+            details=response.body.decode("utf-8", errors="replace"),
+            retry_after=server_requested_delay(response.headers),
+        )
 
+    body = response.body
     if not body:
-        return {}
+        return {}, response.headers
     try:
-        return json.loads(body.decode("utf-8"))
+        return json.loads(body.decode("utf-8")), response.headers
     except json.JSONDecodeError as error:
         raise PublishError(
             "Netlify returned a response that could not be parsed as JSON.\n\n"
@@ -591,16 +1068,47 @@ def open_in_browser(url: str) -> None:
         return
 
 
-def verify_deploy_content_type(url: str) -> None:
+def verify_deploy_content_type(
+    url: str,
+    *,
+    ready: threading.Event,
+    cancelled: threading.Event,
+    accept_before_ready: bool,
+) -> None:
+    delays = backoff_delays(VERIFY_MAX_INTERVAL_SECONDS)
     last_content_type: str | None = None
-    for _ in range(3):
-        content_type = fetch_content_type(url, method="HEAD")
-        if content_type is None:
-            content_type = fetch_content_type(url, method="GET")
-        if content_type is not None and content_type.lower().startswith("text/html"):
-            return
-        last_content_type = content_type
-        time.sleep(2)
+    last_error: PublishError | None = None
+    give_up_at: float | None = None
+    while not cancelled.is_set():
+        after_ready = ready.is_set()
+        counts = accept_before_ready or after_ready
+        try:
+            content_type = fetch_content_type(url, method="HEAD")
+            if content_type is None:
+                content_type = fetch_content_type(url, method="GET")
+        except PublishError as error:
+            # Until the deploy is ready (and through the grace period after
+            # it), an unreachable or failing site just means not served yet.
+            content_type = None
+            last_error = error if after_ready else None
+        else:
+            last_error = None
+        if counts and content_type is not None:
+            if content_type.lower().startswith("text/html"):
+                return
+            last_content_type = content_type
+        if ready.is_set():
+            give_up_at = give_up_at or time.monotonic() + VERIFY_GRACE_SECONDS
+            if time.monotonic() >= give_up_at:
+                break
+            time.sleep(next(delays))
+        else:
+            # Wakes early when the deploy turns ready, to check right away.
+            ready.wait(next(delays))
+    if cancelled.is_set():
+        return
+    if last_error is not None:
+        raise last_error
 
     details = (
         f"Received Content-Type: {last_content_type}.\n\n"
@@ -616,29 +1124,34 @@ def verify_deploy_content_type(url: str) -> None:
 
 
 def fetch_content_type(url: str, method: str) -> str | None:
-    request = urllib.request.Request(
-        url=url,
-        headers={
-            "User-Agent": "visual-explainer-netlify-publisher",
-            "Accept": "text/html,*/*;q=0.8",
-        },
-        method=method,
+    headers = {"User-Agent": USER_AGENT, "Accept": "text/html,*/*;q=0.8"}
+    for _ in range(MAX_REDIRECTS + 1):
+        try:
+            response = HTTP_CLIENT.request(method, url, headers=headers)
+        except (OSError, http.client.HTTPException, ValueError) as error:
+            raise PublishError(
+                "Could not verify the deployed page content type.\n\n"
+                "Check your network connection and the published URL, then retry.",
+            ) from error
+        location = response.headers.get("Location")
+        if response.status in REDIRECT_STATUSES and location:
+            url = urllib.parse.urljoin(url, location)
+            continue
+        if response.status >= 400:
+            if method == "HEAD" and response.status in {403, 405}:
+                return None
+            if response.status == 404 or response.status in THROTTLED_STATUSES:
+                # Not live yet (or throttled); the caller retries.
+                return None
+            raise PublishError(
+                "Could not verify the deployed page content type.\n\n"
+                "Check the published URL in Netlify and retry publish if needed.",
+            )
+        return response.headers.get("Content-Type")
+    raise PublishError(
+        "Could not verify the deployed page content type.\n\n"
+        f"The published URL redirected more than {MAX_REDIRECTS} times.",
     )
-    try:
-        with urllib.request.urlopen(request, timeout=30) as response:
-            return response.headers.get("Content-Type")
-    except urllib.error.HTTPError as error:
-        if method == "HEAD" and error.code in {403, 405}:
-            return None
-        raise PublishError(
-            "Could not verify the deployed page content type.\n\n"
-            "Check the published URL in Netlify and retry publish if needed.",
-        ) from error
-    except urllib.error.URLError as error:
-        raise PublishError(
-            "Could not verify the deployed page content type.\n\n"
-            "Check your network connection and the published URL, then retry.",
-        ) from error
 
 
 def emit_success(receipt: dict[str, Any], json_output: bool) -> None:
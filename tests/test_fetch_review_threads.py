@@ -40,10 +40,18 @@ def build_fake_click() -> ModuleType:
     def fake_echo(*_args: object, **_kwargs: object) -> None:
         return None
 
+    def fake_path(*_args: object, **_kwargs: object) -> object:
+        return object()
+
+    def fake_int_range(*_args: object, **_kwargs: object) -> object:
+        return object()
+
     fake_click.ClickException = FakeClickException
     fake_click.command = fake_command
     fake_click.option = fake_option
     fake_click.echo = fake_echo
+    fake_click.Path = fake_path
+    fake_click.IntRange = fake_int_range
     return fake_click
 
 
@@ -53,11 +61,12 @@ def load_module_under_test() -> object:
         raise RuntimeError(f"Unable to load module from {MODULE_PATH}")
 
     module = importlib.util.module_from_spec(spec)
+    # Scripts import sibling helpers the way `uv run --script` resolves them.
     with patch.dict(
         sys.modules,
         {"click": build_fake_click(), spec.name: module},
         clear=False,
-    ):
+    ), patch.object(sys, "path", [str(MODULE_PATH.parent), *sys.path]):
         spec.loader.exec_module(module)
     return module
 
@@ -379,6 +388,19 @@ class FetchReviewThreadsTests(unittest.TestCase):
         self.assertEqual(thread["comment_ids"], [101, 102])
         self.assertEqual(mocked_call_graphql.call_count, 2)
 
+    def test_gh_auth_runs_one_check_only_on_cache_miss(self) -> None:
+        with patch.object(
+            FETCH_REVIEW_THREADS, "cached_github_auth", return_value=False
+        ), patch.object(FETCH_REVIEW_THREADS, "run_command") as mocked_run:
+            FETCH_REVIEW_THREADS.ensure_gh_authenticated()
+        mocked_run.assert_called_once_with(["gh", "auth", "status"])
+
+        with patch.object(
+            FETCH_REVIEW_THREADS, "cached_github_auth", return_value=True
+        ), patch.object(FETCH_REVIEW_THREADS, "run_command") as mocked_run:
+            FETCH_REVIEW_THREADS.ensure_gh_authenticated()
+        mocked_run.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
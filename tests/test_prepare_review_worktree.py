@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 import subprocess
 import tempfile
 import unittest
+from unittest import mock
 
 
 SCRIPT_PATH = (
@@ -16,19 +18,46 @@ SCRIPT_PATH = (
     / "scripts"
     / "prepare_review_worktree.py"
 )
+POOL_SCRIPT_PATH = SCRIPT_PATH.with_name("worktree_pool.py")
 
 
-def run_command(command: list[str], cwd: Path) -> subprocess.CompletedProcess[str]:
+# Local-path submodule clones are blocked by default since git 2.38.1.
+FILE_PROTOCOL_ENV = {
+    "GIT_CONFIG_COUNT": "1",
+    "GIT_CONFIG_KEY_0": "protocol.file.allow",
+    "GIT_CONFIG_VALUE_0": "always",
+}
+
+
+def run_command(
+    command: list[str], cwd: Path, env: dict[str, str] | None = None
+) -> subprocess.CompletedProcess[str]:
     return subprocess.run(
         command,
         cwd=cwd,
         text=True,
         capture_output=True,
         check=False,
+        env=None if env is None else {**os.environ, **env},
     )
 
 
 class PrepareReviewWorktreeTests(unittest.TestCase):
+    def setUp(self) -> None:
+        # Keep probe-cache and registry writes out of the developer's home;
+        # every subprocess inherits these through os.environ.
+        isolated_home = tempfile.TemporaryDirectory()
+        self.addCleanup(isolated_home.cleanup)
+        env_patch = mock.patch.dict(
+            os.environ,
+            {
+                "MONOLITH_REVIEW_CACHE_HOME": str(Path(isolated_home.name) / "cache"),
+                "MONOLITH_REVIEW_STATE_HOME": str(Path(isolated_home.name) / "state"),
+            },
+        )
+        env_patch.start()
+        self.addCleanup(env_patch.stop)
+
     def test_repair_dirty_reuse_recreates_registered_worktree(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             root = Path(temp_dir) / "monolith"
@@ -79,8 +108,384 @@ class PrepareReviewWorktreeTests(unittest.TestCase):
             self.assertEqual(status_result.stdout.strip(), "")
             self.assertEqual(dirty_file.read_text(encoding="utf-8"), "root\n")
 
-    def _run_git(self, args: list[str], cwd: Path) -> subprocess.CompletedProcess[str]:
-        result = run_command(["git", *args], cwd=cwd)
+    def test_pool_dir_leases_prewarmed_slot_and_release_returns_it(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir) / "monolith"
+            root.mkdir(parents=True, exist_ok=True)
+
+            self._run_git(["init"], cwd=root)
+            self._run_git(["config", "user.name", "Codex Test"], cwd=root)
+            self._run_git(["config", "user.email", "codex@example.com"], cwd=root)
+            (root / "README.md").write_text("root\n", encoding="utf-8")
+            self._run_git(["add", "README.md"], cwd=root)
+            self._run_git(["commit", "-m", "initial"], cwd=root)
+
+            pool_dir = Path(temp_dir) / "pool"
+            warm_result = self._run_script(
+                POOL_SCRIPT_PATH,
+                [
+                    "warm",
+                    "--monolith-root",
+                    str(root),
+                    "--pool-dir",
+                    str(pool_dir),
+                    "--size",
+                    "1",
+                ],
+                cwd=root,
+            )
+            slot_path = Path(json.loads(warm_result.stdout)["created"][0])
+            (slot_path / "leftover.txt").write_text("stale\n", encoding="utf-8")
+
+            worktree_path = Path(temp_dir) / "monolith-review-bk1"
+            prepare_args = [
+                "--monolith-root",
+                str(root),
+                "--worktree-path",
+                str(worktree_path),
+                "--pool-dir",
+                str(pool_dir),
+            ]
+            leased = json.loads(
+                self._run_script(SCRIPT_PATH, prepare_args, cwd=root).stdout
+            )
+            self.assertEqual(leased["action"], "leased")
+            self.assertFalse(leased["dirty"])
+            self.assertEqual(leased["pool_slot_path"], str(slot_path.resolve()))
+            self.assertTrue(worktree_path.is_symlink())
+            self.assertFalse((slot_path / "leftover.txt").exists())
+
+            reused = json.loads(
+                self._run_script(SCRIPT_PATH, prepare_args, cwd=root).stdout
+            )
+            self.assertEqual(reused["action"], "reused")
+
+            self._run_script(
+                POOL_SCRIPT_PATH,
+                [
+                    "release",
+                    "--pool-dir",
+                    str(pool_dir),
+                    "--worktree-path",
+                    str(worktree_path),
+                ],
+                cwd=root,
+            )
+            self.assertFalse(worktree_path.exists())
+            status = json.loads(
+                self._run_script(
+                    POOL_SCRIPT_PATH, ["status", "--pool-dir", str(pool_dir)], cwd=root
+                ).stdout
+            )
+            self.assertEqual(status["idle"], 1)
+
+    def test_leased_slot_moves_to_root_head_and_submodule_gitlinks(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = self._init_monolith_with_backend(Path(temp_dir))
+            pool_dir = Path(temp_dir) / "pool"
+            self._run_script(
+                POOL_SCRIPT_PATH,
+                [
+                    "warm",
+                    "--monolith-root",
+                    str(root),
+                    "--pool-dir",
+                    str(pool_dir),
+                    "--size",
+                    "1",
+                    "--submodule-path",
+                    "backend",
+                ],
+                cwd=root,
+                env=FILE_PROTOCOL_ENV,
+            )
+
+            # Move the root on after warming: new tree content and a new gitlink.
+            upstream = Path(temp_dir) / "backend-upstream"
+            (upstream / "app.py").write_text("print('v2')\n", encoding="utf-8")
+            self._run_git(["commit", "-am", "backend v2"], cwd=upstream)
+            self._run_git(
+                ["pull", "--quiet"], cwd=root / "backend", env=FILE_PROTOCOL_ENV
+            )
+            (root / "README.md").write_text("v2\n", encoding="utf-8")
+            self._run_git(["add", "README.md", "backend"], cwd=root)
+            self._run_git(["commit", "-m", "advance"], cwd=root)
+
+            worktree_path = Path(temp_dir) / "monolith-review-bk1"
+            args = [
+                "--monolith-root",
+                str(root),
+                "--worktree-path",
+                str(worktree_path),
+                "--pool-dir",
+                str(pool_dir),
+                "--submodule-path",
+                "backend",
+            ]
+            leased = json.loads(
+                self._run_script(
+                    SCRIPT_PATH, args, cwd=root, env=FILE_PROTOCOL_ENV
+                ).stdout
+            )
+
+            self.assertEqual(leased["action"], "leased")
+            self.assertFalse(leased["dirty"])
+            self.assertEqual(
+                self._run_git(["rev-parse", "HEAD"], cwd=worktree_path).stdout,
+                self._run_git(["rev-parse", "HEAD"], cwd=root).stdout,
+            )
+            self.assertEqual(
+                (worktree_path / "backend" / "app.py").read_text(encoding="utf-8"),
+                "print('v2')\n",
+            )
+            status = self._run_git(["status", "--porcelain"], cwd=worktree_path)
+            self.assertEqual(status.stdout.strip(), "")
+
+            reused = json.loads(
+                self._run_script(
+                    SCRIPT_PATH, args, cwd=root, env=FILE_PROTOCOL_ENV
+                ).stdout
+            )
+            self.assertEqual(reused["action"], "reused")
+            self.assertFalse(reused["dirty"])
+
+    def test_submodules_borrow_objects_from_monolith_root(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = self._init_monolith_with_backend(Path(temp_dir))
+            worktree_path = Path(temp_dir) / "monolith-review-bk1"
+            payload = json.loads(
+                self._run_script(
+                    SCRIPT_PATH,
+                    [
+                        "--monolith-root",
+                        str(root),
+                        "--worktree-path",
+                        str(worktree_path),
+                        "--submodule-path",
+                        "backend",
+                    ],
+                    cwd=root,
+                    env=FILE_PROTOCOL_ENV,
+                ).stdout
+            )
+
+            self.assertEqual(payload["action"], "created")
+            self.assertFalse(payload["dirty"])
+            self.assertTrue((worktree_path / "backend" / "app.py").exists())
+            git_dir = self._run_git(
+                ["rev-parse", "--absolute-git-dir"], cwd=worktree_path / "backend"
+            ).stdout.strip()
+            alternates = Path(git_dir) / "objects" / "info" / "alternates"
+            self.assertIn(
+                str((root / ".git" / "modules" / "backend").resolve()),
+                alternates.read_text(encoding="utf-8"),
+            )
+
+    def test_sparse_worktree_is_scoped_to_touched_directories(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir) / "monolith"
+            root.mkdir()
+            self._init_repo(root)
+            for relative in ("docs/a.md", "scripts/b.py", "api/v1/c.py", "web/d.ts"):
+                path = root / relative
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text("base\n", encoding="utf-8")
+            self._run_git(["add", "."], cwd=root)
+            self._run_git(["commit", "-m", "base"], cwd=root)
+            self._run_git(["tag", "base"], cwd=root)
+            (root / "api" / "v1" / "c.py").write_text("head\n", encoding="utf-8")
+            self._run_git(["commit", "-am", "head"], cwd=root)
+
+            worktree_path = Path(temp_dir) / "monolith-review-mono1"
+            payload = json.loads(
+                self._run_script(
+                    SCRIPT_PATH,
+                    [
+                        "--monolith-root",
+                        str(root),
+                        "--worktree-path",
+                        str(worktree_path),
+                        "--sparse",
+                        "--sparse-diff",
+                        "base...HEAD",
+                    ],
+                    cwd=root,
+                ).stdout
+            )
+
+            self.assertEqual(payload["action"], "created")
+            self.assertFalse(payload["dirty"])
+            self.assertEqual(
+                payload["sparse_cones"], {".": ["api/v1", "docs", "scripts"]}
+            )
+            self.assertTrue((worktree_path / "api" / "v1" / "c.py").exists())
+            self.assertTrue((worktree_path / "docs" / "a.md").exists())
+            self.assertFalse((worktree_path / "web").exists())
+
+            widened = json.loads(
+                self._run_script(
+                    SCRIPT_PATH,
+                    [
+                        "--monolith-root",
+                        str(root),
+                        "--worktree-path",
+                        str(worktree_path),
+                        "--sparse",
+                        "--sparse-include",
+                        "web",
+                    ],
+                    cwd=root,
+                ).stdout
+            )
+            self.assertEqual(widened["action"], "reused")
+            # The effective cone, not only this run's additions.
+            self.assertEqual(
+                widened["sparse_cones"], {".": ["api/v1", "docs", "scripts", "web"]}
+            )
+            self.assertTrue((worktree_path / "web" / "d.ts").exists())
+
+            pooled = run_command(
+                [
+                    "uv",
+                    "run",
+                    "--quiet",
+                    "--script",
+                    str(SCRIPT_PATH),
+                    "--monolith-root",
+                    str(root),
+                    "--worktree-path",
+                    str(Path(temp_dir) / "monolith-review-mono2"),
+                    "--pool-dir",
+                    str(Path(temp_dir) / "pool"),
+                    "--sparse",
+                ],
+                cwd=root,
+            )
+            self.assertNotEqual(pooled.returncode, 0)
+            self.assertIn("--sparse cannot be combined with --pool-dir", pooled.stderr)
+
+    def test_reuse_detects_dirty_batch_submodule(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = self._init_monolith_with_backend(Path(temp_dir))
+            worktree_path = Path(temp_dir) / "monolith-review-bk1"
+            args = [
+                "--monolith-root",
+                str(root),
+                "--worktree-path",
+                str(worktree_path),
+                "--submodule-path",
+                "backend",
+            ]
+            self._run_script(SCRIPT_PATH, args, cwd=root, env=FILE_PROTOCOL_ENV)
+            (worktree_path / "backend" / "scratch.txt").write_text(
+                "local\n", encoding="utf-8"
+            )
+
+            result = run_command(
+                ["uv", "run", "--quiet", "--script", str(SCRIPT_PATH), *args],
+                cwd=root,
+                env=FILE_PROTOCOL_ENV,
+            )
+
+            self.assertNotEqual(result.returncode, 0)
+            self.assertIn("dirty reuse was not allowed", result.stderr)
+
+            reused = json.loads(
+                self._run_script(
+                    SCRIPT_PATH,
+                    [*args, "--allow-dirty-reuse"],
+                    cwd=root,
+                    env=FILE_PROTOCOL_ENV,
+                ).stdout
+            )
+            self.assertEqual(reused["action"], "reused")
+            self.assertTrue(reused["dirty"])
+
+    def test_reuse_reports_clean_once_init_fixes_gitlink_drift(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = self._init_monolith_with_backend(Path(temp_dir))
+            worktree_path = Path(temp_dir) / "monolith-review-bk1"
+            args = [
+                "--monolith-root",
+                str(root),
+                "--worktree-path",
+                str(worktree_path),
+                "--submodule-path",
+                "backend",
+            ]
+            self._run_script(SCRIPT_PATH, args, cwd=root, env=FILE_PROTOCOL_ENV)
+
+            # Move the worktree to a commit whose backend gitlink is newer than
+            # the backend checkout, so the first status probe sees drift.
+            upstream = Path(temp_dir) / "backend-upstream"
+            (upstream / "app.py").write_text("print('v2')\n", encoding="utf-8")
+            self._run_git(["commit", "-am", "backend v2"], cwd=upstream)
+            self._run_git(
+                ["pull", "--quiet"], cwd=root / "backend", env=FILE_PROTOCOL_ENV
+            )
+            self._run_git(["commit", "-am", "bump backend"], cwd=root)
+            head = self._run_git(["rev-parse", "HEAD"], cwd=root).stdout.strip()
+            self._run_git(["checkout", "--quiet", "--detach", head], cwd=worktree_path)
+
+            reused = json.loads(
+                self._run_script(
+                    SCRIPT_PATH,
+                    [*args, "--allow-dirty-reuse"],
+                    cwd=root,
+                    env=FILE_PROTOCOL_ENV,
+                ).stdout
+            )
+
+            self.assertEqual(reused["action"], "reused")
+            self.assertEqual(
+                (worktree_path / "backend" / "app.py").read_text(encoding="utf-8"),
+                "print('v2')\n",
+            )
+            self.assertFalse(reused["dirty"])
+
+    def _init_monolith_with_backend(self, temp_dir: Path) -> Path:
+        upstream = temp_dir / "backend-upstream"
+        upstream.mkdir()
+        self._init_repo(upstream)
+        (upstream / "app.py").write_text("print('hi')\n", encoding="utf-8")
+        self._run_git(["add", "app.py"], cwd=upstream)
+        self._run_git(["commit", "-m", "backend"], cwd=upstream)
+
+        root = temp_dir / "monolith"
+        root.mkdir()
+        self._init_repo(root)
+        self._run_git(
+            ["submodule", "add", str(upstream), "backend"],
+            cwd=root,
+            env=FILE_PROTOCOL_ENV,
+        )
+        self._run_git(["commit", "-m", "add backend"], cwd=root)
+        return root
+
+    def _init_repo(self, path: Path) -> None:
+        self._run_git(["init"], cwd=path)
+        self._run_git(["config", "user.name", "Codex Test"], cwd=path)
+        self._run_git(["config", "user.email", "codex@example.com"], cwd=path)
+
+    def _run_script(
+        self,
+        script_path: Path,
+        args: list[str],
+        cwd: Path,
+        env: dict[str, str] | None = None,
+    ) -> subprocess.CompletedProcess[str]:
+        result = run_command(
+            ["uv", "run", "--quiet", "--script", str(script_path), *args],
+            cwd=cwd,
+            env=env,
+        )
+        self.assertEqual(result.returncode, 0, msg=result.stderr)
+        return result
+
+    def _run_git(
+        self, args: list[str], cwd: Path, env: dict[str, str] | None = None
+    ) -> subprocess.CompletedProcess[str]:
+        result = run_command(["git", *args], cwd=cwd, env=env)
         self.assertEqual(result.returncode, 0, msg=result.stderr)
         return result
 
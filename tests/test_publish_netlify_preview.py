@@ -0,0 +1,392 @@
+from __future__ import annotations
+
+import hashlib
+import http.client
+import importlib.util
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+
+SCRIPT_PATH = (
+    Path(__file__).resolve().parents[1]
+    / "plugins"
+    / "visual-explainer"
+    / "skills"
+    / "visual-explainer"
+    / "scripts"
+    / "publish_netlify_preview.py"
+)
+
+
+class StubNetlify(ThreadingHTTPServer):
+    """Just enough of the Netlify API, plus the deployed site, over keep-alive."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubNetlifyHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests: list[tuple[str, str]] = []
+        self.known_digests: set[str] = set()
+        self.deploy_polls = 0
+        self.throttle_polls = 0
+        self.throttle_headers = {"Retry-After": "0"}
+        self.site_lookup_status = 200
+        self.drop_requests = 0
+        self.site_fails_until_ready = False
+
+    @property
+    def api_base(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/api/v1"
+
+    @property
+    def site_url(self) -> str:
+        # A different host name than the API, so each gets its own connection.
+        return f"http://localhost:{self.server_address[1]}/"
+
+
+class StubNetlifyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: StubNetlify
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format: str, *args: object) -> None:
+        return
+
+    def do_POST(self) -> None:
+        body = self.read_body()
+        if self.dropped():
+            return
+        if self.path.endswith("/sites"):
+            self.send_json(self.site())
+            return
+        digests = set(json.loads(body)["files"].values())
+        self.send_json(
+            {"id": "deploy-1", "required": sorted(digests - self.server.known_digests)}
+        )
+
+    def do_PUT(self) -> None:
+        body = self.read_body()
+        with self.server.lock:
+            self.server.known_digests.add(hashlib.sha1(body).hexdigest())
+        self.send_json({})
+
+    def do_GET(self) -> None:
+        self.read_body()
+        if self.dropped():
+            return
+        if self.path == "/api/v1/sites/site-1":
+            if self.server.site_lookup_status != 200:
+                self.send(self.server.site_lookup_status, b"{}", "application/json")
+                return
+            self.send_json(self.site())
+        elif self.path == "/api/v1/deploys/deploy-1":
+            with self.server.lock:
+                throttled = self.server.throttle_polls > 0
+                self.server.throttle_polls -= throttled
+            if throttled:
+                self.send(429, b"{}", "application/json", self.server.throttle_headers)
+                return
+            with self.server.lock:
+                self.server.deploy_polls += 1
+                state = "ready" if self.server.deploy_polls % 2 == 0 else "processing"
+            self.send_json({"id": "deploy-1", "state": state})
+        elif self.server.site_fails_until_ready and self.server.deploy_polls < 2:
+            self.send(500, b"", "text/plain")
+        else:
+            self.send(200, b"<html></html>", "text/html; charset=UTF-8")
+
+    do_HEAD = do_GET
+
+    def read_body(self) -> bytes:
+        with self.server.lock:
+            self.server.requests.append((self.command, self.path))
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def dropped(self) -> bool:
+        # Read the request, then hang up without answering, as a server that
+        # timed out the idle keep-alive connection mid-request would.
+        with self.server.lock:
+            drop = self.server.drop_requests > 0
+            self.server.drop_requests -= drop
+        self.close_connection = self.close_connection or drop
+        return drop
+
+    def site(self) -> dict[str, str]:
+        return {
+            "id": "site-1",
+            "name": "explainer-site",
+            "ssl_url": self.server.site_url,
+        }
+
+    def send_json(self, payload: object) -> None:
+        self.send(200, json.dumps(payload).encode("utf-8"), "application/json")
+
+    def send(
+        self,
+        status: int,
+        body: bytes,
+        content_type: str,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+
+class PublishNetlifyPreviewTests(unittest.TestCase):
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+        self.server = StubNetlify()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.site_dir = self.root / "explainer"
+        (self.site_dir / "img").mkdir(parents=True)
+        (self.site_dir / "index.html").write_text("<html>hi</html>", encoding="utf-8")
+        (self.site_dir / "img" / "chart.svg").write_text("<svg/>", encoding="utf-8")
+
+    def publish(self, *args: str, source: Path | None = None) -> dict[str, object]:
+        result = self.run_publish(*args, source=source)
+        self.assertEqual(result.returncode, 0, msg=result.stdout + result.stderr)
+        return json.loads(result.stdout)
+
+    def run_publish(
+        self, *args: str, source: Path | None = None
+    ) -> subprocess.CompletedProcess[str]:
+        """Publish ``source`` (an HTML file) or, by default, the explainer dir."""
+
+        source_args = (
+            ["--site-dir", str(self.site_dir)]
+            if source is None
+            else ["--html-path", str(source)]
+        )
+        env = {
+            **os.environ,
+            "HOME": str(self.root / "home"),
+            "NETLIFY_VISUAL_EXPLAINER_API_BASE": self.server.api_base,
+            "NETLIFY_VISUAL_EXPLAINER_TOKEN": "test-token",
+            "NETLIFY_VISUAL_EXPLAINER_ACCOUNT_SLUG": "test-team",
+        }
+        return subprocess.run(
+            [
+                sys.executable,
+                str(SCRIPT_PATH),
+                *source_args,
+                "--title",
+                "Test explainer",
+                "--poll-interval-seconds",
+                "0.5",
+                "--json",
+                *args,
+            ],
+            text=True,
+            capture_output=True,
+            check=False,
+            env=env,
+        )
+
+    def test_publish_reuses_one_connection_per_host_and_times_requests(self) -> None:
+        # One upload worker, so no upload needs a connection of its own.
+        receipt = self.publish("--upload-workers", "1")
+
+        self.assertEqual(receipt["state"], "ready")
+        self.assertEqual(receipt["files_count"], 3)
+        self.assertEqual(receipt["uploaded_files_count"], 3)
+        # Site creation, deploy, uploads, and polls share the API connection;
+        # the content-type check gets one connection to the site host.
+        self.assertEqual(receipt["http_connections_opened"], 2)
+        self.assertEqual(self.server.connections, 2)
+        timings = receipt["http_requests"]
+        self.assertEqual(len(timings), len(self.server.requests))
+        self.assertEqual(sum(not item["reused_connection"] for item in timings), 2)
+        self.assertTrue(all(item["elapsed_ms"] >= 0 for item in timings))
+        self.assertNotIn("test-token", json.dumps(receipt))
+
+    def test_throttled_poll_honors_retry_after_and_records_phases(self) -> None:
+        self.server.throttle_polls = 1
+
+        started = time.monotonic()
+        receipt = self.publish()
+
+        self.assertEqual(receipt["state"], "ready")
+        # Retry-After: 0 retries right away instead of waiting out a full interval.
+        self.assertLess(time.monotonic() - started, 10)
+        polls = [
+            request
+            for request in self.server.requests
+            if request == ("GET", "/api/v1/deploys/deploy-1")
+        ]
+        self.assertEqual(len(polls), 3)
+        phases = receipt["phase_timings_ms"]
+        for phase in (
+            "prepare_files",
+            "site",
+            "create_deploy",
+            "upload",
+            "poll",
+            "verify",
+            "verify_after_ready",
+            "total",
+        ):
+            self.assertGreaterEqual(phases[phase], 0, msg=phase)
+        self.assertLessEqual(phases["poll"], phases["total"])
+
+    def test_site_errors_before_ready_do_not_fail_verification(self) -> None:
+        self.server.site_fails_until_ready = True
+
+        receipt = self.publish()
+
+        self.assertEqual(receipt["state"], "ready")
+
+    def test_digest_deploy_uploads_only_files_netlify_lacks(self) -> None:
+        (self.site_dir / ".notes.md").write_text("private\n", encoding="utf-8")
+
+        receipt = self.publish()
+
+        self.assertEqual(receipt["files_count"], 3)
+        self.assertEqual(receipt["uploaded_files_count"], 3)
+        uploads = sorted(
+            path for method, path in self.server.requests if method == "PUT"
+        )
+        self.assertEqual(
+            uploads,
+            [
+                "/api/v1/deploys/deploy-1/files/_headers",
+                "/api/v1/deploys/deploy-1/files/img/chart.svg",
+                "/api/v1/deploys/deploy-1/files/index.html",
+            ],
+        )
+        # Unchanged files are known to Netlify by digest and never re-sent.
+        self.assertEqual(self.publish()["uploaded_files_count"], 0)
+        single_page = self.root / "page.html"
+        single_page.write_text("<html>single</html>", encoding="utf-8")
+        single = self.publish(source=single_page)
+        self.assertEqual(single["files_count"], 2)
+        self.assertEqual(single["uploaded_files_count"], 1)
+
+    def test_throttled_poll_waits_out_an_exhausted_rate_limit(self) -> None:
+        self.server.throttle_polls = 1
+        self.server.throttle_headers = {
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(time.time())),
+        }
+
+        started = time.monotonic()
+        receipt = self.publish()
+
+        self.assertEqual(receipt["state"], "ready")
+        # The window has already reset, so the retry is immediate.
+        self.assertLess(time.monotonic() - started, 10)
+        polls = [
+            request
+            for request in self.server.requests
+            if request == ("GET", "/api/v1/deploys/deploy-1")
+        ]
+        self.assertEqual(len(polls), 3)
+
+    def test_update_redeploys_only_changed_files_to_the_same_site(self) -> None:
+        self.publish()
+        # Receipt file names have one-second resolution.
+        time.sleep(1.1)
+        (self.site_dir / "index.html").write_text("<html>v2</html>", encoding="utf-8")
+        self.server.requests.clear()
+
+        receipt = self.publish("--update")
+
+        self.assertTrue(receipt["site_reused"])
+        self.assertEqual(receipt["site_id"], "site-1")
+        self.assertEqual(receipt["uploaded_files_count"], 1)
+        self.assertNotIn(("POST", "/api/v1/test-team/sites"), self.server.requests)
+
+    def test_update_falls_back_to_the_latest_receipt_with_the_same_title(self) -> None:
+        single_page = self.root / "page.html"
+        single_page.write_text("<html>single</html>", encoding="utf-8")
+        self.publish(source=single_page)
+        time.sleep(1.1)
+
+        receipt = self.publish("--update")
+
+        self.assertTrue(receipt["site_reused"])
+        self.assertEqual(receipt["site_id"], "site-1")
+
+    def test_update_creates_a_new_site_when_the_old_one_was_deleted(self) -> None:
+        self.publish()
+        time.sleep(1.1)
+        self.server.site_lookup_status = 404
+        self.server.requests.clear()
+
+        receipt = self.publish("--update")
+
+        self.assertFalse(receipt["site_reused"])
+        self.assertIn(("POST", "/api/v1/test-team/sites"), self.server.requests)
+
+    def test_update_aborts_when_the_token_is_rejected(self) -> None:
+        self.publish()
+        time.sleep(1.1)
+        self.server.site_lookup_status = 401
+        self.server.requests.clear()
+
+        result = self.run_publish("--update")
+
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn("authentication failed", result.stdout)
+        self.assertNotIn(("POST", "/api/v1/test-team/sites"), self.server.requests)
+
+    def test_update_creates_a_new_site_when_the_old_one_is_forbidden(self) -> None:
+        self.publish()
+        time.sleep(1.1)
+        self.server.site_lookup_status = 403
+        self.server.requests.clear()
+
+        receipt = self.publish("--update")
+
+        self.assertFalse(receipt["site_reused"])
+        self.assertIn(("POST", "/api/v1/test-team/sites"), self.server.requests)
+
+    def test_dropped_reused_connection_resends_get_but_not_post(self) -> None:
+        spec = importlib.util.spec_from_file_location("publish_netlify_preview", SCRIPT_PATH)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        # Dataclasses look their module up in sys.modules while it loads.
+        sys.modules[spec.name] = module
+        self.addCleanup(sys.modules.pop, spec.name, None)
+        spec.loader.exec_module(module)
+        client = module.PooledHttpClient(timeout_seconds=5)
+        self.addCleanup(client.close)
+        site_url = f"{self.server.api_base}/sites/site-1"
+        client.request("GET", site_url)
+
+        self.server.drop_requests = 1
+        self.assertEqual(client.request("GET", site_url).status, 200)
+
+        self.server.drop_requests = 1
+        sites_url = f"{self.server.api_base}/test-team/sites"
+        with self.assertRaises(http.client.RemoteDisconnected):
+            client.request("POST", sites_url, body=b"{}")
+        self.assertEqual(self.server.requests.count(("GET", "/api/v1/sites/site-1")), 3)
+        self.assertEqual(self.server.requests.count(("POST", "/api/v1/test-team/sites")), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
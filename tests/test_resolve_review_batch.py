@@ -40,14 +40,30 @@ def build_fake_click() -> ModuleType:
     def fake_echo(*_args: object, **_kwargs: object) -> None:
         return None
 
+    def fake_group(*_args: object, **_kwargs: object):
+        def decorator(function: object) -> object:
+            function.command = fake_command
+            return function
+
+        return decorator
+
     def fake_path(*_args: object, **_kwargs: object) -> object:
         return object()
 
+    def fake_float_range(*_args: object, **_kwargs: object) -> object:
+        return object()
+
+    def fake_int_range(*_args: object, **_kwargs: object) -> object:
+        return object()
+
     fake_click.ClickException = FakeClickException
     fake_click.command = fake_command
     fake_click.option = fake_option
     fake_click.echo = fake_echo
+    fake_click.group = fake_group
     fake_click.Path = fake_path
+    fake_click.FloatRange = fake_float_range
+    fake_click.IntRange = fake_int_range
     return fake_click
 
 
@@ -57,11 +73,12 @@ def load_module_under_test() -> object:
         raise RuntimeError(f"Unable to load module from {MODULE_PATH}")
 
     module = importlib.util.module_from_spec(spec)
+    # Scripts import sibling helpers the way `uv run --script` resolves them.
     with patch.dict(
         sys.modules,
         {"click": build_fake_click(), spec.name: module},
         clear=False,
-    ):
+    ), patch.object(sys, "path", [str(MODULE_PATH.parent), *sys.path]):
         spec.loader.exec_module(module)
     return module
 
@@ -102,6 +119,34 @@ class ResolveReviewBatchTests(unittest.TestCase):
         self.assertEqual(payload["submodule_path"], "terraform-modules")
         self.assertEqual(payload["entry_key"], "tfm42")
 
+    def test_build_batch_key_keeps_short_keys_readable(self) -> None:
+        self.assertEqual(
+            RESOLVE_REVIEW_BATCH.build_batch_key(
+                ["bk2779", "ds12", "fe410", "infra88"]
+            ),
+            "bk2779-ds12-fe410-infra88",
+        )
+
+    def test_build_batch_key_bounds_long_keys_with_digest(self) -> None:
+        entry_keys = [
+            "bk2779",
+            "ds1200",
+            "fe41000",
+            "infra8800",
+            "of38900",
+            "sls7700",
+            "tfm4200",
+        ]
+        batch_key = RESOLVE_REVIEW_BATCH.build_batch_key(entry_keys)
+        other_key = RESOLVE_REVIEW_BATCH.build_batch_key([*entry_keys[:-1], "tfm4201"])
+
+        self.assertLessEqual(
+            len(batch_key), RESOLVE_REVIEW_BATCH.MAX_BATCH_KEY_LENGTH
+        )
+        self.assertTrue(batch_key.startswith("bk2779-ds1200-"))
+        self.assertEqual(batch_key, RESOLVE_REVIEW_BATCH.build_batch_key(entry_keys))
+        self.assertNotEqual(batch_key, other_key)
+
     def test_review_and_worktree_roots_are_applied(self) -> None:
         monolith_root = Path("/tmp/monolith-root")
         review_root = Path("/tmp/review-root")
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import subprocess
+import tempfile
+import unittest
+
+
+SCRIPT_PATH = (
+    Path(__file__).resolve().parents[1]
+    / "plugins"
+    / "monolith-review-orchestrator"
+    / "skills"
+    / "monolith-review-orchestrator"
+    / "scripts"
+    / "review_env_probe.py"
+)
+PREFLIGHT_SCRIPT_PATH = SCRIPT_PATH.with_name("preflight_review_env.py")
+MONOLITH_MARKERS: tuple[str, ...] = (
+    ".gitmodules",
+    ".submodule-branches",
+    "scripts/create_worktree.py",
+    "scripts/update_submodules.py",
+    "docs/github-first-branch-and-pr-conventions.md",
+)
+# Budget for the preflight command body once the probe is cached.
+CACHED_PREFLIGHT_BUDGET_MS = 50.0
+
+
+def run_command(
+    command: list[str], cwd: Path, env: dict[str, str] | None = None
+) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        command,
+        cwd=cwd,
+        text=True,
+        capture_output=True,
+        check=False,
+        env=None if env is None else {**os.environ, **env},
+    )
+
+
+class ReviewEnvProbeTests(unittest.TestCase):
+    def test_successful_probe_is_cached_until_refresh(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir) / "monolith"
+            self._init_monolith(root)
+            env = {"MONOLITH_REVIEW_CACHE_HOME": str(Path(temp_dir) / "cache")}
+
+            first = self._probe(root, env)
+            self.assertEqual(first["monolith_root"], str(root.resolve()))
+            self.assertEqual(first["worktrees"], [str(root.resolve())])
+
+            worktree_path = Path(temp_dir) / "monolith-review-bk1"
+            self._run_git(
+                ["worktree", "add", "--detach", str(worktree_path), "HEAD"],
+                cwd=root,
+            )
+
+            cached = self._probe(root, env)
+            self.assertEqual(cached["probed_at"], first["probed_at"])
+            self.assertEqual(cached["worktrees"], [str(root.resolve())])
+
+            refreshed = self._probe(root, env, "--refresh")
+            self.assertIn(str(worktree_path.resolve()), refreshed["worktrees"])
+
+    def test_failed_probe_is_never_served_from_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            plain = Path(temp_dir) / "plain"
+            plain.mkdir()
+            env = {"MONOLITH_REVIEW_CACHE_HOME": str(Path(temp_dir) / "cache")}
+
+            first = self._probe(plain, env)
+            self.assertIsNone(first["monolith_root"])
+            self.assertEqual(sorted(first["missing_markers"]), sorted(MONOLITH_MARKERS))
+
+            second = self._probe(plain, env)
+            self.assertNotEqual(second["probed_at"], first["probed_at"])
+
+    def test_probe_with_missing_markers_is_never_served_from_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir) / "monolith"
+            self._init_monolith(root)
+            env = {"MONOLITH_REVIEW_CACHE_HOME": str(Path(temp_dir) / "cache")}
+
+            # The root is found, but the start path itself fails the marker check.
+            first = self._probe(root / "docs", env)
+            self.assertEqual(first["monolith_root"], str(root.resolve()))
+            self.assertTrue(first["missing_markers"])
+
+            second = self._probe(root / "docs", env)
+            self.assertNotEqual(second["probed_at"], first["probed_at"])
+
+    def test_preflight_json_report_reuses_recent_passes(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir) / "monolith"
+            self._init_monolith(root)
+            env = {"MONOLITH_REVIEW_CACHE_HOME": str(Path(temp_dir) / "cache")}
+
+            reports = []
+            for _ in range(2):
+                result = run_command(
+                    [
+                        "uv",
+                        "run",
+                        "--quiet",
+                        "--script",
+                        str(PREFLIGHT_SCRIPT_PATH),
+                        "--monolith-root",
+                        str(root),
+                        "--min-free-mb",
+                        "0",
+                        "--format",
+                        "json",
+                    ],
+                    cwd=root,
+                    env=env,
+                )
+                self.assertEqual(result.returncode, 0, msg=result.stderr)
+                reports.append(json.loads(result.stdout))
+
+            first, second = reports
+            self.assertTrue(first["ok"])
+            checks = {check["name"]: check for check in second["checks"]}
+            self.assertEqual(
+                set(checks),
+                {
+                    "git_repository",
+                    "monolith_markers",
+                    "tools",
+                    "worktree_list",
+                    "sibling_parent",
+                },
+            )
+            self.assertFalse(
+                any(check["cached"] for check in first["checks"])
+            )
+            self.assertTrue(checks["worktree_list"]["cached"])
+            self.assertEqual(checks["worktree_list"]["duration_ms"], 0.0)
+            self.assertFalse(checks["sibling_parent"]["cached"])
+
+    def test_cached_preflight_fits_budget_and_breaks_down_imports(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir) / "monolith"
+            self._init_monolith(root)
+            env = {"MONOLITH_REVIEW_CACHE_HOME": str(Path(temp_dir) / "cache")}
+
+            profiles = []
+            for _ in range(2):
+                result = run_command(
+                    [
+                        "uv",
+                        "run",
+                        "--quiet",
+                        "--script",
+                        str(PREFLIGHT_SCRIPT_PATH),
+                        "--monolith-root",
+                        str(root),
+                        "--min-free-mb",
+                        "0",
+                        "--profile-startup",
+                    ],
+                    cwd=root,
+                    env=env,
+                )
+                self.assertEqual(result.returncode, 0, msg=result.stderr)
+                [line] = [
+                    line
+                    for line in result.stderr.splitlines()
+                    if line.startswith("STARTUP: ")
+                ]
+                profiles.append(json.loads(line.removeprefix("STARTUP: ")))
+
+            cached = profiles[1]
+            self.assertLess(cached["run_ms"], CACHED_PREFLIGHT_BUDGET_MS)
+            self.assertGreater(cached["import_ms"], 0)
+            imported = [item["module"] for item in cached["imports"]]
+            self.assertIn("click", imported)
+            self.assertIn("review_env_probe", imported)
+
+    def _init_monolith(self, root: Path) -> None:
+        root.mkdir(parents=True)
+        self._run_git(["init"], cwd=root)
+        self._run_git(["config", "user.name", "Codex Test"], cwd=root)
+        self._run_git(["config", "user.email", "codex@example.com"], cwd=root)
+        for marker in MONOLITH_MARKERS:
+            marker_path = root / marker
+            marker_path.parent.mkdir(parents=True, exist_ok=True)
+            marker_path.write_text("marker\n", encoding="utf-8")
+        self._run_git(["add", "."], cwd=root)
+        self._run_git(["commit", "-m", "initial"], cwd=root)
+
+    def _probe(self, start: Path, env: dict[str, str], *extra: str) -> dict:
+        result = run_command(
+            [
+                "uv",
+                "run",
+                "--quiet",
+                "--script",
+                str(SCRIPT_PATH),
+                "--start-path",
+                str(start),
+                *extra,
+            ],
+            cwd=start,
+            env=env,
+        )
+        self.assertEqual(result.returncode, 0, msg=result.stderr)
+        return json.loads(result.stdout)
+
+    def _run_git(self, args: list[str], cwd: Path) -> None:
+        result = run_command(["git", *args], cwd=cwd)
+        if result.returncode != 0:
+            raise AssertionError(result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
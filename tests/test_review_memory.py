@@ -0,0 +1,565 @@
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import shutil
+from pathlib import Path
+import subprocess
+import tempfile
+import unittest
+
+
+SCRIPT_PATH = (
+    Path(__file__).resolve().parents[1]
+    / "plugins"
+    / "monty-code-review"
+    / "skills"
+    / "monty-code-review"
+    / "scripts"
+    / "review_memory.py"
+)
+
+
+def run_memory(
+    args: list[str],
+    env: dict[str, str],
+    stdin: str | None = None,
+    cwd: Path | None = None,
+) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        ["uv", "run", "--quiet", "--script", str(SCRIPT_PATH), *args],
+        input=stdin,
+        cwd=cwd,
+        text=True,
+        capture_output=True,
+        check=False,
+        env={**os.environ, **env},
+    )
+
+
+def review_payload(head_sha: str, **findings: list[dict[str, object]]) -> str:
+    return json.dumps(
+        {
+            "head_sha": head_sha,
+            "history_status": "linear",
+            "repo_review_file": "docs/code_reviews/pr_1842_review.md",
+            "recommendation": "request_changes",
+            "findings": {
+                "new": findings.get("new", []),
+                "carried_forward": findings.get("carried_forward", []),
+                "resolved": findings.get("resolved", []),
+            },
+        }
+    )
+
+
+class ReviewMemoryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._temp_dir.cleanup)
+        self.env = {"MONTY_REVIEW_MEMORY_HOME": str(Path(self._temp_dir.name))}
+
+    def resolve_scope(self, pull_number: int = 1842) -> Path:
+        resolved = run_memory(
+            [
+                "resolve-scope",
+                "--provider",
+                "github",
+                "--owner",
+                "DiversioTeam",
+                "--repo",
+                "monolith",
+                "--pull-number",
+                str(pull_number),
+            ],
+            self.env,
+        )
+        self.assertEqual(resolved.returncode, 0, msg=resolved.stderr)
+        return Path(json.loads(resolved.stdout)["scope_dir"])
+
+    def record(self, scope_dir: Path, payload: str) -> dict[str, object]:
+        recorded = run_memory(
+            ["record-review", "--scope-dir", str(scope_dir)], self.env, payload
+        )
+        self.assertEqual(recorded.returncode, 0, msg=recorded.stderr)
+        return json.loads(recorded.stdout)
+
+    def summarize(self, scope_dir: Path) -> dict[str, object]:
+        summarized = run_memory(
+            ["summarize-context", "--scope-dir", str(scope_dir)], self.env
+        )
+        self.assertEqual(summarized.returncode, 0, msg=summarized.stderr)
+        return json.loads(summarized.stdout)
+
+    def report(self, *args: str) -> dict[str, object]:
+        reported = run_memory(["report", *args], self.env)
+        self.assertEqual(reported.returncode, 0, msg=reported.stderr)
+        return json.loads(reported.stdout)
+
+    def read_reviews(self, scope_dir: Path, *args: str) -> dict[str, object]:
+        result = run_memory(
+            ["read-reviews", "--scope-dir", str(scope_dir), *args], self.env
+        )
+        self.assertEqual(result.returncode, 0, msg=result.stderr)
+        return json.loads(result.stdout)
+
+    def test_record_and_summarize_round_trip(self) -> None:
+        scope_dir = self.resolve_scope()
+        finding = {
+            "finding_id": "n-plus-one|app/service.py|get_rows",
+            "severity": "high",
+        }
+
+        first = self.record(scope_dir, review_payload("abc1234", new=[finding]))
+        self.assertEqual(first["review_number"], 1)
+        second = self.record(
+            scope_dir, review_payload("def4567", resolved=[finding])
+        )
+        self.assertEqual(second["open_findings_count"], 0)
+
+        summary = self.summarize(scope_dir)
+        self.assertEqual(summary["next_review_number"], 3)
+        self.assertEqual(summary["last_reviewed_head_sha"], "def4567")
+        self.assertEqual(summary["latest_review"]["review_number"], 2)
+        self.assertEqual(
+            [item["finding_id"] for item in summary["recent_resolved_findings"]],
+            [finding["finding_id"]],
+        )
+
+    def test_resolving_an_unchanged_scope_does_not_rewrite_state(self) -> None:
+        scope_dir = self.resolve_scope()
+        self.record(scope_dir, review_payload("abc1234"))
+        state_file = scope_dir / "state.json"
+        before = state_file.stat()
+
+        self.assertEqual(self.resolve_scope(), scope_dir)
+        after = state_file.stat()
+        self.assertEqual(
+            (after.st_ino, after.st_mtime_ns), (before.st_ino, before.st_mtime_ns)
+        )
+        self.assertEqual(self.summarize(scope_dir)["next_review_number"], 2)
+
+    def test_summaries_share_the_scope_lock_with_other_readers(self) -> None:
+        scope_dir = self.resolve_scope()
+        self.record(scope_dir, review_payload("abc1234"))
+
+        # A concurrent reader holding the shared lock must not block another.
+        descriptor = os.open(scope_dir / ".lock", os.O_RDWR)
+        try:
+            fcntl.flock(descriptor, fcntl.LOCK_SH)
+            summary = self.summarize(scope_dir)
+        finally:
+            os.close(descriptor)
+        self.assertEqual(summary["next_review_number"], 2)
+        # The lock file stays in place so every process locks the same inode.
+        self.assertTrue((scope_dir / ".lock").is_file())
+
+    def test_summary_ignores_rows_not_yet_committed_to_state(self) -> None:
+        scope_dir = self.resolve_scope()
+        self.record(scope_dir, review_payload("abc1234"))
+        state = json.loads((scope_dir / "state.json").read_text(encoding="utf-8"))
+        reviews_file = scope_dir / "reviews.jsonl"
+        self.assertEqual(state["reviews_log_bytes"], reviews_file.stat().st_size)
+
+        # Simulate a writer that appended half a row but has not swapped state.
+        with reviews_file.open("a", encoding="utf-8") as handle:
+            handle.write('{"review_number": 2, "head_sha": "def')
+
+        summary = self.summarize(scope_dir)
+        self.assertEqual(summary["next_review_number"], 2)
+        self.assertEqual(summary["latest_review"]["review_number"], 1)
+
+        # The next writer drops the orphaned bytes before appending.
+        self.record(scope_dir, review_payload("def4567"))
+        rows = reviews_file.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(
+            [json.loads(row)["review_number"] for row in rows], [1, 2]
+        )
+
+    def test_read_reviews_uses_offset_index_and_rebuilds_it(self) -> None:
+        scope_dir = self.resolve_scope()
+        for head_sha in ("abc1234", "bcd2345", "cde3456"):
+            self.record(scope_dir, review_payload(head_sha))
+        index_file = scope_dir / "reviews.idx"
+        self.assertEqual(index_file.stat().st_size, 3 * 24)
+
+        middle = self.read_reviews(scope_dir, "--first", "2", "--last", "3")
+        self.assertEqual(
+            [row["head_sha"] for row in middle["reviews"]], ["bcd2345", "cde3456"]
+        )
+
+        # Scopes recorded before the index existed fall back to a linear scan,
+        # and the next record-review rebuilds the index.
+        index_file.unlink()
+        first = self.read_reviews(scope_dir, "--first", "1")
+        self.assertEqual([row["review_number"] for row in first["reviews"]], [1])
+        self.record(scope_dir, review_payload("def4567"))
+        self.assertEqual(index_file.stat().st_size, 4 * 24)
+        latest = self.read_reviews(scope_dir, "--first", "4")
+        self.assertEqual(latest["reviews"][0]["head_sha"], "def4567")
+
+        missing = run_memory(
+            ["read-reviews", "--scope-dir", str(scope_dir), "--first", "5"], self.env
+        )
+        self.assertNotEqual(missing.returncode, 0)
+        self.assertIn("latest review is 4", missing.stderr)
+
+    def test_review_markdown_and_lists_live_in_the_blob_store(self) -> None:
+        scope_dir = self.resolve_scope()
+        repo_root = Path(self._temp_dir.name) / "checkout"
+        review_file = repo_root / "docs" / "code_reviews" / "pr_1842_review.md"
+        review_file.parent.mkdir(parents=True)
+        digests = []
+        passes = (("abc1234", "# Pass 1\n"), ("bcd2345", "# Pass 2\n"))
+        for head_sha, markdown in passes:
+            review_file.write_text(markdown, encoding="utf-8")
+            payload = {
+                **json.loads(review_payload(head_sha)),
+                "touched_paths": ["app/service.py"],
+            }
+            recorded = run_memory(
+                [
+                    "record-review",
+                    "--scope-dir",
+                    str(scope_dir),
+                    "--repo-root",
+                    str(repo_root),
+                ],
+                self.env,
+                json.dumps(payload),
+            )
+            self.assertEqual(recorded.returncode, 0, msg=recorded.stderr)
+            digests.append(json.loads(recorded.stdout)["review_markdown_sha256"])
+
+        rows = self.read_reviews(scope_dir, "--first", "1", "--last", "2")["reviews"]
+        self.assertNotIn("touched_paths", rows[0])
+        self.assertEqual(
+            rows[0]["touched_paths_sha256"], rows[1]["touched_paths_sha256"]
+        )
+        expanded = self.read_reviews(
+            scope_dir, "--first", "1", "--last", "2", "--expand-blobs"
+        )["reviews"]
+        self.assertEqual(expanded[0]["touched_paths"], ["app/service.py"])
+        self.assertEqual(expanded[1]["commits"], [])
+        latest = self.summarize(scope_dir)["latest_review"]
+        self.assertEqual(latest["touched_paths"], ["app/service.py"])
+        self.assertEqual(latest["commits"], [])
+
+        # The repo-local file now holds pass 2, but pass 1 is still readable.
+        first_markdown = run_memory(["read-blob", "--sha256", digests[0]], self.env)
+        self.assertEqual(first_markdown.returncode, 0, msg=first_markdown.stderr)
+        self.assertEqual(first_markdown.stdout, "# Pass 1\n")
+        blob_files = [
+            path
+            for path in (Path(self._temp_dir.name) / "blobs").rglob("*")
+            if path.is_file()
+        ]
+        # Two markdown blobs plus one shared blob each for commits and paths.
+        self.assertEqual(len(blob_files), 4)
+
+        # A blob torn by a crash after an unsynced write is rewritten, not reused.
+        paths_digest = rows[0]["touched_paths_sha256"]
+        paths_blob = (
+            Path(self._temp_dir.name)
+            / "blobs"
+            / "sha256"
+            / paths_digest[:2]
+            / paths_digest[2:]
+        )
+        paths_blob.write_bytes(b"")
+        batched = run_memory(
+            ["record-review", "--scope-dir", str(scope_dir), "--durability", "batched"],
+            self.env,
+            json.dumps(
+                {
+                    **json.loads(review_payload("cde3456")),
+                    "touched_paths": ["app/service.py"],
+                }
+            ),
+        )
+        self.assertEqual(batched.returncode, 0, msg=batched.stderr)
+        third = self.read_reviews(
+            scope_dir, "--first", "3", "--last", "3", "--expand-blobs"
+        )
+        self.assertEqual(third["reviews"][0]["touched_paths"], ["app/service.py"])
+
+        # Run from the checkout, the markdown is captured without --repo-root.
+        review_file.write_text("# Pass 4\n", encoding="utf-8")
+        from_checkout = run_memory(
+            ["record-review", "--scope-dir", str(scope_dir)],
+            self.env,
+            review_payload("def4567"),
+            cwd=repo_root,
+        )
+        self.assertEqual(from_checkout.returncode, 0, msg=from_checkout.stderr)
+        digest = json.loads(from_checkout.stdout)["review_markdown_sha256"]
+        self.assertIsNotNone(digest)
+        fourth_markdown = run_memory(["read-blob", "--sha256", digest], self.env)
+        self.assertEqual(fourth_markdown.stdout, "# Pass 4\n")
+
+    def test_path_history_finds_prior_reviews_across_scopes(self) -> None:
+        first_scope = self.resolve_scope(1842)
+        second_scope = self.resolve_scope(1900)
+        query = {"finding_id": "n-plus-one|app/service.py|get_rows", "severity": "high"}
+        naming = {"finding_id": "naming|app/service.py|render"}
+
+        def payload(head_sha: str, **findings: list[dict[str, object]]) -> str:
+            return json.dumps(
+                {
+                    **json.loads(review_payload(head_sha, **findings)),
+                    "touched_paths": ["app/service.py", "app/views.py"],
+                }
+            )
+
+        self.record(first_scope, payload("abc1234", new=[query]))
+        self.record(first_scope, payload("bcd2345", resolved=[query]))
+        self.record(second_scope, payload("cde3456", new=[naming]))
+
+        def history(*args: str) -> dict[str, object]:
+            result = run_memory(
+                ["path-history", "--path", "./app/service.py", *args], self.env
+            )
+            self.assertEqual(result.returncode, 0, msg=result.stderr)
+            return json.loads(result.stdout)["paths"][0]
+
+        service = history()
+        self.assertEqual(service["path"], "app/service.py")
+        self.assertEqual((service["reviews_count"], service["scopes_count"]), (3, 2))
+        self.assertEqual(service["reviews"][0]["head_sha"], "cde3456")
+        self.assertEqual(
+            [(item["finding_id"], item["status"]) for item in service["findings"]],
+            [(naming["finding_id"], "new"), (query["finding_id"], "resolved")],
+        )
+        self.assertEqual(service["open_findings_count"], 1)
+
+        # A partial row left by a crash mid-append is skipped, not fatal.
+        for shard in (Path(self._temp_dir.name) / "path-index").glob("*.jsonl"):
+            with shard.open("a", encoding="utf-8") as handle:
+                handle.write('{"path": "app/service.py", "scope_id": "x"}\n')
+        self.assertEqual(history()["reviews_count"], 3)
+
+        # Scopes recorded before the index existed are picked up by a rebuild.
+        shutil.rmtree(Path(self._temp_dir.name) / "path-index")
+        self.assertEqual(history()["reviews_count"], 0)
+        rebuilt = history("--rebuild", "--limit", "1")
+        self.assertEqual(rebuilt["reviews_count"], 3)
+        self.assertEqual(len(rebuilt["reviews"]), 1)
+        self.assertEqual(rebuilt["findings"], service["findings"])
+
+    def test_diff_reviews_tracks_finding_lifecycle_paths_and_heads(self) -> None:
+        scope_dir = self.resolve_scope()
+        query = {"finding_id": "n-plus-one|app/service.py|get_rows"}
+        naming = {"finding_id": "naming|app/views.py|render", "severity": "low"}
+        rows = [
+            ("abc1234", ["app/service.py"], {"new": [query]}),
+            ("abc1234", ["app/service.py"], {"carried_forward": [query]}),
+            (
+                "bcd2345",
+                ["app/service.py", "app/views.py"],
+                {"carried_forward": [query], "new": [naming]},
+            ),
+            ("cde3456", ["app/views.py"], {"resolved": [query]}),
+        ]
+        for head_sha, touched_paths, findings in rows:
+            payload = json.loads(review_payload(head_sha, **findings))
+            payload["touched_paths"] = touched_paths
+            self.record(scope_dir, json.dumps(payload))
+
+        diffed = run_memory(
+            [
+                "diff-reviews",
+                "--scope-dir",
+                str(scope_dir),
+                "--from-review",
+                "1",
+                "--to-review",
+                "4",
+            ],
+            self.env,
+        )
+        self.assertEqual(diffed.returncode, 0, msg=diffed.stderr)
+        diff = json.loads(diffed.stdout)
+        findings = {item["finding_id"]: item for item in diff["findings"]}
+        # Review 1 is the baseline: the query finding already existed there.
+        self.assertEqual(
+            findings[query["finding_id"]]["transitions"],
+            [
+                {"review_number": 2, "status": "carried_forward"},
+                {"review_number": 4, "status": "resolved"},
+            ],
+        )
+        self.assertEqual(findings[query["finding_id"]]["status_at_from_review"], "new")
+        self.assertFalse(findings[query["finding_id"]]["introduced_in_range"])
+        self.assertTrue(findings[naming["finding_id"]]["introduced_in_range"])
+        self.assertEqual(findings[naming["finding_id"]]["final_status"], "open")
+        self.assertEqual(diff["findings_count"], {"open": 1, "resolved": 1, "total": 2})
+        self.assertEqual(
+            diff["touched_paths"],
+            {
+                "added": ["app/views.py"],
+                "dropped": ["app/service.py"],
+                "touched_in_range": ["app/service.py", "app/views.py"],
+            },
+        )
+        self.assertEqual(
+            [change["review_number"] for change in diff["head_changes"]], [3, 4]
+        )
+
+    def test_sealed_segments_are_read_transparently(self) -> None:
+        scope_dir = self.resolve_scope()
+        head_shas = ["abc1234", "bcd2345", "cde3456", "def4567", "ef05678"]
+        for head_sha in head_shas:
+            recorded = run_memory(
+                [
+                    "record-review",
+                    "--scope-dir",
+                    str(scope_dir),
+                    "--segment-max-reviews",
+                    "2",
+                ],
+                self.env,
+                review_payload(head_sha),
+            )
+            self.assertEqual(recorded.returncode, 0, msg=recorded.stderr)
+
+        manifest = json.loads(
+            (scope_dir / "segments" / "manifest.json").read_text(encoding="utf-8")
+        )
+        self.assertEqual(
+            [
+                (segment["first_review"], segment["last_review"])
+                for segment in manifest["segments"]
+            ],
+            [(1, 2), (3, 4)],
+        )
+        active_rows = (scope_dir / "reviews.jsonl").read_text(encoding="utf-8")
+        self.assertEqual(
+            [json.loads(row)["review_number"] for row in active_rows.splitlines()],
+            [5],
+        )
+
+        everything = self.read_reviews(scope_dir, "--first", "1", "--last", "5")
+        self.assertEqual(
+            [row["head_sha"] for row in everything["reviews"]], head_shas
+        )
+        summary = self.summarize(scope_dir)
+        self.assertEqual(summary["latest_review"]["head_sha"], "ef05678")
+
+    def test_batched_durability_commits_a_review_array_at_once(self) -> None:
+        scope_dir = self.resolve_scope()
+        payloads = [
+            json.loads(review_payload(head_sha))
+            for head_sha in ("abc1234", "bcd2345", "cde3456")
+        ]
+        recorded = run_memory(
+            [
+                "record-review",
+                "--scope-dir",
+                str(scope_dir),
+                "--durability",
+                "batched",
+                "--segment-max-reviews",
+                "2",
+            ],
+            self.env,
+            json.dumps(payloads),
+        )
+        self.assertEqual(recorded.returncode, 0, msg=recorded.stderr)
+        self.assertEqual(
+            [item["review_number"] for item in json.loads(recorded.stdout)], [1, 2, 3]
+        )
+
+        relaxed = run_memory(
+            ["record-review", "--scope-dir", str(scope_dir), "--durability", "relaxed"],
+            self.env,
+            review_payload("def4567"),
+        )
+        self.assertEqual(relaxed.returncode, 0, msg=relaxed.stderr)
+        self.assertEqual(json.loads(relaxed.stdout)["review_number"], 4)
+
+        everything = self.read_reviews(scope_dir, "--first", "1", "--last", "4")
+        self.assertEqual(
+            [row["head_sha"] for row in everything["reviews"]],
+            ["abc1234", "bcd2345", "cde3456", "def4567"],
+        )
+
+    def test_record_reviews_ingests_ndjson_for_many_scopes(self) -> None:
+        existing_scope = self.resolve_scope(1842)
+        new_scope_target = {
+            "owner": "DiversioTeam",
+            "repo": "monolith",
+            "pull_number": 1900,
+        }
+        lines = [
+            {"scope_dir": str(existing_scope), "review": review_payload("abc1234")},
+            {"scope": new_scope_target, "review": review_payload("bcd2345")},
+            {"scope_dir": str(existing_scope), "review": review_payload("cde3456")},
+        ]
+        ndjson = "".join(
+            json.dumps({**line, "review": json.loads(line["review"])}) + "\n"
+            for line in lines
+        )
+
+        ingested = run_memory(["record-reviews", "--ndjson"], self.env, ndjson)
+        self.assertEqual(ingested.returncode, 0, msg=ingested.stderr)
+        result = json.loads(ingested.stdout)
+        self.assertEqual(result["reviews_count"], 3)
+        self.assertEqual(result["failed_scopes_count"], 0)
+        first, second = result["scopes"]
+        self.assertEqual(first["scope_dir"], str(existing_scope))
+        self.assertEqual(
+            (first["first_review_number"], first["last_review_number"]), (1, 2)
+        )
+        self.assertEqual(
+            second["scope_id"], "github.com/diversioteam/monolith/pull/1900"
+        )
+
+        summary = self.summarize(Path(second["scope_dir"]))
+        self.assertEqual(summary["last_reviewed_head_sha"], "bcd2345")
+
+        invalid = run_memory(
+            ["record-reviews"],
+            self.env,
+            json.dumps({"scope_dir": str(existing_scope), "review": {}}) + "\n",
+        )
+        self.assertNotEqual(invalid.returncode, 0)
+        self.assertIn("line 1", invalid.stderr)
+        self.assertEqual(self.summarize(existing_scope)["next_review_number"], 3)
+
+    def test_report_aggregates_across_scopes_and_reuses_index(self) -> None:
+        first_scope = self.resolve_scope(1842)
+        second_scope = self.resolve_scope(1900)
+        old = {"finding_id": "n-plus-one|app/service.py|get_rows", "severity": "high"}
+        self.record(first_scope, review_payload("abc1234", new=[old]))
+        self.record(
+            first_scope,
+            review_payload(
+                "def4567",
+                carried_forward=[old],
+                new=[{"finding_id": "naming|app/views.py|render"}],
+            ),
+        )
+        self.record(second_scope, review_payload("abc1234", new=[old]))
+
+        first = self.report("--use-index")
+        self.assertEqual(first["scopes_count"], 2)
+        self.assertEqual(first["open_findings_count"], 3)
+        self.assertEqual(first["by_severity"], {"high": 2, "unspecified": 1})
+        self.assertEqual(
+            first["by_repo"], {"diversioteam/monolith": {"open": 3, "scopes": 2}}
+        )
+        self.assertEqual(
+            first["by_age_reviews"], {"1": 2, "2": 1, "3-5": 0, "6+": 0}
+        )
+        self.assertEqual(first["index"], {"read": 2, "reused": 0})
+        self.assertEqual(first["scopes"][0]["scope_dir"], str(first_scope))
+
+        self.record(second_scope, review_payload("def4567", resolved=[old]))
+        second = self.report("--use-index")
+        self.assertEqual(second["index"], {"read": 1, "reused": 1})
+        self.assertEqual(second["open_findings_count"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,427 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import subprocess
+import tempfile
+import time
+import unittest
+
+
+SCRIPTS_DIR = (
+    Path(__file__).resolve().parents[1]
+    / "plugins"
+    / "monolith-review-orchestrator"
+    / "skills"
+    / "monolith-review-orchestrator"
+    / "scripts"
+)
+MONOLITH_MARKERS: tuple[str, ...] = (
+    ".gitmodules",
+    ".submodule-branches",
+    "scripts/create_worktree.py",
+    "scripts/update_submodules.py",
+    "docs/github-first-branch-and-pr-conventions.md",
+)
+
+
+def run_script(
+    script: str, args: list[str], cwd: Path, env: dict[str, str]
+) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        ["uv", "run", "--quiet", "--script", str(SCRIPTS_DIR / script), *args],
+        cwd=cwd,
+        text=True,
+        capture_output=True,
+        check=False,
+        env={**os.environ, **env},
+    )
+
+
+class ReviewRegistryTests(unittest.TestCase):
+    def test_resolve_and_state_updates_are_indexed(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir) / "monolith"
+            for marker in MONOLITH_MARKERS:
+                marker_path = root / marker
+                marker_path.parent.mkdir(parents=True, exist_ok=True)
+                marker_path.write_text("marker\n", encoding="utf-8")
+            env = {
+                "MONOLITH_REVIEW_STATE_HOME": str(Path(temp_dir) / "state"),
+                "MONOLITH_REVIEW_CACHE_HOME": str(Path(temp_dir) / "cache"),
+            }
+
+            resolved = run_script(
+                "resolve_review_batch.py",
+                [
+                    "--monolith-root",
+                    str(root),
+                    "--pr-url",
+                    "https://github.com/DiversioTeam/Django4Lyfe/pull/2779",
+                    "--pr-url",
+                    "https://github.com/DiversioTeam/Optimo-Frontend/pull/389",
+                ],
+                root,
+                env,
+            )
+            self.assertEqual(resolved.returncode, 0, msg=resolved.stderr)
+            batch = json.loads(resolved.stdout)
+
+            initialized = run_script(
+                "review_state.py",
+                [
+                    "init",
+                    "--state-path",
+                    batch["state_path"],
+                    "--batch-key",
+                    batch["batch_key"],
+                    "--worktree-path",
+                    batch["worktree_path"],
+                    "--artifact-path",
+                    batch["artifact_path"],
+                    "--pr",
+                    "Django4Lyfe:2779",
+                    "--pr",
+                    "Optimo-Frontend:389",
+                ],
+                root,
+                env,
+            )
+            self.assertEqual(initialized.returncode, 0, msg=initialized.stderr)
+
+            listed = run_script(
+                "review_registry.py", ["list", "--unposted"], root, env
+            )
+            self.assertEqual(listed.returncode, 0, msg=listed.stderr)
+            records = json.loads(listed.stdout)
+            self.assertEqual([record["batch_key"] for record in records], ["bk2779-of389"])
+            record = records[0]
+            self.assertEqual(record["state_path"], batch["state_path"])
+            self.assertEqual(record["posting_status"], "not_posted")
+            self.assertEqual(record["last_pass_number"], 0)
+            # State only knows repo and number; the owner from resolve survives.
+            self.assertEqual(
+                record["prs"],
+                [
+                    {
+                        "owner": "DiversioTeam",
+                        "pr_number": 2779,
+                        "repo": "Django4Lyfe",
+                    },
+                    {
+                        "owner": "DiversioTeam",
+                        "pr_number": 389,
+                        "repo": "Optimo-Frontend",
+                    },
+                ],
+            )
+
+            idle = run_script(
+                "review_registry.py", ["list", "--idle-days", "1"], root, env
+            )
+            self.assertEqual(idle.returncode, 0, msg=idle.stderr)
+            self.assertEqual(json.loads(idle.stdout), [])
+
+    def test_gc_archives_idle_batches_and_skips_dirty_worktrees(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir) / "monolith"
+            self._init_monolith(root)
+            env = {
+                "MONOLITH_REVIEW_STATE_HOME": str(Path(temp_dir) / "state"),
+                "MONOLITH_REVIEW_CACHE_HOME": str(Path(temp_dir) / "cache"),
+            }
+
+            batches = {}
+            for pr_number in (1, 2):
+                resolved = run_script(
+                    "resolve_review_batch.py",
+                    [
+                        "--monolith-root",
+                        str(root),
+                        "--pr-url",
+                        f"https://github.com/DiversioTeam/Django4Lyfe/pull/{pr_number}",
+                    ],
+                    root,
+                    env,
+                )
+                self.assertEqual(resolved.returncode, 0, msg=resolved.stderr)
+                batch = json.loads(resolved.stdout)
+                self._run_git(
+                    ["worktree", "add", "--detach", batch["worktree_path"], "HEAD"],
+                    root,
+                )
+                initialized = run_script(
+                    "review_state.py",
+                    [
+                        "init",
+                        "--state-path",
+                        batch["state_path"],
+                        "--batch-key",
+                        batch["batch_key"],
+                        "--worktree-path",
+                        batch["worktree_path"],
+                        "--artifact-path",
+                        batch["artifact_path"],
+                        "--pr",
+                        f"Django4Lyfe:{pr_number}",
+                    ],
+                    root,
+                    env,
+                )
+                self.assertEqual(initialized.returncode, 0, msg=initialized.stderr)
+                batches[batch["batch_key"]] = batch
+
+            dirty_worktree = Path(batches["bk2"]["worktree_path"])
+            (dirty_worktree / ".gitmodules").write_text("edited\n", encoding="utf-8")
+            # Registry timestamps have one-second resolution.
+            time.sleep(1.1)
+
+            collected = run_script(
+                "review_registry.py",
+                ["gc", "--idle-days", "0", "--no-check-pr-state"],
+                root,
+                env,
+            )
+            self.assertEqual(collected.returncode, 0, msg=collected.stderr)
+            results = {
+                result["batch_key"]: result for result in json.loads(collected.stdout)
+            }
+            self.assertEqual(results["bk1"]["status"], "removed")
+            self.assertEqual(results["bk1"]["reason"], "idle")
+            self.assertEqual(results["bk2"]["status"], "skipped_dirty")
+
+            self.assertFalse(Path(batches["bk1"]["worktree_path"]).exists())
+            self.assertTrue(dirty_worktree.exists())
+            archived_state = (
+                Path(results["bk1"]["archive_path"])
+                / "reviews"
+                / ".state"
+                / "review-bk1.json"
+            )
+            self.assertTrue(archived_state.is_file())
+
+            listed = run_script("review_registry.py", ["list"], root, env)
+            self.assertEqual(
+                [record["batch_key"] for record in json.loads(listed.stdout)],
+                ["bk2"],
+            )
+            worktrees = subprocess.run(
+                ["git", "worktree", "list", "--porcelain"],
+                cwd=root,
+                text=True,
+                capture_output=True,
+                check=True,
+            ).stdout
+            self.assertNotIn("monolith-review-bk1", worktrees)
+
+    def test_gc_skips_dirty_pooled_batch_behind_symlink(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir) / "monolith"
+            self._init_monolith(root)
+            env = {
+                "MONOLITH_REVIEW_STATE_HOME": str(Path(temp_dir) / "state"),
+                "MONOLITH_REVIEW_CACHE_HOME": str(Path(temp_dir) / "cache"),
+            }
+            resolved = run_script(
+                "resolve_review_batch.py",
+                [
+                    "--monolith-root",
+                    str(root),
+                    "--pr-url",
+                    "https://github.com/DiversioTeam/Django4Lyfe/pull/1",
+                ],
+                root,
+                env,
+            )
+            self.assertEqual(resolved.returncode, 0, msg=resolved.stderr)
+            batch = json.loads(resolved.stdout)
+
+            # A pooled batch path is a symlink to its leased slot.
+            slot_path = Path(temp_dir) / "pool" / "slot-01"
+            self._run_git(
+                ["worktree", "add", "--detach", str(slot_path), "HEAD"], root
+            )
+            Path(batch["worktree_path"]).symlink_to(slot_path, target_is_directory=True)
+            initialized = run_script(
+                "review_state.py",
+                [
+                    "init",
+                    "--state-path",
+                    batch["state_path"],
+                    "--batch-key",
+                    batch["batch_key"],
+                    "--worktree-path",
+                    batch["worktree_path"],
+                    "--artifact-path",
+                    batch["artifact_path"],
+                    "--pr",
+                    "Django4Lyfe:1",
+                ],
+                root,
+                env,
+            )
+            self.assertEqual(initialized.returncode, 0, msg=initialized.stderr)
+            (slot_path / "scratch.txt").write_text("local\n", encoding="utf-8")
+            # Registry timestamps have one-second resolution.
+            time.sleep(1.1)
+
+            collected = run_script(
+                "review_registry.py",
+                ["gc", "--idle-days", "0", "--no-check-pr-state"],
+                root,
+                env,
+            )
+            self.assertEqual(collected.returncode, 0, msg=collected.stderr)
+            [result] = json.loads(collected.stdout)
+            self.assertEqual(result["worktree_path"], batch["worktree_path"])
+            self.assertEqual(result["status"], "skipped_dirty")
+            self.assertTrue(Path(batch["worktree_path"]).is_symlink())
+
+    def test_gc_skips_worktree_with_dirty_submodule(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir) / "monolith"
+            self._init_monolith(root)
+            backend = Path(temp_dir) / "backend-origin"
+            backend.mkdir()
+            self._run_git(["init"], backend)
+            self._run_git(["config", "user.name", "Codex Test"], backend)
+            self._run_git(["config", "user.email", "codex@example.com"], backend)
+            (backend / "app.py").write_text("print('hi')\n", encoding="utf-8")
+            self._run_git(["add", "."], backend)
+            self._run_git(["commit", "-m", "initial"], backend)
+            (root / ".gitmodules").write_text("", encoding="utf-8")
+            self._run_git(
+                [
+                    "-c",
+                    "protocol.file.allow=always",
+                    "submodule",
+                    "add",
+                    str(backend),
+                    "backend",
+                ],
+                root,
+            )
+            self._run_git(["commit", "-am", "add backend"], root)
+            env = {
+                "MONOLITH_REVIEW_STATE_HOME": str(Path(temp_dir) / "state"),
+                "MONOLITH_REVIEW_CACHE_HOME": str(Path(temp_dir) / "cache"),
+            }
+            batch = self._init_batch(root, env, worktree=True)
+            worktree = Path(batch["worktree_path"])
+            self._run_git(
+                ["-c", "protocol.file.allow=always", "submodule", "update", "--init"],
+                worktree,
+            )
+            (worktree / "backend" / "app.py").write_text(
+                "print('edited')\n", encoding="utf-8"
+            )
+            # Registry timestamps have one-second resolution.
+            time.sleep(1.1)
+
+            collected = run_script(
+                "review_registry.py",
+                ["gc", "--idle-days", "0", "--no-check-pr-state"],
+                root,
+                env,
+            )
+            self.assertEqual(collected.returncode, 0, msg=collected.stderr)
+            [result] = json.loads(collected.stdout)
+            self.assertEqual(result["status"], "skipped_dirty")
+            self.assertTrue((worktree / "backend" / "app.py").is_file())
+
+    def test_gc_never_removes_worktrees_it_did_not_create(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir) / "monolith"
+            self._init_monolith(root)
+            env = {
+                "MONOLITH_REVIEW_STATE_HOME": str(Path(temp_dir) / "state"),
+                "MONOLITH_REVIEW_CACHE_HOME": str(Path(temp_dir) / "cache"),
+            }
+            own_checkout = Path(temp_dir) / "my-checkout"
+            self._run_git(
+                ["worktree", "add", "--detach", str(own_checkout), "HEAD"], root
+            )
+            self._init_batch(root, env, worktree_path=own_checkout)
+            time.sleep(1.1)
+
+            collected = run_script(
+                "review_registry.py",
+                ["gc", "--idle-days", "0", "--no-check-pr-state"],
+                root,
+                env,
+            )
+            self.assertEqual(collected.returncode, 0, msg=collected.stderr)
+            [result] = json.loads(collected.stdout)
+            self.assertEqual(result["status"], "skipped_unmanaged")
+            self.assertTrue(own_checkout.is_dir())
+
+    def _init_batch(
+        self,
+        root: Path,
+        env: dict[str, str],
+        *,
+        worktree: bool = False,
+        worktree_path: Path | None = None,
+    ) -> dict[str, str]:
+        resolved = run_script(
+            "resolve_review_batch.py",
+            [
+                "--monolith-root",
+                str(root),
+                "--pr-url",
+                "https://github.com/DiversioTeam/Django4Lyfe/pull/1",
+            ],
+            root,
+            env,
+        )
+        self.assertEqual(resolved.returncode, 0, msg=resolved.stderr)
+        batch = json.loads(resolved.stdout)
+        if worktree:
+            self._run_git(
+                ["worktree", "add", "--detach", batch["worktree_path"], "HEAD"], root
+            )
+        if worktree_path is not None:
+            batch["worktree_path"] = str(worktree_path)
+        initialized = run_script(
+            "review_state.py",
+            [
+                "init",
+                "--state-path",
+                batch["state_path"],
+                "--batch-key",
+                batch["batch_key"],
+                "--worktree-path",
+                batch["worktree_path"],
+                "--artifact-path",
+                batch["artifact_path"],
+                "--pr",
+                "Django4Lyfe:1",
+            ],
+            root,
+            env,
+        )
+        self.assertEqual(initialized.returncode, 0, msg=initialized.stderr)
+        return batch
+
+    def _init_monolith(self, root: Path) -> None:
+        for marker in MONOLITH_MARKERS:
+            marker_path = root / marker
+            marker_path.parent.mkdir(parents=True, exist_ok=True)
+            marker_path.write_text("marker\n", encoding="utf-8")
+        self._run_git(["init"], root)
+        self._run_git(["config", "user.name", "Codex Test"], root)
+        self._run_git(["config", "user.email", "codex@example.com"], root)
+        self._run_git(["add", "."], root)
+        self._run_git(["commit", "-m", "initial"], root)
+
+    def _run_git(self, args: list[str], cwd: Path) -> None:
+        result = subprocess.run(
+            ["git", *args], cwd=cwd, text=True, capture_output=True, check=False
+        )
+        if result.returncode != 0:
+            raise AssertionError(result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()